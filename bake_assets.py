@@ -0,0 +1,51 @@
+# Ficheiro: bake_assets.py
+# Descrição: Gera a cache em disco de imagens redimensionadas ("baked") e compara
+#            o tempo de arranque do AssetManager a frio (sem cache) e a quente.
+#
+# Uso:
+#   python bake_assets.py            # recria a cache e mostra o relatório
+#   python bake_assets.py --keep     # mantém a cache atual (mede só arranques quentes)
+
+import argparse
+import os
+import shutil
+
+# Não precisamos de janela nem de som para processar os assets.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from dino_runner.utils.asset_manager import AssetManager
+from dino_runner.utils.constants import ASSET_CACHE_DIR
+
+def measure_startup(label, cache_dir):
+    """Cria um AssetManager novo e imprime o seu relatório de arranque."""
+    stats = AssetManager(cache_dir=cache_dir).get_startup_stats()
+    print(f"{label:<6} {stats['seconds'] * 1000:9.1f} ms   "
+          f"PNG descodificados: {stats['decoded_images']:3d}   "
+          f"lidos da cache: {stats['baked_hits']:3d}   "
+          f"gravados na cache: {stats['baked_writes']:3d}")
+    return stats['seconds']
+
+def main():
+    parser = argparse.ArgumentParser(description="Gera a cache de assets e mede o tempo de arranque.")
+    parser.add_argument("--cache-dir", default=ASSET_CACHE_DIR, help="pasta da cache em disco")
+    parser.add_argument("--keep", action="store_true", help="não apaga a cache antes de medir")
+    args = parser.parse_args()
+
+    pygame.init()
+    # convert_alpha() precisa de um modo de vídeo definido.
+    pygame.display.set_mode((1, 1))
+
+    if not args.keep:
+        shutil.rmtree(args.cache_dir, ignore_errors=True)
+        cold = measure_startup("frio", args.cache_dir)
+    warm = measure_startup("quente", args.cache_dir)
+
+    if not args.keep and warm > 0:
+        print(f"Arranque quente {cold / warm:.1f}x mais rápido.")
+    print(f"Cache em: {os.path.abspath(args.cache_dir)}")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# Ficheiro: benchmarks/bench_dirty_rects.py
+# Descrição: Compara os píxeis enviados para o ecrã por frame com atualização do
+#            ecrã inteiro e com "dirty rects", no menu e nos dois modos de jogo.
+#
+# Uso (a partir da raiz do projeto):
+#   python -m benchmarks.bench_dirty_rects [--frames 600]
+
+import argparse
+import os
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from dino_runner.components.game import GameController
+from dino_runner.components.modes.endless_runner import EndlessRunner
+from dino_runner.components.modes.roguelite_mode import RogueliteMode
+from dino_runner.utils.dirty_rects import count_pushed_pixels
+
+def measure(get_frame_rects, frames, screen_rect):
+    """Média de píxeis por frame: (ecrã inteiro, dirty rects, frames enviados por inteiro)."""
+    full_total = dirty_total = full_frames = 0
+    for frame in range(frames):
+        rects = get_frame_rects(frame)
+        full_total += screen_rect.width * screen_rect.height
+        dirty_total += count_pushed_pixels(rects, screen_rect)
+        if rects is None:
+            full_frames += 1
+    return full_total / frames, dirty_total / frames, full_frames
+
+def menu_frames(game):
+    """O menu parado: só o primeiro frame é composto."""
+    def frame_rects(frame):
+        game.frame_dirty_rects = None
+        game.show_menu([])
+        return game.frame_dirty_rects
+    return frame_rects
+
+def endless_frames(game):
+    """Modo Normal com um salto a cada 20 frames (reinicia a partida se perder)."""
+    state = {"mode": EndlessRunner(game.screen, 0, game.assets, game.sounds, game.settings)}
+    def frame_rects(frame):
+        events = [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)] if frame % 20 == 0 else []
+        if not state["mode"].run(events):
+            state["mode"] = EndlessRunner(game.screen, 0, game.assets, game.sounds, game.settings)
+        return state["mode"].get_dirty_rects()
+    return frame_rects
+
+def roguelite_frames(game, player_class):
+    """Modo Roguelite a atacar sem parar; começa uma nova onda sempre que a anterior acaba."""
+    mode = RogueliteMode(game.screen, 0, game.assets, game.sounds, game.settings)
+    mode.select_class(player_class)
+    def frame_rects(frame):
+        if mode.game_state == "RUNNING" and not mode.wave_in_progress:
+            mode.start_next_wave()
+        mode.player.attack()
+        mode.run([])
+        if mode.game_state == "LEVEL_UP":
+            mode.apply_powerup(0)
+        if mode.game_state == "GAME_OVER":
+            mode.player.health = mode.player.max_health
+            mode.game_state = "RUNNING"
+        return mode.get_dirty_rects()
+    return frame_rects
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara os píxeis enviados por frame com e sem dirty rects.")
+    parser.add_argument("--frames", type=int, default=600)
+    args = parser.parse_args()
+
+    random.seed(42)
+    game = GameController()
+    game.settings["dirty_rects"] = True
+    screen_rect = game.screen.get_rect()
+
+    scenarios = [
+        ("Menu", menu_frames(game)),
+        ("Normal", endless_frames(game)),
+        ("Roguelite (pistola)", roguelite_frames(game, "pistol")),
+        ("Roguelite (espada)", roguelite_frames(game, "sword")),
+    ]
+    print(f"{'':<22}{'ecrã inteiro':>14}{'dirty rects':>14}{'redução':>10}{'frames inteiros':>17}")
+    for name, frame_rects in scenarios:
+        full, dirty, full_frames = measure(frame_rects, args.frames, screen_rect)
+        print(f"{name:<22}{full:>14.0f}{dirty:>14.0f}{full / max(dirty, 1):>9.1f}x{full_frames:>17d}")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
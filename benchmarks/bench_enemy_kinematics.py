@@ -0,0 +1,95 @@
+# Ficheiro: benchmarks/bench_enemy_kinematics.py
+# Descrição: Compara o movimento dos inimigos um a um (enemy.update) com o EnemyKinematics
+#            (NumPy) para 50, 500 e 5000 inimigos, e confirma que as posições, as hitboxes
+#            e os projéteis disparados são iguais nos dois casos.
+#
+# Uso (a partir da raiz do projeto, com o NumPy instalado):
+#   python -m benchmarks.bench_enemy_kinematics [--frames 60] [--counts 50 500 5000]
+
+import argparse
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from dino_runner.utils.asset_manager import AssetManager
+from dino_runner.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from dino_runner.utils.game_clock import GameClock
+from dino_runner.components.enemies.kinematics import EnemyKinematics
+from dino_runner.components.enemies.dino_run.cacto1 import Cacto1
+from dino_runner.components.enemies.dino_run.cacto3 import Cacto3
+from dino_runner.components.enemies.dino_run.bird1 import Bird1
+from dino_runner.components.enemies.bero_run.miguel import Miguel
+from dino_runner.components.enemies.bero_run.pam import Pam
+from dino_runner.components.enemies.bero_run.bero import Bero
+
+ENEMY_TYPES = [Cacto1, Cacto3, Bird1, Miguel, Pam]
+
+class FakePlayer:
+    """Um jogador que anda em círculos pelo centro do ecrã."""
+    def __init__(self):
+        self.rect = pygame.Rect(0, 0, 80, 90)
+
+    def move(self, frame):
+        self.rect.center = (SCREEN_WIDTH // 2 + (frame * 7) % 300 - 150, SCREEN_HEIGHT // 2 + (frame * 5) % 200 - 100)
+
+def spawn(count, assets, seed, clock):
+    """Cria 'count' inimigos misturados (e um chefe) nas bordas do ecrã, sempre com a mesma semente."""
+    random.seed(seed)
+    rng = random.Random(seed)
+    enemies = [Bero(SCREEN_WIDTH / 2, -100, assets, is_boss=True, clock=clock)]
+    for _ in range(count - 1):
+        enemy_class = rng.choice(ENEMY_TYPES)
+        x, y = rng.choice([(rng.randint(0, SCREEN_WIDTH), -50), (rng.randint(0, SCREEN_WIDTH), SCREEN_HEIGHT + 50),
+                           (-50, rng.randint(0, SCREEN_HEIGHT)), (SCREEN_WIDTH + 50, rng.randint(0, SCREEN_HEIGHT))])
+        enemy = enemy_class(x, y, assets, clock=clock)
+        if rng.random() < 0.3:
+            enemy.apply_slow(0.75, 2000)
+        enemies.append(enemy)
+    return enemies
+
+def run(count, frames, assets, store):
+    """Corre 'frames' frames; retorna (ms/frame, estado final para comparação)."""
+    # Cada versão tem o seu relógio de jogo, avançado da mesma forma, para verem o mesmo tempo.
+    clock = GameClock()
+    enemies = spawn(count, assets, count, clock)
+    player = FakePlayer()
+    enemy_projectiles = []
+    elapsed = 0.0
+    for frame in range(frames):
+        clock.tick()
+        player.move(frame)
+        start = time.perf_counter()
+        if store:
+            store.update(enemies, player, enemy_projectiles)
+        else:
+            for enemy in enemies:
+                enemy.update(player, enemy_projectiles)
+        elapsed += time.perf_counter() - start
+    state = ([(tuple(e.rect), tuple(e.hitbox), e.is_entering, e.is_casting) for e in enemies],
+             [(type(p).__name__, tuple(p.rect), tuple(p.direction)) for p in enemy_projectiles])
+    return elapsed * 1000 / frames, state
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara o movimento dos inimigos por objeto e vetorizado (NumPy).")
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument("--counts", type=int, nargs="+", default=[50, 500, 5000])
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    assets = AssetManager()
+
+    print(f"{'inimigos':>9}{'por objeto ms':>15}{'NumPy ms':>11}{'aceleração':>12}{'iguais':>8}")
+    for count in args.counts:
+        scalar_ms, scalar_state = run(count, args.frames, assets, None)
+        store_ms, store_state = run(count, args.frames, assets, EnemyKinematics())
+        same = "sim" if scalar_state == store_state else "NÃO"
+        print(f"{count:>9}{scalar_ms:>15.2f}{store_ms:>11.2f}{scalar_ms / store_ms:>11.1f}x{same:>8}")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# Ficheiro: benchmarks/bench_projectiles.py
+# Descrição: Compara o ciclo antigo dos projéteis (proj.update(), screen.get_rect() e
+#            list.remove por projétil) com o ProjectileBuffer (movimento, corte e
+#            compactação em bloco), para vários números de balas, e confirma que as
+#            posições e hitboxes finais são iguais nos dois casos.
+#
+# Uso (a partir da raiz do projeto):
+#   python -m benchmarks.bench_projectiles [--frames 60] [--counts 200 2000 8000]
+
+import argparse
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from dino_runner.utils.asset_manager import AssetManager
+from dino_runner.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from dino_runner.components.weapons.bullet import Bullet
+from dino_runner.components.weapons.shard import Shard
+from dino_runner.components.weapons.projectile_buffer import ProjectileBuffer
+
+def spawn(count, assets, seed):
+    """Cria 'count' balas e estilhaços em posições e direções aleatórias (sempre as mesmas)."""
+    rng = random.Random(seed)
+    projectiles = []
+    for i in range(count):
+        direction = pygame.math.Vector2(1, 0).rotate(rng.uniform(0, 360))
+        x, y = rng.randint(0, SCREEN_WIDTH), rng.randint(0, SCREEN_HEIGHT)
+        if i % 4 == 0:
+            projectiles.append(Shard(x, y, direction, assets))
+        else:
+            projectiles.append(Bullet(x, y, direction, assets, is_frozen=i % 3 == 0))
+    return projectiles
+
+def run_list(projectiles, frames, screen):
+    """O método antigo: um update(), um get_rect() e, se saiu do ecrã, um list.remove por projétil."""
+    start = time.perf_counter()
+    for _ in range(frames):
+        for proj in projectiles[:]:
+            proj.update()
+            if not screen.get_rect().colliderect(proj.rect):
+                projectiles.remove(proj)
+    elapsed = time.perf_counter() - start
+    return elapsed, [(tuple(p.rect), tuple(p.hitbox)) for p in projectiles]
+
+def run_buffer(projectiles, frames, screen):
+    """O método novo: os projéteis vivem nos arrays do buffer e andam todos de uma vez."""
+    buffer = ProjectileBuffer()
+    buffer.extend(projectiles)
+    start = time.perf_counter()
+    for _ in range(frames):
+        buffer.update(screen.get_rect())
+    elapsed = time.perf_counter() - start
+    return elapsed, [(tuple(p.rect), tuple(p.hitbox)) for p in buffer]
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara o ciclo de projéteis em lista com o ProjectileBuffer.")
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument("--counts", type=int, nargs="+", default=[200, 2000, 8000])
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    assets = AssetManager()
+
+    print(f"{'projéteis':>10}{'lista ms/frame':>16}{'buffer ms/frame':>17}{'aceleração':>12}{'iguais':>8}")
+    for count in args.counts:
+        list_time, list_state = run_list(spawn(count, assets, count), args.frames, screen)
+        buffer_time, buffer_state = run_buffer(spawn(count, assets, count), args.frames, screen)
+        list_ms = list_time * 1000 / args.frames
+        buffer_ms = buffer_time * 1000 / args.frames
+        same = "sim" if list_state == buffer_state else "NÃO"
+        print(f"{count:>10}{list_ms:>16.3f}{buffer_ms:>17.3f}{list_ms / buffer_ms:>11.1f}x{same:>8}")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# Ficheiro: benchmarks/bench_rotation_cache.py
+# Descrição: Compara o número de transformações (rotate/scale) e o tempo por frame
+#            dos tiros e golpes de espada com e sem o cache de rotações.
+#
+# Uso (a partir da raiz do projeto):
+#   python -m benchmarks.bench_rotation_cache [--frames 300] [--shots 5]
+
+import argparse
+import math
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from dino_runner.utils.asset_manager import AssetManager
+from dino_runner.utils.game_clock import GameClock
+from dino_runner.utils.input_source import LIVE_INPUT
+from dino_runner.components.weapons.bullet import Bullet
+from dino_runner.components.weapons.sword import Sword
+
+class UncachedRotations:
+    """Reproduz o comportamento antigo: reconstrói a imagem base e roda-a a cada pedido."""
+    def get(self, key, angle, build_base, *build_args):
+        return pygame.transform.rotate(build_base(*build_args), angle)
+
+    def invalidate(self, name):
+        pass
+
+class FakePlayer:
+    """O mínimo de que a Sword precisa para funcionar fora do modo Roguelite."""
+    def __init__(self, assets):
+        self.assets = assets
+        self.rect = pygame.Rect(500, 250, 80, 90)
+        self.clock = GameClock()
+        self.input_source = LIVE_INPUT
+
+def count_transforms():
+    """Envolve as funções de pygame.transform usadas pelas armas para as contar."""
+    counter = {"calls": 0}
+    for name in ("rotate", "scale", "scale_by"):
+        original = getattr(pygame.transform, name)
+        def wrapper(*args, _original=original, **kwargs):
+            counter["calls"] += 1
+            return _original(*args, **kwargs)
+        setattr(pygame.transform, name, wrapper)
+    return counter
+
+def run(assets, frames, shots_per_frame, counter):
+    """Simula 'frames' frames com 'shots_per_frame' balas e um golpe de espada por frame."""
+    rng = random.Random(42)
+    sword = Sword(FakePlayer(assets))
+    counter["calls"] = 0
+    start = time.perf_counter()
+    for frame in range(frames):
+        for _ in range(shots_per_frame):
+            angle = rng.uniform(0, 2 * math.pi)
+            direction = pygame.math.Vector2(math.cos(angle), math.sin(angle))
+            Bullet(500, 300, direction, assets, is_frozen=rng.random() < 0.2)
+        if frame % 60 == 59:
+            sword.set_size(sword.size + 0.2) # Simula o power-up "Alcance Aumentado"
+        sword.perform_swing()
+    elapsed = time.perf_counter() - start
+    return counter["calls"] / frames, elapsed * 1000 / frames
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara as transformações por frame com e sem o cache de rotações.")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--shots", type=int, default=5, help="balas criadas por frame (shot_quantity)")
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    assets = AssetManager()
+    counter = count_transforms()
+
+    cached_rotations = assets.rotations
+    assets.rotations = UncachedRotations()
+    before = run(assets, args.frames, args.shots, counter)
+    assets.rotations = cached_rotations
+    after = run(assets, args.frames, args.shots, counter)
+
+    print(f"{'':<10}{'transforms/frame':>18}{'ms/frame':>12}")
+    print(f"{'sem cache':<10}{before[0]:>18.2f}{before[1]:>12.3f}")
+    print(f"{'com cache':<10}{after[0]:>18.2f}{after[1]:>12.3f}")
+    print(f"Cache de rotações: {assets.rotations.get_stats()}")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+# Ficheiro: benchmarks/bench_scenarios.py
+# Descrição: Cenários de stress reproduzíveis dos dois modos de jogo, corridos sem ecrã
+#            (drivers "dummy"): mede por frame o tempo do update (mode.step), o tempo do
+#            desenho (mode.render) e a memória alocada, e grava média, p95 e p99 num JSON
+#            para comparar execuções entre commits.
+#
+# Uso (a partir da raiz do projeto):
+#   python -m benchmarks.bench_scenarios [--frames 300] [--out bench.json]
+#   python -m benchmarks.bench_scenarios --only bullets_2000 boss_transformation
+#   python -m benchmarks.bench_scenarios --compare antes.json   # mostra a razão novo / antigo
+#
+# As alocações são medidas numa segunda passagem, com o tracemalloc ligado (que abranda
+# tudo), a partir do mesmo estado inicial: "alloc_kb" é o pico de memória alocada acima
+# do início do frame e "alloc_blocks" a variação de blocos de memória vivos no frame.
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from dino_runner.components.enemies.bero_run.bero import Bero
+from dino_runner.components.enemies.bero_run.dann import Dann
+from dino_runner.components.enemies.bero_run.miguel import Miguel
+from dino_runner.components.enemies.dino_run.cacto1 import Cacto1
+from dino_runner.components.enemies.dino_run.cacto2 import Cacto2
+from dino_runner.components.enemies.dino_run.cacto3 import Cacto3
+from dino_runner.components.modes.endless_runner import EndlessRunner
+from dino_runner.components.modes.roguelite_mode import RogueliteMode
+from dino_runner.components.weapons.bullet import Bullet
+from dino_runner.simulation.bots import EndlessBot
+from dino_runner.simulation.headless import HeadlessSession
+from dino_runner.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from dino_runner.utils.game_clock import GameClock
+from dino_runner.utils.input_source import ScriptedInput
+
+CHASERS = [Cacto1, Cacto2, Cacto3, Miguel, Dann]
+
+# --- Cenários ---
+# Cada cenário recebe a sessão e um Random e devolve (modo, preparar), onde preparar(modo)
+# corre antes de cada frame, fora da medição, e devolve os eventos do frame (e pode trocar
+# o modo, devolvendo (eventos, novo_modo)).
+
+def roguelite(session, class_id):
+    """Um Roguelite já com a classe escolhida, a meio de uma wave e com um jogador que não morre."""
+    mode = RogueliteMode(session.screen, 0, session.assets, session.sounds, session.settings,
+                         clock=GameClock(), input_source=ScriptedInput())
+    mode.select_class(class_id)
+    mode.player.max_health = mode.player.health = 10**9
+    mode.wave_in_progress = True
+    return mode
+
+def edge_position(rng):
+    """Uma posição aleatória à volta do ecrã, como as de spawn_enemies_for_wave."""
+    edge = rng.choice(["left", "right", "top", "bottom"])
+    if edge == "left": return rng.randint(-150, -50), rng.randint(0, SCREEN_HEIGHT)
+    if edge == "right": return rng.randint(SCREEN_WIDTH + 50, SCREEN_WIDTH + 150), rng.randint(0, SCREEN_HEIGHT)
+    if edge == "top": return rng.randint(0, SCREEN_WIDTH), rng.randint(-150, -50)
+    return rng.randint(0, SCREEN_WIDTH), rng.randint(SCREEN_HEIGHT + 50, SCREEN_HEIGHT + 150)
+
+def chasing_500(session, rng):
+    """500 inimigos que perseguem o jogador parado no centro (sem ataques)."""
+    mode = roguelite(session, "pistol")
+    for i in range(500):
+        x, y = edge_position(rng)
+        mode.enemies.append(CHASERS[i % len(CHASERS)](x, y, session.assets, clock=mode.clock))
+    return mode, lambda mode: []
+
+def bullets_2000(session, rng):
+    """2000 balas vivas com perfuração e ricochete contra 40 inimigos que não morrem."""
+    mode = roguelite(session, "pistol")
+    Bullet.BASE_PIERCE, Bullet.BASE_BOUNCES = 3, 2
+    for i in range(40):
+        enemy = CHASERS[i % len(CHASERS)](rng.randint(100, SCREEN_WIDTH - 100), rng.randint(100, SCREEN_HEIGHT - 100),
+                                          session.assets, clock=mode.clock)
+        enemy.health = enemy.max_health = 10**9
+        mode.enemies.append(enemy)
+
+    def refill(mode):
+        # Repõe as balas que saíram do ecrã ou pararam em inimigos.
+        while len(mode.projectiles) < 2000:
+            direction = pygame.math.Vector2(1, 0).rotate(rng.uniform(0, 360))
+            x, y = rng.randint(0, SCREEN_WIDTH), rng.randint(0, SCREEN_HEIGHT)
+            mode.projectiles.append(Bullet.acquire(x, y, direction, session.assets, False))
+        return []
+    return mode, refill
+
+def ground_slam_barrage(session, rng):
+    """Oito chefes a lançar Ground Slams seguidos (combo de 3 a cada segundo)."""
+    mode = roguelite(session, "sword")
+    for i in range(8):
+        boss = (Bero if i % 2 else Cacto3)(SCREEN_WIDTH * (i + 1) / 9, 150, session.assets, is_boss=True, clock=mode.clock)
+        boss.is_entering = False
+        boss.health = boss.max_health = 10**9
+        boss.skill_cooldown, boss.time_between_casts = 1000, 100
+        mode.enemies.append(boss)
+    return mode, lambda mode: []
+
+def boss_transformation(session, rng):
+    """
+    A wave 10: o chefe entra, é levado a 30% da vida e transforma-se (3 s) em modo rage,
+    seguido do primeiro combo de Ground Slams (com os valores por omissão, tudo dentro
+    dos frames medidos).
+    """
+    mode = roguelite(session, "pistol")
+    mode.wave_in_progress = False
+    mode.current_wave = 9
+    mode.start_next_wave()
+    boss = mode.enemies[0]
+    # A entrada normal demora ~110 frames: o chefe começa a 45 frames do seu lugar.
+    target_x, target_y = boss.entry_target_pos
+    boss.rect.center = (target_x, target_y - boss.speed * 45)
+
+    def hit_boss(mode):
+        # Assim que acaba de entrar, o chefe leva o golpe que começa a transformação.
+        if not boss.is_entering and not boss.is_transforming and not boss.is_in_rage:
+            boss.take_damage(boss.health)
+        return []
+    return mode, hit_boss
+
+def endless_speed_60(session, rng):
+    """Endless Runner à velocidade 60, jogado pelo EndlessBot; recomeça quando o dinossauro morre."""
+    bot = EndlessBot()
+
+    def new_mode():
+        mode = EndlessRunner(session.screen, 0, session.assets, session.sounds, session.settings,
+                             clock=GameClock(), input_source=ScriptedInput())
+        mode.game_speed = 60
+        return mode
+
+    def play(mode):
+        if mode.player.is_dead:
+            bot.ducking = False
+            mode = new_mode()
+            return bot.act(mode, mode.input_source), mode
+        return bot.act(mode, mode.input_source)
+    return new_mode(), play
+
+SCENARIOS = {
+    "chasing_500": chasing_500,
+    "bullets_2000": bullets_2000,
+    "ground_slam_barrage": ground_slam_barrage,
+    "boss_transformation": boss_transformation,
+    "endless_speed_60": endless_speed_60,
+}
+
+# --- Medição ---
+
+def summarize(values):
+    """Média, p95 e p99 (mais o máximo) de uma lista de amostras."""
+    if len(values) < 2:
+        value = values[0] if values else 0.0
+        return {"mean": value, "p95": value, "p99": value, "max": value}
+    cuts = statistics.quantiles(values, n=100, method="inclusive")
+    return {"mean": statistics.fmean(values), "p95": cuts[94], "p99": cuts[98], "max": max(values)}
+
+def entity_count(mode):
+    return sum(mode.entity_counts().values())
+
+def play(session, scenario, seed, frames, on_frame):
+    """Cria o cenário com a semente dada e chama on_frame(modo, eventos) em cada frame."""
+    random.seed(seed)
+    # Os prints do jogo (Ground Slam, level up) não entram na medição.
+    with contextlib.redirect_stdout(io.StringIO()):
+        mode, prepare = scenario(session, random.Random(seed))
+        for _ in range(frames):
+            result = prepare(mode)
+            if isinstance(result, tuple):
+                events, mode = result
+            else:
+                events = result
+            on_frame(mode, events)
+    Bullet.reset_stats()
+
+def run_scenario(session, scenario, frames, warmup, alloc_frames, seed):
+    """Passagem de tempos (com 'warmup' frames descartados) e passagem de alocações."""
+    update_ms, draw_ms, entities = [], [], []
+    perf = time.perf_counter
+
+    def timed(mode, events):
+        t0 = perf()
+        mode.step(events)
+        t1 = perf()
+        mode.render(1.0)
+        t2 = perf()
+        update_ms.append((t1 - t0) * 1000)
+        draw_ms.append((t2 - t1) * 1000)
+        entities.append(entity_count(mode))
+    play(session, scenario, seed, warmup + frames, timed)
+    del update_ms[:warmup], draw_ms[:warmup], entities[:warmup]
+
+    alloc_kb, alloc_blocks = [], []
+    def traced(mode, events):
+        tracemalloc.reset_peak()
+        start_bytes = tracemalloc.get_traced_memory()[0]
+        start_blocks = sys.getallocatedblocks()
+        mode.step(events)
+        mode.render(1.0)
+        alloc_blocks.append(sys.getallocatedblocks() - start_blocks)
+        alloc_kb.append((tracemalloc.get_traced_memory()[1] - start_bytes) / 1024)
+    tracemalloc.start()
+    try:
+        play(session, scenario, seed, warmup + alloc_frames, traced)
+    finally:
+        tracemalloc.stop()
+    del alloc_kb[:warmup], alloc_blocks[:warmup]
+
+    return {
+        "frames": frames,
+        "entities": summarize(entities),
+        "update_ms": summarize(update_ms),
+        "draw_ms": summarize(draw_ms),
+        "alloc_kb": summarize(alloc_kb),
+        "alloc_blocks": summarize(alloc_blocks),
+    }
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def print_comparison(results, baseline):
+    """Razão novo / antigo das médias e do p99 dos cenários presentes nos dois ficheiros."""
+    print(f"\nComparação com {baseline.get('commit') or 'a referência'} (novo / antigo; < 1 é melhor):")
+    if baseline.get("frames") != results["frames"] or baseline.get("seed") != results["seed"]:
+        print("  Aviso: as duas execuções usaram frames ou sementes diferentes.")
+    for name, result in results["scenarios"].items():
+        old = baseline["scenarios"].get(name)
+        if not old:
+            continue
+        parts = []
+        for metric in ("update_ms", "draw_ms", "alloc_kb"):
+            for stat in ("mean", "p99"):
+                before = old[metric][stat]
+                ratio = result[metric][stat] / before if before else float("nan")
+                parts.append(f"{metric} {stat} {ratio:5.2f}x")
+        print(f"  {name:<22} " + "  ".join(parts))
+
+def main():
+    parser = argparse.ArgumentParser(description="Cenários de stress do jogo, com resultados em JSON.")
+    parser.add_argument("--frames", type=int, default=300, help="frames medidos por cenário")
+    parser.add_argument("--warmup", type=int, default=30, help="frames iniciais descartados")
+    parser.add_argument("--alloc-frames", type=int, default=120, help="frames medidos com o tracemalloc")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--only", nargs="+", choices=sorted(SCENARIOS), help="corre só estes cenários")
+    parser.add_argument("--out", default="bench_scenarios.json")
+    parser.add_argument("--compare", help="JSON de uma execução anterior para comparar")
+    args = parser.parse_args()
+
+    session = HeadlessSession()
+    results = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "frames": args.frames,
+        "seed": args.seed,
+        "scenarios": {},
+    }
+    print(f"{'cenário':<22}{'entidades':>10}{'update ms':>22}{'draw ms':>22}{'alloc KB':>12}{'blocos':>9}")
+    print(f"{'':<22}{'média':>10}{'média / p95 / p99':>22}{'média / p95 / p99':>22}{'média':>12}{'média':>9}")
+    for name in args.only or SCENARIOS:
+        result = run_scenario(session, SCENARIOS[name], args.frames, args.warmup, args.alloc_frames, args.seed)
+        results["scenarios"][name] = result
+        u, d = result["update_ms"], result["draw_ms"]
+        print(f"{name:<22}{result['entities']['mean']:>10.0f}"
+              f"{u['mean']:>10.2f} /{u['p95']:>5.2f} /{u['p99']:>5.2f}"
+              f"{d['mean']:>10.2f} /{d['p95']:>5.2f} /{d['p99']:>5.2f}"
+              f"{result['alloc_kb']['mean']:>12.1f}{result['alloc_blocks']['mean']:>9.1f}")
+
+    with open(args.out, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResultados em {os.path.abspath(args.out)}")
+    if args.compare:
+        with open(args.compare) as f:
+            print_comparison(results, json.load(f))
+    session.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# Ficheiro: benchmarks/bench_spatial_hash.py
+# Descrição: Teste de carga das colisões do modo Roguelite: compara o varrimento de
+#            todos os pares (balas x inimigos) com a grelha espacial, para vários
+#            números de entidades, e confirma que ambos encontram os mesmos pares.
+#            A arena cresce com o número de entidades (densidade constante), para
+#            medir o custo da fase larga e não o número de colisões reais.
+#
+# Uso (a partir da raiz do projeto):
+#   python -m benchmarks.bench_spatial_hash [--frames 30] [--counts 50 100 200 400 800 1600]
+
+import argparse
+import math
+import random
+import time
+
+import pygame
+from dino_runner.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT, COLLISION_CELL_SIZE
+from dino_runner.utils.spatial_hash import SpatialHashGrid
+
+# Número de inimigos que ocupam um ecrã (1100x600) na densidade simulada.
+ENEMIES_PER_SCREEN = 200
+
+class Body:
+    """Uma entidade mínima com hitbox e velocidade (inimigo ou bala)."""
+    def __init__(self, rng, size, arena):
+        self.arena = arena
+        self.hitbox = pygame.Rect(rng.randrange(arena[0]), rng.randrange(arena[1]), size, size)
+        self.velocity = (rng.randint(-4, 4), rng.randint(-4, 4))
+
+    def move(self):
+        self.hitbox.move_ip(self.velocity)
+        # Dá a volta à arena para manter a densidade constante.
+        self.hitbox.x %= self.arena[0]
+        self.hitbox.y %= self.arena[1]
+
+def brute_force(enemies, projectiles, sword, player):
+    """O método antigo: cada bala, a espada e o jogador testam todos os inimigos."""
+    pairs = []
+    for enemy in enemies:
+        if sword.colliderect(enemy.hitbox): pairs.append(("sword", enemy))
+    for enemy in enemies:
+        if player.colliderect(enemy.hitbox): pairs.append(("player", enemy))
+    for proj in projectiles:
+        for enemy in enemies[:]:
+            if enemy.hitbox.colliderect(proj.hitbox): pairs.append((proj, enemy))
+    return pairs
+
+def with_grid(grid, enemies, projectiles, sword, player):
+    """O método novo: reconstrói a grelha e só consulta as células vizinhas."""
+    grid.rebuild(enemies)
+    pairs = [("sword", enemy) for enemy in grid.query_colliding(sword)]
+    pairs += [("player", enemy) for enemy in grid.query_colliding(player)]
+    for proj in projectiles:
+        pairs += [(proj, enemy) for enemy in grid.query_colliding(proj.hitbox)]
+    return pairs
+
+def run(count, frames, method):
+    """Simula 'frames' frames com 'count' inimigos e 'count' balas; retorna (ms/frame, pares)."""
+    rng = random.Random(count)
+    scale = math.sqrt(max(count / ENEMIES_PER_SCREEN, 1))
+    arena = (int(SCREEN_WIDTH * scale), int(SCREEN_HEIGHT * scale))
+    enemies = [Body(rng, 90, arena) for _ in range(count)]
+    projectiles = [Body(rng, 10, arena) for _ in range(count)]
+    index = {id(body): i for i, body in enumerate(enemies + projectiles)}
+    sword = pygame.Rect(SCREEN_WIDTH // 2 - 60, SCREEN_HEIGHT // 2 - 60, 120, 120)
+    player = pygame.Rect(SCREEN_WIDTH // 2 - 40, SCREEN_HEIGHT // 2 - 45, 80, 90)
+    grid = SpatialHashGrid(COLLISION_CELL_SIZE)
+
+    elapsed = 0.0
+    signature = []
+    for _ in range(frames):
+        for body in enemies: body.move()
+        for body in projectiles: body.move()
+        start = time.perf_counter()
+        if method == "pares":
+            pairs = brute_force(enemies, projectiles, sword, player)
+        else:
+            pairs = with_grid(grid, enemies, projectiles, sword, player)
+        elapsed += time.perf_counter() - start
+        signature.append([(a if isinstance(a, str) else index[id(a)], index[id(b)]) for a, b in pairs])
+    return elapsed * 1000 / frames, signature
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara o custo das colisões com e sem grelha espacial.")
+    parser.add_argument("--frames", type=int, default=30)
+    parser.add_argument("--counts", type=int, nargs="+", default=[50, 100, 200, 400, 800, 1600],
+                        help="números de inimigos (e de balas) a testar")
+    args = parser.parse_args()
+
+    print(f"{'entidades':>10}{'pares ms/frame':>16}{'grelha ms/frame':>17}{'grelha µs/entidade':>20}{'iguais':>8}")
+    for count in args.counts:
+        brute_ms, brute_pairs = run(count, args.frames, "pares")
+        grid_ms, grid_pairs = run(count, args.frames, "grelha")
+        per_entity = grid_ms * 1000 / (2 * count)
+        print(f"{count:>10}{brute_ms:>16.2f}{grid_ms:>17.2f}{per_entity:>20.2f}{'sim' if brute_pairs == grid_pairs else 'NÃO':>8}")
+
+if __name__ == "__main__":
+    main()
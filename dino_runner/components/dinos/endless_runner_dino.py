@@ -4,6 +4,7 @@
 #            Esta classe gereia o estado, o movimento (pulo, agachar) e as animações do dinossauro.
 
 import pygame
+from dino_runner.utils.input_source import LIVE_INPUT
 
 class EndlessRunnerDino:
     """
@@ -19,14 +20,16 @@ class EndlessRunnerDino:
     GRAVITY = 3            # Força da gravidade que puxa o dinossauro para baixo.
     FAST_FALL_GRAVITY = 3  # Gravidade adicional aplicada ao agachar no ar para uma queda mais rápida.
 
-    def __init__(self, assets, first_run=False):
+    def __init__(self, assets, first_run=False, input_source=None):
         """
         Inicializa o dinossauro.
         
         Args:
             assets (AssetManager): O gestor de assets para carregar as imagens.
             first_run (bool): True se for a primeira vez que o jogo corre, para mostrar o dino parado.
+            input_source: De onde vêm as teclas (por omissão, o teclado real).
         """
+        self.input_source = input_source if input_source is not None else LIVE_INPUT
         # Carrega todas as imagens necessárias do AssetManager.
         self.assets = assets
         self.running_img = self.assets.get_image("DINO_RUNNING")
@@ -84,7 +87,7 @@ class EndlessRunnerDino:
             self.is_jumping = False
             self.jump_vel = self.JUMP_VELOCITY # Reseta a velocidade do pulo.
             # Se a tecla de agachar estiver pressionada ao aterrar, entra no estado de agachado.
-            if pygame.key.get_pressed()[pygame.K_DOWN]:
+            if self.input_source.get_keys()[pygame.K_DOWN]:
                 self.set_duck_state()
             else:
                 self.set_run_state()
@@ -162,6 +165,6 @@ class EndlessRunnerDino:
         self.image = self.dead_img
         self.is_dead = True
 
-    def draw(self, screen):
+    def draw(self, screen, offset=[0, 0]):
         """Desenha o dinossauro no ecrã."""
-        screen.blit(self.image, self.dino_rect)
+        screen.blit(self.image, (self.dino_rect.x + offset[0], self.dino_rect.y + offset[1]))
@@ -8,22 +8,30 @@ import pygame
 from dino_runner.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT
 from dino_runner.components.weapons.pistol import Pistol
 from dino_runner.components.weapons.sword import Sword
+from dino_runner.utils.game_clock import WALL_CLOCK
+from dino_runner.utils.input_source import LIVE_INPUT
 
 class RogueliteDino:
     """
     Representa o personagem jogável no modo Roguelite, controlando todos os seus
     atributos de combate, progressão e interações.
     """
-    def __init__(self, assets, sounds):
+    HURT_TINT = (180, 0, 0) # Cor somada à imagem quando o personagem leva dano.
+
+    def __init__(self, assets, sounds, clock=None, input_source=None):
         """
         Inicializa o personagem do modo Roguelite.
         
         Args:
             assets (AssetManager): O gestor de assets para carregar as imagens.
             sounds (SoundManager): O gestor de som para reproduzir efeitos sonoros.
+            clock (GameClock): O relógio do modo de jogo, usado pelo personagem e pelas armas.
+            input_source: De onde vêm as teclas e o rato (por omissão, o teclado e o rato reais).
         """
         self.assets = assets
         self.sounds = sounds
+        self.clock = clock if clock is not None else WALL_CLOCK
+        self.input_source = input_source if input_source is not None else LIVE_INPUT
         
         # --- Atributos Visuais e de Posição ---
         # A aparência é definida posteriormente, após a escolha da classe.
@@ -69,8 +77,8 @@ class RogueliteDino:
         # Lógica para redimensionar o personagem "Bero" (Warrior)
         if start_asset == "BERO_START":
             new_size = (65, 80) 
-            self.start_image = pygame.transform.scale(self.start_image, new_size)
-            self.running_images = [pygame.transform.scale(img, new_size) for img in self.running_images]
+            self.start_image = self.assets.get_scaled(start_asset, new_size)
+            self.running_images = self.assets.get_scaled(running_asset, new_size)
 
         self.current_image = self.start_image
         
@@ -91,7 +99,7 @@ class RogueliteDino:
 
     def use_special_ability(self):
         """Tenta ativar a habilidade especial (botão direito) da arma equipada."""
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock.get_ticks()
         if self.weapon and current_time - self.last_special_ability_time > self.special_ability_cooldown:
             if hasattr(self.weapon, 'activate_special'):
                 self.weapon.activate_special()
@@ -111,11 +119,11 @@ class RogueliteDino:
 
         # Gereia o efeito de flash de dano.
         if self.is_flashing:
-            if pygame.time.get_ticks() - self.flash_start_time > self.flash_duration:
+            if self.clock.get_ticks() - self.flash_start_time > self.flash_duration:
                 self.is_flashing = False
         
         # --- Lógica de Movimento ---
-        keys = pygame.key.get_pressed()
+        keys = self.input_source.get_keys()
         vel_x, vel_y = 0, 0
         if keys[pygame.K_LEFT] or keys[pygame.K_a]: vel_x = -1
         if keys[pygame.K_RIGHT] or keys[pygame.K_d]: vel_x = 1
@@ -135,7 +143,7 @@ class RogueliteDino:
         self.is_moving = (vel_x != 0 or vel_y != 0)
         
         # Vira o personagem na direção do rato.
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = self.input_source.get_mouse_pos()
         if mouse_pos[0] > self.rect.centerx: self.facing_right = True
         else: self.facing_right = False
             
@@ -162,13 +170,9 @@ class RogueliteDino:
 
     def draw(self, screen, offset=[0, 0]):
         """Desenha o personagem no ecrã, aplicando efeitos visuais."""
-        image_to_draw = pygame.transform.flip(self.current_image, not self.facing_right, False)
-        
-        # Aplica o efeito de flash vermelho se estiver a levar dano.
-        if self.is_flashing:
-            red_tint = image_to_draw.copy()
-            red_tint.fill((180, 0, 0), special_flags=pygame.BLEND_RGB_ADD)
-            image_to_draw = red_tint
+        # A versão virada (e com o flash vermelho de dano, se for o caso) vem do cache de variantes.
+        tint = self.HURT_TINT if self.is_flashing else None
+        image_to_draw = self.assets.variants.get(self.current_image, flip_x=not self.facing_right, tint=tint)
             
         screen.blit(image_to_draw, (self.rect.x + offset[0], self.rect.y + offset[1]))
         
@@ -179,7 +183,7 @@ class RogueliteDino:
 
         self.health -= amount
         self.is_flashing = True
-        self.flash_start_time = pygame.time.get_ticks()
+        self.flash_start_time = self.clock.get_ticks()
         
         if self.health <= 0:
             self.health = 0
@@ -1,16 +1,13 @@
 # Arquivo: dino_runner/components/enemies/bero_run/bero.py (Caminho do Bero)
 
-import pygame
 from dino_runner.components.enemies.enemy import Enemy
 
 class Bero(Enemy):
-    def __init__(self, x, y, assets, is_boss=False):
+    def __init__(self, x, y, assets, is_boss=False, clock=None, rng=None):
         self.assets = assets
-        image = self.assets.get_image("BERO")
-        
         # --- REDIMENSIONAMENTO DA IMAGEM ---
         # Altere (largura, altura) para o tamanho que desejar.
-        image = pygame.transform.scale(image, (80, 100))
+        image = self.assets.get_scaled("BERO", (80, 100))
         
         # --- BALANCEAMENTO: MINIBOSS (Elite) ---
         health = 180   # Vida alta
@@ -18,6 +15,6 @@ class Bero(Enemy):
         speed = 2.0    # Rápido
         exp_value = 60 # Recompensa muito alta
         
-        super().__init__(x, y, image, health, damage, speed, exp_value, is_boss)
+        super().__init__(x, y, image, health, damage, speed, exp_value, is_boss, clock=clock, rng=rng)
         self.hitbox = self.rect.inflate(-20, -15)
         
\ No newline at end of file
@@ -1,21 +1,20 @@
-import pygame
 from dino_runner.components.enemies.enemy import Enemy
-from dino_runner.components.weapons.enemy_projectile import EnemyProjectile
-from dino_runner.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT
 
 
 class Bird1(Enemy):
-    def __init__(self, x, y, assets, is_boss=False):
+    MOVEMENT = "kite"
+
+    def __init__(self, x, y, assets, is_boss=False, clock=None, rng=None):
         self.assets = assets
         # CORREÇÃO: Pega a LISTA de imagens de animação do AssetManager
         image = self.assets.get_image("BIRD") # Assumindo que "BIRD" é a sua lista de frames
         health, damage, speed, exp_value = 60, 10, 1.8, 25
-        super().__init__(x, y, image, health, damage, speed, exp_value, is_boss)
+        super().__init__(x, y, image, health, damage, speed, exp_value, is_boss, clock=clock, rng=rng)
         
         self.hitbox = self.rect.inflate(-15, -15)
         
         self.attack_cooldown = 2500
-        self.last_shot_time = pygame.time.get_ticks()
+        self.last_shot_time = self.clock.get_ticks()
         self.preferred_distance = 350
 
     def update(self, player, enemy_projectiles):
@@ -34,18 +33,9 @@ class Bird1(Enemy):
             else:
                 self.rect.x += (dx / distance) * self.speed
         
-        current_time = pygame.time.get_ticks()
-        if current_time - self.last_shot_time > self.attack_cooldown:
-            self.last_shot_time = current_time
-            if distance > 0:
-                direction = pygame.math.Vector2(dx, dy).normalize()
-                projectile = EnemyProjectile(self.rect.centerx, self.rect.centery, direction, self.assets)
-                enemy_projectiles.append(projectile)
+        self.try_shoot(dx, dy, distance, self.rect.center, enemy_projectiles)
 
         # Limites de tela
-        if self.rect.left < 0: self.rect.left = 0
-        if self.rect.right > SCREEN_WIDTH: self.rect.right = SCREEN_WIDTH
-        if self.rect.top < 0: self.rect.top = 0
-        if self.rect.bottom > SCREEN_HEIGHT: self.rect.bottom = SCREEN_HEIGHT
+        self.clamp_to_screen()
         
         self.hitbox.center = self.rect.center
\ No newline at end of file
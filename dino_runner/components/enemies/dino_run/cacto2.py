@@ -3,14 +3,14 @@ import pygame
 from dino_runner.components.enemies.enemy import Enemy
 
 class Cacto2(Enemy):
-    def __init__(self, x, y, assets, is_boss=False):
+    def __init__(self, x, y, assets, is_boss=False, clock=None, rng=None):
         self.assets = assets
         health = 50
         damage = 10
         speed = 2.5
         exp_value = 20
         image = assets.get_image("CACTO2")
-        super().__init__(x, y, image, health, damage, speed, exp_value, is_boss)
+        super().__init__(x, y, image, health, damage, speed, exp_value, is_boss, clock=clock, rng=rng)
 
         # AJUSTE DA HITBOX: Agora você pode encolher a hitbox para ser mais justa.
         # Esta linha sobrescreve a hitbox padrão criada na classe Enemy.
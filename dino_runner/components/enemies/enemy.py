@@ -5,14 +5,35 @@
 
 import pygame
 import random
+import weakref
 from dino_runner.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from dino_runner.utils.game_clock import WALL_CLOCK
+from dino_runner.utils.frame_trace import TRACE
 from dino_runner.components.weapons.shard import Shard
+from dino_runner.components.weapons.enemy_projectile import EnemyProjectile
 
 class Enemy:
     """
     Representa um inimigo genérico no jogo, servindo como base para todos os tipos de monstros.
     """
-    def __init__(self, x, y, image, health, damage, speed, exp_value, is_boss=False, rage_chance=0.1):
+    # Tipo de movimento, usado pelo EnemyKinematics para mover todos os inimigos de uma vez:
+    # "chase" (persegue o jogador), "keep_distance" (aproxima-se ou foge nos dois eixos) ou
+    # "kite" (persegue e depois corrige a distância só no eixo X).
+    MOVEMENT = "chase"
+
+    # Cores somadas à imagem para os efeitos visuais de estado.
+    FLASH_TINT = (200, 200, 200)
+    SLOW_TINT = (100, 100, 255)
+
+    # Registo partilhado por todas as instâncias: imagem base -> {(escala, nível): variante}.
+    # As variantes (chefe 2x, "rage", futuros níveis de elite) dependem só da imagem e da escala,
+    # por isso são calculadas uma única vez e partilhadas entre inimigos.
+    _variant_registry = weakref.WeakKeyDictionary()
+    # Multiplicador do dano que o inimigo causa (contacto e tiros). Fica na classe: só os
+    # sweeps de dificuldade (dino_runner/simulation/sweep.py) o alteram, por inimigo.
+    damage_scale = 1
+
+    def __init__(self, x, y, image, health, damage, speed, exp_value, is_boss=False, rage_chance=0.1, clock=None, rng=None):
         """
         Inicializa um inimigo com todos os seus atributos.
 
@@ -22,7 +43,14 @@ class Enemy:
             health (int), damage (int), speed (float), exp_value (int): Status base.
             is_boss (bool): Define se este inimigo é um chefe.
             rage_chance (float): A probabilidade (0.0 a 1.0) de um inimigo normal nascer em modo "Rage".
+            clock (GameClock): O relógio do modo de jogo, usado por todos os temporizadores
+                (sem relógio, usa o do pygame).
+            rng (random.Random): O gerador aleatório da partida, para o "Rage" e o Ground Slam
+                (sem gerador, usa o módulo random).
         """
+        self.clock = clock if clock is not None else WALL_CLOCK
+        self.rng = rng if rng is not None else random
+
         # --- Atributos de Animação e Imagem ---
         self.is_animated = isinstance(image, list)
         if self.is_animated:
@@ -74,7 +102,7 @@ class Enemy:
         # --- Lógica de Inicialização para Chefes ---
         if self.is_boss:
             self.health *= 5; self.damage *= 2; self.exp_value *= 10
-            scaled_image = pygame.transform.scale_by(self.original_image, 2)
+            scaled_image = Enemy.get_variant(self.original_image, scale=2)
             self.image = scaled_image
             self.original_image = scaled_image
             self.rect = self.image.get_rect(center=self.rect.center)
@@ -82,7 +110,7 @@ class Enemy:
             self.entry_target_pos = (SCREEN_WIDTH / 2, 150)
         
         # A chance de "Rage" só se aplica a inimigos normais.
-        if not self.is_boss and random.random() < rage_chance:
+        if not self.is_boss and self.rng.random() < rage_chance:
             self.activate_rage()
 
     def update(self, player, enemy_projectiles):
@@ -124,7 +152,7 @@ class Enemy:
 
     def handle_transformation(self):
         """Gereia a animação e a cura do chefe durante a transformação."""
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock.get_ticks()
         self.health += self.heal_amount_per_second / FPS
         if self.health > self.max_health: self.health = self.max_health
         self.flash_timer += 1
@@ -134,7 +162,7 @@ class Enemy:
 
     def handle_casting(self, enemy_projectiles):
         """Gereia o combo de ataques da habilidade do chefe."""
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock.get_ticks()
         if self.cast_count < 3 and current_time - self.last_cast_time > self.time_between_casts:
             self.use_ground_slam(enemy_projectiles, self.assets)
             self.cast_count += 1
@@ -145,7 +173,7 @@ class Enemy:
 
     def handle_status_effects(self):
         """Atualiza os temporizadores de todos os efeitos de estado (lento, flash)."""
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock.get_ticks()
         if self.is_slowed and current_time - self.slow_start_time > self.slow_duration:
             self.is_slowed = False
             self.speed = self.original_speed
@@ -157,12 +185,7 @@ class Enemy:
 
     def handle_movement(self, player):
         """Gereia o movimento de perseguição e os limites do ecrã."""
-        current_time = pygame.time.get_ticks()
-        if self.is_boss and not self.is_transforming and not self.is_casting:
-            if current_time - self.last_skill_time > self.skill_cooldown:
-                self.is_casting = True
-                self.cast_count = 0
-                self.last_cast_time = current_time
+        self.update_skill_timer()
         
         dx = player.rect.centerx - self.rect.centerx
         dy = player.rect.centery - self.rect.centery
@@ -172,17 +195,40 @@ class Enemy:
         self.rect.x += dx * self.speed
         self.rect.y += dy * self.speed
 
+    def update_skill_timer(self):
+        """Inicia o combo de habilidades do chefe quando o cooldown termina."""
+        current_time = self.clock.get_ticks()
+        if self.is_boss and not self.is_transforming and not self.is_casting:
+            if current_time - self.last_skill_time > self.skill_cooldown:
+                self.is_casting = True
+                self.cast_count = 0
+                self.last_cast_time = current_time
+
+    def try_shoot(self, dx, dy, distance, origin, enemy_projectiles):
+        """Inimigos de longo alcance: dispara na direção (dx, dy) a partir de 'origin' se o cooldown terminou."""
+        current_time = self.clock.get_ticks()
+        if current_time - self.last_shot_time > self.attack_cooldown:
+            self.last_shot_time = current_time
+            if distance > 0:
+                direction = pygame.math.Vector2(dx, dy).normalize()
+                projectile = EnemyProjectile.acquire(origin[0], origin[1], direction, self.assets, self.damage_scale)
+                enemy_projectiles.append(projectile)
+
+    def clamp_to_screen(self):
+        """Mantém o inimigo dentro dos limites do ecrã."""
+        if self.rect.left < 0: self.rect.left = 0
+        if self.rect.right > SCREEN_WIDTH: self.rect.right = SCREEN_WIDTH
+        if self.rect.top < 0: self.rect.top = 0
+        if self.rect.bottom > SCREEN_HEIGHT: self.rect.bottom = SCREEN_HEIGHT
+
     def draw(self, screen, offset=[0, 0]):
         """Desenha o inimigo no ecrã, aplicando os efeitos visuais necessários."""
         image_to_draw = self.image
+        # As versões tingidas são calculadas uma vez por imagem e reutilizadas (ver SurfaceVariants).
         if self.is_flashing:
-            flash_image = self.image.copy()
-            flash_image.fill((200, 200, 200), special_flags=pygame.BLEND_RGB_ADD)
-            image_to_draw = flash_image
+            image_to_draw = self.assets.variants.get(self.image, tint=Enemy.FLASH_TINT)
         elif self.is_slowed:
-            slow_image = self.image.copy()
-            slow_image.fill((100, 100, 255), special_flags=pygame.BLEND_RGB_ADD)
-            image_to_draw = slow_image
+            image_to_draw = self.assets.variants.get(self.image, tint=Enemy.SLOW_TINT)
         
         if self.show_image:
             screen.blit(image_to_draw, (self.rect.x + offset[0], self.rect.y + offset[1]))
@@ -210,7 +256,7 @@ class Enemy:
         actual_damage = amount * (1 - self.damage_resistance)
         self.health -= actual_damage
         self.is_flashing = True
-        self.flash_start_time = pygame.time.get_ticks()
+        self.flash_start_time = self.clock.get_ticks()
         return self.health <= 0
 
     def apply_slow(self, slow_factor, duration):
@@ -219,12 +265,13 @@ class Enemy:
             self.speed *= (1 - slow_factor)
             self.is_slowed = True
             self.slow_duration = duration
-            self.slow_start_time = pygame.time.get_ticks()
+            self.slow_start_time = self.clock.get_ticks()
     
     def use_ground_slam(self, enemy_projectiles, assets):
         """Habilidade do chefe: lança estilhaços em 8 direções."""
         print(f"CHEFE usou Ground Slam #{self.cast_count + 1}!")
-        angle_offset = random.uniform(-15, 15)
+        TRACE.instant("ground_slam", enemy=type(self).__name__, cast=self.cast_count + 1)
+        angle_offset = self.rng.uniform(-15, 15)
         directions = [
             pygame.math.Vector2(1, 0), pygame.math.Vector2(-1, 0),
             pygame.math.Vector2(0, 1), pygame.math.Vector2(0, -1),
@@ -233,7 +280,7 @@ class Enemy:
         ]
         for direction in directions:
             rotated_direction = direction.rotate(angle_offset)
-            shard = Shard(self.rect.centerx, self.rect.centery, rotated_direction, assets)
+            shard = Shard.acquire(self.rect.centerx, self.rect.centery, rotated_direction, assets)
             enemy_projectiles.append(shard)
 
     def start_transformation(self):
@@ -241,8 +288,9 @@ class Enemy:
         if self.is_transforming or self.is_in_rage: return
         self.is_transforming = True
         self.is_invulnerable = True
-        self.transformation_start_time = pygame.time.get_ticks()
+        self.transformation_start_time = self.clock.get_ticks()
         self.heal_amount_per_second = self.max_health / 3.0
+        TRACE.instant("boss_transformation", enemy=type(self).__name__)
 
     def finish_transformation(self):
         """Finaliza a transformação e ativa o modo rage."""
@@ -260,9 +308,41 @@ class Enemy:
         self.speed *= 1.5
         self.health = int(self.health * 1.5)
         self.max_health = self.health
-        rage_image = self.original_image.copy()
+        self.image = Enemy.get_variant(self.original_image, tier="rage")
+
+    @classmethod
+    def get_variant(cls, image, scale=1, tier=None):
+        """
+        Retorna a variante partilhada de 'image' para a escala e o nível dados.
+
+        Args:
+            image (Surface): A imagem base (já partilhada, ex: vinda de AssetManager.get_scaled).
+            scale (float): Fator de pygame.transform.scale_by (2 para os chefes).
+            tier (str): Nível visual, ex: "rage". Cada nível tem um método build_<nível>_image.
+        """
+        if scale == 1 and tier is None:
+            return image
+
+        image_variants = Enemy._variant_registry.get(image)
+        if image_variants is None:
+            image_variants = Enemy._variant_registry[image] = {}
+
+        variant = image_variants.get((scale, tier))
+        if variant is None:
+            if tier is None:
+                variant = pygame.transform.scale_by(image, scale)
+            else:
+                build_image = getattr(cls, f"build_{tier}_image")
+                variant = build_image(cls.get_variant(image, scale))
+            image_variants[(scale, tier)] = variant
+        return variant
+
+    @staticmethod
+    def build_rage_image(image):
+        """Cria a versão "Rage" de uma imagem: a silhueta do sprite fica avermelhada."""
+        rage_image = image.copy()
         mask = pygame.mask.from_surface(rage_image)
         mask_surf = mask.to_surface(setcolor=(255, 0, 0), unsetcolor=(0, 0, 0))
         mask_surf.set_colorkey((0, 0, 0))
         rage_image.blit(mask_surf, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
-        self.image = rage_image
+        return rage_image
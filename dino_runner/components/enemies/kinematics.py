@@ -0,0 +1,331 @@
+# Ficheiro: dino_runner/components/enemies/kinematics.py
+# Descrição: Motor de movimento dos inimigos em "estrutura de arrays" (NumPy): as posições,
+#            velocidades e tipos de IA de todos os inimigos são guardados em arrays e o
+#            movimento de perseguição, afastamento e entrada é calculado num só passo.
+#            É opcional (ENEMY_KINEMATICS_STORE): desligado, o modo Roguelite usa o update()
+#            de cada inimigo.
+
+from dino_runner.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+
+import numpy as np
+from dino_runner.utils.array_math import round_like_rect
+
+# Passos de movimento (um por inimigo em cada fase do frame).
+STEP_NONE = 0
+STEP_CHASE = 1      # persegue o jogador nos dois eixos (Enemy.handle_movement)
+STEP_ENTER = 2      # chefe a caminho da posição inicial (Enemy.handle_entrance)
+STEP_KEEP = 3       # aproxima-se ou afasta-se nos dois eixos (Pam)
+STEP_KITE = 4       # aproxima-se ou afasta-se só no eixo X (pássaros)
+
+# Distância mínima a um ponto de decisão (arredondamento de x.5 ou limiar de distância)
+# abaixo da qual o resultado é recalculado com a raiz do Python, para ser idêntico ao código
+# por objeto (a raiz do NumPy e a do Python podem diferir na última casa decimal).
+TIE_TOLERANCE = 1e-9
+
+class EnemyKinematics:
+    """
+    Move todos os inimigos de uma vez, com o mesmo resultado que chamar enemy.update() em cada um.
+
+    Cada frame tem três fases:
+      1. Por inimigo: máquina de estados (entrada, transformação, combo, efeitos de estado)
+         e recolha da posição, tamanho, velocidade e passos de movimento para os arrays.
+      2. Vetorizado: passo base (perseguir ou entrar), passo próprio (manter distância),
+         limites do ecrã.
+      3. Por inimigo: escrita dos retângulos, disparos e hitbox.
+
+    As posições ficam guardadas nos arrays entre frames: só os inimigos novos são lidos
+    do seu retângulo. Fora da criação, só o movimento mexe no rect de um inimigo; se
+    algum código novo o mover, deve chamar sync(enemy) a seguir.
+    """
+    def __init__(self, capacity=64):
+        self.capacity = 0
+        self.tracked = [] # Inimigos pela ordem em que estão nos arrays.
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        """(Re)cria os arrays com espaço para 'capacity' inimigos, mantendo os dados atuais."""
+        old = None if self.capacity == 0 else (self.x, self.y, self.w, self.h, self.hitbox_w, self.hitbox_h)
+        self.capacity = capacity
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.w = np.zeros(capacity, dtype=np.float64)
+        self.h = np.zeros(capacity, dtype=np.float64)
+        self.hitbox_w = np.zeros(capacity, dtype=np.float64)
+        self.hitbox_h = np.zeros(capacity, dtype=np.float64)
+        self.half_w = np.zeros(capacity, dtype=np.float64)
+        self.half_h = np.zeros(capacity, dtype=np.float64)
+        self.hitbox_offset_x = np.zeros(capacity, dtype=np.float64)
+        self.hitbox_offset_y = np.zeros(capacity, dtype=np.float64)
+        self.speed = np.zeros(capacity, dtype=np.float64)
+        self.preferred_distance = np.zeros(capacity, dtype=np.float64)
+        self.target_x = np.zeros(capacity, dtype=np.float64)
+        self.target_y = np.zeros(capacity, dtype=np.float64)
+        self.base_step = np.zeros(capacity, dtype=np.int8)
+        self.own_step = np.zeros(capacity, dtype=np.int8)
+        if old is not None:
+            count = len(self.tracked)
+            for new_array, old_array in zip(self._geometry(), old):
+                new_array[:count] = old_array[:count]
+            self._update_offsets(count)
+
+    def _geometry(self):
+        return (self.x, self.y, self.w, self.h, self.hitbox_w, self.hitbox_h)
+
+    def _update_offsets(self, count):
+        """Recalcula os deslocamentos que o pygame usa para o centro (divisão inteira por 2)."""
+        n = slice(0, count)
+        np.floor_divide(self.w[n], 2, out=self.half_w[n])
+        np.floor_divide(self.h[n], 2, out=self.half_h[n])
+        # hitbox.center = rect.center  ->  hitbox.x = rect.x + w // 2 - hitbox.w // 2
+        np.subtract(self.half_w[n], self.hitbox_w[n] // 2, out=self.hitbox_offset_x[n])
+        np.subtract(self.half_h[n], self.hitbox_h[n] // 2, out=self.hitbox_offset_y[n])
+
+    def _reindex(self, enemies):
+        """Reordena os arrays para a lista atual (mortes e novos inimigos); lê os rects dos novos."""
+        old_slots = {enemy: slot for slot, enemy in enumerate(self.tracked)}
+        slots = [old_slots.get(enemy, -1) for enemy in enemies]
+        count = len(enemies)
+        for array in self._geometry():
+            array[:count] = array[slots]
+        for i, slot in enumerate(slots):
+            if slot == -1:
+                self._read_rects(i, enemies[i])
+        self.tracked = list(enemies)
+        self._update_offsets(count)
+
+        # Inimigos "simples": perseguem o jogador e não são chefes (só os chefes entram na
+        # arena, se transformam ou fazem combos), nem animados. Os restantes são "especiais"
+        # e passam pela máquina de estados completa, um a um.
+        self.plain = []
+        self.special = []
+        for i, enemy in enumerate(enemies):
+            if enemy.MOVEMENT == "chase" and not enemy.is_boss and not enemy.is_animated:
+                self.plain.append(enemy)
+            else:
+                self.special.append(i)
+        self.special_own = [STEP_NONE if enemies[i].MOVEMENT == "chase" else
+                            STEP_KEEP if enemies[i].MOVEMENT == "keep_distance" else STEP_KITE
+                            for i in self.special]
+        self.preferred_distance[:count] = 0
+        self.own_step[:count] = STEP_NONE
+        if self.special:
+            self.own_step[self.special] = self.special_own
+            self.preferred_distance[self.special] = [getattr(enemies[i], "preferred_distance", 0) for i in self.special]
+
+    def _read_rects(self, i, enemy):
+        self.x[i], self.y[i], self.w[i], self.h[i] = enemy.rect
+        self.hitbox_w[i], self.hitbox_h[i] = enemy.hitbox.size
+
+    def sync(self, enemy):
+        """Volta a ler o retângulo de um inimigo que foi movido fora do EnemyKinematics."""
+        for i, tracked in enumerate(self.tracked):
+            if tracked is enemy:
+                self._read_rects(i, enemy)
+                self._update_offsets(len(self.tracked))
+                return
+
+    def update(self, enemies, player, enemy_projectiles):
+        """Atualiza todos os inimigos da lista (equivalente a enemy.update(...) para cada um)."""
+        count = len(enemies)
+        if count == 0:
+            return
+        if count > self.capacity:
+            self._allocate(max(count, self.capacity * 2))
+        # A comparação de listas é feita em C e compara primeiro a identidade dos elementos.
+        if enemies != self.tracked:
+            self._reindex(enemies)
+        n = slice(0, count)
+
+        # --- Fase 1: estados por inimigo ---
+        # Simples: só os efeitos de estado (lento, flash), e só se algum estiver ativo.
+        for enemy in [enemy for enemy in self.plain if enemy.is_slowed or enemy.is_flashing]:
+            enemy.handle_status_effects()
+
+        # Especiais: a máquina de estados de Enemy.update, que decide o passo base.
+        base_step = self.base_step[n]
+        base_step.fill(STEP_CHASE)
+        special, special_own = self.special, self.special_own
+        special_base = []
+        entering, entering_targets = [], []
+        # Estilhaços dos chefes em combo: são entregues na fase 3, pela ordem dos inimigos,
+        # para que a lista de projéteis fique igual à do update() por objeto.
+        cast_shards = {}
+        for k, i in enumerate(special):
+            enemy = enemies[i]
+            base = STEP_NONE
+            if special_own[k] != STEP_KEEP: # A Pam não usa a máquina de estados base.
+                if enemy.is_entering:
+                    base = STEP_ENTER
+                    entering.append(i)
+                    entering_targets.append(enemy.entry_target_pos)
+                elif enemy.is_transforming:
+                    enemy.handle_transformation()
+                elif enemy.is_casting:
+                    shards = []
+                    enemy.handle_casting(shards)
+                    if shards: cast_shards[i] = shards
+                else:
+                    enemy.handle_status_effects()
+                    if enemy.is_boss: # Nos outros inimigos, update_skill_timer não faz nada.
+                        enemy.update_skill_timer()
+                    base = STEP_CHASE
+            special_base.append(base)
+        if special:
+            base_step[special] = special_base
+        if entering:
+            self.target_x[entering], self.target_y[entering] = np.array(entering_targets, dtype=np.float64).T
+        self.speed[n] = [enemy.speed for enemy in enemies]
+
+        # --- Fase 2: movimento vetorizado ---
+        px, py = player.rect.centerx, player.rect.centery
+        pos_x, pos_y = self.x[n], self.y[n]
+        half_w, half_h = self.half_w[n], self.half_h[n]
+        speeds = self.speed[n]
+        own_step = self.own_step[n]
+
+        self._chase_step(pos_x, pos_y, half_w, half_h, speeds, base_step == STEP_CHASE, px, py)
+        self._enter_step(pos_x, pos_y, half_w, half_h, speeds, base_step == STEP_ENTER, n)
+
+        # Os passos próprios usam a posição já atualizada pelo passo base.
+        has_own = own_step != STEP_NONE
+        if special:
+            dx = px - (pos_x + half_w)
+            dy = py - (pos_y + half_h)
+            distance = self._distance(dx, dy)
+            self._keep_distance_step(pos_x, pos_y, dx, dy, distance, speeds, has_own, own_step == STEP_KITE, n)
+            # Centro antes dos limites do ecrã: é daí que os projéteis dos inimigos saem.
+            shot_x = pos_x + half_w
+            shot_y = pos_y + half_h
+
+            width, height = self.w[n], self.h[n]
+            np.copyto(pos_x, 0, where=has_own & (pos_x < 0))
+            np.copyto(pos_x, SCREEN_WIDTH - width, where=has_own & (pos_x + width > SCREEN_WIDTH))
+            np.copyto(pos_y, 0, where=has_own & (pos_y < 0))
+            np.copyto(pos_y, SCREEN_HEIGHT - height, where=has_own & (pos_y + height > SCREEN_HEIGHT))
+
+        # --- Fase 3: escreve os resultados nos inimigos ---
+        # Perseguição ou movimento próprio: retângulo e hitbox. Entrada: só o retângulo.
+        # Parados (transformação ou combo): nada muda.
+        rect_x = pos_x.astype(np.int64)
+        rect_y = pos_y.astype(np.int64)
+        hitbox_x = (pos_x + self.hitbox_offset_x[n]).astype(np.int64).tolist()
+        hitbox_y = (pos_y + self.hitbox_offset_y[n]).astype(np.int64).tolist()
+        moved = (base_step == STEP_CHASE) | has_own
+        if moved.all():
+            for enemy, x, y, hx, hy in zip(enemies, rect_x.tolist(), rect_y.tolist(), hitbox_x, hitbox_y):
+                enemy.rect.topleft = (x, y)
+                enemy.hitbox.topleft = (hx, hy)
+        else:
+            final_x, final_y = rect_x.tolist(), rect_y.tolist()
+            for i in np.flatnonzero(moved).tolist():
+                enemy = enemies[i]
+                enemy.rect.topleft = (final_x[i], final_y[i])
+                enemy.hitbox.topleft = (hitbox_x[i], hitbox_y[i])
+            for i in np.flatnonzero((base_step == STEP_ENTER) & ~has_own).tolist():
+                enemies[i].rect.topleft = (final_x[i], final_y[i])
+
+        if not special:
+            return
+        # Só para os especiais: índices convertidos para listas (acesso mais rápido do que ao NumPy).
+        dx, dy = dx[special].astype(np.int64).tolist(), dy[special].astype(np.int64).tolist()
+        distance = distance[special].tolist()
+        shot_x, shot_y = shot_x[special].astype(np.int64).tolist(), shot_y[special].astype(np.int64).tolist()
+        entering_done = self.entering_done
+        for k, i in enumerate(special):
+            enemy = enemies[i]
+            if i in cast_shards:
+                enemy_projectiles.extend(cast_shards[i])
+            if special_base[k] == STEP_ENTER and entering_done[i]:
+                enemy.is_entering = False
+            # try_shoot só é chamado quando o cooldown já terminou (é o único caso em que faz algo).
+            if special_own[k] != STEP_NONE and enemy.clock.get_ticks() - enemy.last_shot_time > enemy.attack_cooldown:
+                enemy.try_shoot(dx[k], dy[k], distance[k], (shot_x[k], shot_y[k]), enemy_projectiles)
+
+    @staticmethod
+    def _near_half(values):
+        """Posições cuja parte decimal está (quase) em .5, onde o arredondamento pode mudar."""
+        return np.abs(np.abs(values - np.trunc(values)) - 0.5) < TIE_TOLERANCE
+
+    @staticmethod
+    def _distance(dx, dy):
+        """Raiz de dx² + dy², igual à do código por objeto, (dx**2 + dy**2)**0.5."""
+        return np.sqrt(dx * dx + dy * dy)
+
+    @staticmethod
+    def _exact_distance(dx, dy, mask):
+        """Recalcula a distância com a potência do Python nas posições marcadas em 'mask'."""
+        distance = np.sqrt(dx * dx + dy * dy)
+        for i in np.flatnonzero(mask).tolist():
+            distance[i] = (float(dx[i]) ** 2 + float(dy[i]) ** 2) ** 0.5
+        return distance
+
+    def _chase_step(self, pos_x, pos_y, half_w, half_h, speeds, active, px, py):
+        """Enemy.handle_movement: avança 'speed' píxeis na direção do jogador."""
+        if not active.any():
+            return
+        dx = px - (pos_x + half_w)
+        dy = py - (pos_y + half_h)
+        distance = self._distance(dx, dy)
+        new_x, new_y = self._chase_targets(pos_x, pos_y, dx, dy, distance, speeds)
+        ambiguous = active & (self._near_half(new_x) | self._near_half(new_y))
+        if ambiguous.any():
+            distance = self._exact_distance(dx, dy, ambiguous)
+            new_x, new_y = self._chase_targets(pos_x, pos_y, dx, dy, distance, speeds)
+        np.copyto(pos_x, round_like_rect(new_x), where=active)
+        np.copyto(pos_y, round_like_rect(new_y), where=active)
+
+    @staticmethod
+    def _chase_targets(pos_x, pos_y, dx, dy, distance, speeds):
+        safe = np.where(distance > 0, distance, 1.0)
+        unit_x = np.where(distance > 0, dx / safe, dx)
+        unit_y = np.where(distance > 0, dy / safe, dy)
+        return pos_x + unit_x * speeds, pos_y + unit_y * speeds
+
+    def _enter_step(self, pos_x, pos_y, half_w, half_h, speeds, active, n):
+        """Enemy.handle_entrance: o chefe avança até ao ponto de entrada e para lá."""
+        self.entering_done = [False] * (n.stop - n.start)
+        if not active.any():
+            return
+        target_x, target_y = self.target_x[n], self.target_y[n]
+        dx = target_x - (pos_x + half_w)
+        dy = target_y - (pos_y + half_h)
+        distance = self._distance(dx, dy)
+        ambiguous = active & (np.abs(distance - speeds) < TIE_TOLERANCE)
+        moving_x = pos_x + (dx / np.where(distance > 0, distance, 1.0)) * speeds
+        moving_y = pos_y + (dy / np.where(distance > 0, distance, 1.0)) * speeds
+        ambiguous |= active & (self._near_half(moving_x) | self._near_half(moving_y))
+        if ambiguous.any():
+            distance = self._exact_distance(dx, dy, ambiguous)
+            moving_x = pos_x + (dx / np.where(distance > 0, distance, 1.0)) * speeds
+            moving_y = pos_y + (dy / np.where(distance > 0, distance, 1.0)) * speeds
+
+        moves = active & (distance > speeds)
+        arrives = active & ~moves
+        np.copyto(pos_x, round_like_rect(moving_x), where=moves)
+        np.copyto(pos_y, round_like_rect(moving_y), where=moves)
+        # rect.center = alvo: o pygame arredonda o alvo e subtrai metade do tamanho.
+        np.copyto(pos_x, round_like_rect(target_x) - half_w, where=arrives)
+        np.copyto(pos_y, round_like_rect(target_y) - half_h, where=arrives)
+        self.entering_done = arrives.tolist()
+
+    def _keep_distance_step(self, pos_x, pos_y, dx, dy, distance, speeds, active, x_only, n):
+        """Pam e pássaros: afastam-se se estiverem mais perto do que a distância preferida, senão aproximam-se."""
+        if not active.any():
+            return
+        preferred = self.preferred_distance[n]
+        moving = active & (distance > 0)
+        ambiguous = moving & (np.abs(distance - preferred) < TIE_TOLERANCE)
+        new_x, new_y = self._keep_distance_targets(pos_x, pos_y, dx, dy, distance, speeds, preferred)
+        ambiguous |= moving & (self._near_half(new_x) | (self._near_half(new_y) & ~x_only))
+        if ambiguous.any():
+            distance[:] = self._exact_distance(dx, dy, ambiguous)
+            new_x, new_y = self._keep_distance_targets(pos_x, pos_y, dx, dy, distance, speeds, preferred)
+        np.copyto(pos_x, round_like_rect(new_x), where=moving)
+        np.copyto(pos_y, round_like_rect(new_y), where=moving & ~x_only)
+
+    @staticmethod
+    def _keep_distance_targets(pos_x, pos_y, dx, dy, distance, speeds, preferred):
+        safe = np.where(distance > 0, distance, 1.0)
+        # x - v é o mesmo que x + (-v) em vírgula flutuante, por isso basta trocar o sinal.
+        direction = np.where(distance < preferred, -1.0, 1.0)
+        return pos_x + direction * ((dx / safe) * speeds), pos_y + direction * ((dy / safe) * speeds)
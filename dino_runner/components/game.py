@@ -3,13 +3,19 @@
 # Descrição: Classe principal que gereia os estados do jogo (Menu, Jogo, Game Over)
 # e a transição entre os diferentes modos de jogo.
 
+import random
 import pygame
 from dino_runner.components.modes.endless_runner import EndlessRunner
 from dino_runner.components.modes.roguelite_mode import RogueliteMode
-from dino_runner.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT, TITLE, FPS
+from dino_runner.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT, TITLE, FPS, RENDER_FPS, MAX_FRAME_TIME, DIRTY_RECT_RENDERING
 from dino_runner.utils.asset_manager import AssetManager
+from dino_runner.utils.frame_profiler import FrameProfiler, ProfilerOverlay
+from dino_runner.utils.frame_trace import TRACE, trace_filename
+from dino_runner.utils.wave_profiler import WAVE_PROFILER
+from dino_runner.utils.replay import ReplayRecorder, replay_filename, SNAPSHOT_SECONDS
 from dino_runner.utils.sound_manager import SoundManager
 from dino_runner.utils.text_utils import draw_message_component
+from dino_runner.utils.ui import RetainedScreen, hit_test
 
 class GameController:
     """
@@ -23,10 +29,11 @@ class GameController:
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         
         # Configurações do jogo que podem ser alteradas pelo jogador
-        self.settings = {"music": True, "sfx": True, "shake": True}
+        self.settings = {"music": True, "sfx": True, "shake": True, "dirty_rects": DIRTY_RECT_RENDERING}
         
         # Gestores de recursos
-        self.assets = AssetManager()
+        # Só os assets do menu são carregados já; os dos modos de jogo carregam em fundo.
+        self.assets = AssetManager(groups=("MENU",))
         self.sounds = SoundManager(self.settings)
         
         pygame.display.set_caption(TITLE)
@@ -38,6 +45,28 @@ class GameController:
         self.game_state = "MENU"
         self.game_mode_instance = None
         self.game_mode_type = "NORMAL"
+        # Regiões do ecrã a atualizar neste frame; None significa o ecrã inteiro.
+        self.frame_dirty_rects = None
+        self.last_frame_state = None
+
+        # Ciclo de passo fixo: a simulação avança em passos de 1 / FPS segundos, independentes
+        # da frequência a que os frames são desenhados (RENDER_FPS).
+        self.simulation_step = 1.0 / FPS
+        self.accumulator = 0.0
+        self.frame_time = self.simulation_step # O primeiro frame corre um passo.
+        self.pending_events = [] # Eventos à espera do próximo passo de simulação.
+
+        # Perfil de cada frame, mostrado com F3 e gravado num trace com F4. Desligado, custa
+        # só a verificação de um atributo.
+        self.profiler = FrameProfiler()
+        self.profiler.trace = TRACE
+        self.profiler_overlay = ProfilerOverlay()
+        self.show_profiler = False
+
+        # Replays: com uma pasta definida (python main.py --record PASTA), cada partida é gravada.
+        self.replay_dir = None
+        self.recorder = None
+        self.snapshot_seconds = SNAPSHOT_SECONDS # Segundos de jogo entre snapshots do replay (para o seek).
         
         # Pontuações e recordes
         self.high_score_normal = 0
@@ -45,20 +74,46 @@ class GameController:
         self.load_high_scores()
 
         # Assets específicos do menu
-        self.menu_dino_image = pygame.transform.scale(self.assets.get_image("DINO_START"), (120, 120))
+        self.menu_dino_image = self.assets.get_scaled("DINO_START", (120, 120))
+        self.menu_button_rects = {}
         self.option_button_rects = {}
+        self.game_over_button_rects = {}
+
+        # Ecrãs estáticos compostos uma vez e reutilizados enquanto o seu estado não muda.
+        self.menu_ui = RetainedScreen()
+        self.game_over_ui = RetainedScreen()
+
+        # Pré-carrega os assets dos modos de jogo enquanto o menu está visível.
+        self.assets.start_prefetch()
 
     def execute(self):
         """Inicia e mantém o loop principal do jogo."""
+        profiler = self.profiler
         while self.running:
+            # O perfil mede enquanto o painel está visível ou um trace está a ser gravado.
+            profiler.enabled = self.show_profiler or TRACE.recording
+            profiler.start()
             events = pygame.event.get()
             for event in events:
                 if event.type == pygame.QUIT:
                     self.running = False
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    self.show_profiler = not self.show_profiler
+                    profiler.clear()
+                    self.last_frame_state = None # Redesenha o ecrã inteiro sem o painel.
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                    self.toggle_trace()
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F5:
+                    WAVE_PROFILER.toggle()
+            profiler.lap("events")
 
             # Máquina de estados principal
+            self.frame_dirty_rects = None
+            frame_state = self.game_state
             if self.game_state == "RUNNING":
-                self.run_gameplay(events)
+                # O QUIT é tratado aqui: o ciclo termina e fecha o trace e o replay antes de sair.
+                self.pending_events.extend(event for event in events if event.type != pygame.QUIT)
+                self.run_gameplay()
             elif self.game_state == "MENU":
                 self.show_menu(events)
             elif self.game_state == "GAME_OVER":
@@ -67,64 +122,179 @@ class GameController:
                 else:
                     self.game_state = "MENU"
 
-            pygame.display.update()
-            self.clock.tick(FPS)
+            if self.show_profiler:
+                self.draw_profiler()
+            if frame_state != self.last_frame_state:
+                self.frame_dirty_rects = None # Mudou de ecrã: envia-o por inteiro.
+            self.last_frame_state = frame_state
+            self.update_display()
+            profiler.lap("display")
+            self.frame_time = self.clock.tick(RENDER_FPS) / 1000
+            profiler.lap("idle")
+            mode = self.game_mode_instance
+            profiler.end_frame(((mode.timer, "update."), (mode.draw_timer, "draw.")) if mode else ())
         
+        self.stop_trace()
+        self.save_replay()
         pygame.quit()
 
-    def run_gameplay(self, events):
-        """Gereia a criação e execução do modo de jogo selecionado."""
+    def start_trace(self, path=None):
+        """Começa a gravar um trace dos frames (formato Chrome trace-event) em 'path'."""
+        path = path or trace_filename()
+        TRACE.start(path)
+        print(f"A gravar o trace em {path} (F4 para parar)")
+
+    def stop_trace(self):
+        """Para a gravação do trace, se houver uma."""
+        path = TRACE.stop()
+        if path:
+            dropped = f" ({TRACE.dropped} eventos perdidos)" if TRACE.dropped else ""
+            print(f"Trace gravado em {path}{dropped}: abra-o em ui.perfetto.dev ou chrome://tracing")
+
+    def save_replay(self):
+        """Grava o replay da partida atual, se estiver a ser gravada."""
+        if self.recorder and self.game_mode_instance:
+            path = self.recorder.save(self.game_mode_instance)
+            print(f"Replay gravado em {path} ({self.recorder.frame_count} passos)")
+        self.recorder = None
+
+    def toggle_trace(self):
+        """Tecla F4: começa ou para a gravação do trace."""
+        if TRACE.recording:
+            self.stop_trace()
+        else:
+            self.start_trace()
+
+    def draw_profiler(self):
+        """Desenha o painel do perfil por cima do frame e junta-o às regiões a enviar."""
+        mode = self.game_mode_instance
+        counts = mode.entity_counts() if mode else {}
+        # O resumo das pools só existe no Roguelite (atualizado no fim de cada wave).
+        rect = self.profiler_overlay.draw(self.screen, self.profiler, counts,
+                                          getattr(mode, "pool_stats", ()), getattr(mode, "pool_stats_wave", 0))
+        # O menu e o Game Over podem não ter mudado ([]): o painel muda na mesma.
+        if self.frame_dirty_rects is not None:
+            self.frame_dirty_rects.append(rect)
+        self.profiler.lap("overlay")
+
+    def update_display(self):
+        """Envia o frame para o ecrã: só as regiões alteradas, se o modo "dirty rects" estiver ativo."""
+        if self.settings["dirty_rects"] and self.frame_dirty_rects is not None:
+            if self.frame_dirty_rects:
+                pygame.display.update(self.frame_dirty_rects)
+        else:
+            pygame.display.update()
+
+    def run_gameplay(self):
+        """
+        Gereia a criação e execução do modo de jogo selecionado.
+
+        Corre tantos passos de simulação quantos couberem no tempo acumulado e desenha
+        o estado interpolado entre o penúltimo e o último passo.
+        """
         if not self.game_mode_instance:
             self.sounds.stop_music()
+            # Só bloqueia se a thread de fundo ainda não acabou os assets deste modo.
+            self.assets.wait_for_mode(self.game_mode_type)
             
+            # A semente da partida é escolhida aqui para poder ir para o replay.
+            seed = random.randrange(2**32)
+            input_source = None
+            if self.replay_dir:
+                self.recorder = ReplayRecorder(replay_filename(self.replay_dir, self.game_mode_type), self.game_mode_type, seed,
+                                               snapshot_seconds=self.snapshot_seconds)
+                input_source = self.recorder.input
+
             if self.game_mode_type == "NORMAL":
                 self.sounds.play_music("normal_theme.mp3")
-                self.game_mode_instance = EndlessRunner(self.screen, self.high_score_normal, self.assets, self.sounds, self.settings)
+                self.game_mode_instance = EndlessRunner(self.screen, self.high_score_normal, self.assets, self.sounds, self.settings,
+                                                        input_source=input_source, seed=seed)
             elif self.game_mode_type == "ROGUELITE":
                 self.sounds.play_music("roguelite_theme.mp3")
-                self.game_mode_instance = RogueliteMode(self.screen, self.high_score_roguelite, self.assets, self.sounds, self.settings)
+                self.game_mode_instance = RogueliteMode(self.screen, self.high_score_roguelite, self.assets, self.sounds, self.settings,
+                                                        input_source=input_source, seed=seed)
+            self.game_mode_instance.timer.trace = self.game_mode_instance.draw_timer.trace = TRACE
+            # O tempo gasto a carregar não conta para a simulação: o novo jogo começa com um passo.
+            self.accumulator = 0.0
+            self.frame_time = self.simulation_step
 
-        run_result = self.game_mode_instance.run(events)
+        # Os timers do modo medem os subsistemas do update e do desenho quando o perfil está ligado.
+        self.game_mode_instance.timer.enabled = self.game_mode_instance.draw_timer.enabled = self.profiler.enabled
+        # O time_scale do relógio do modo acelera ou abranda a simulação em relação ao tempo real.
+        self.accumulator += min(self.frame_time, MAX_FRAME_TIME) * self.game_mode_instance.clock.time_scale
+        run_result = True
+        while self.accumulator >= self.simulation_step:
+            if self.recorder:
+                self.recorder.capture(self.pending_events, self.game_mode_instance)
+            run_result = self.game_mode_instance.step(self.pending_events)
+            self.pending_events = []
+            self.accumulator -= self.simulation_step
+            if not run_result or run_result == "MENU":
+                self.accumulator = 0.0
+                break
+        self.profiler.lap("update")
+        self.game_mode_instance.render(self.accumulator / self.simulation_step)
+        self.frame_dirty_rects = self.game_mode_instance.get_dirty_rects()
+        self.profiler.lap("draw")
 
         if not run_result or run_result == "MENU":
             self.sounds.stop_music()
             self.update_and_save_highscore()
+            # Saiu do jogo a meio de uma captura do perfil (ex: pausa -> menu): grava o que tem.
+            WAVE_PROFILER.stop("_parcial")
+            self.save_replay()
             
             if run_result == "MENU":
                 self.game_state = "MENU"
             else:
                 self.game_state = "GAME_OVER"
+                # O fundo do ecrã de Game Over é o último frame desta partida.
+                self.game_over_ui.invalidate()
             
 
     def show_menu(self, events):
         """Desenha e gerencia o menu"""
-        self.screen.fill((255, 255, 255))
-        self.screen.blit(self.menu_dino_image, (SCREEN_WIDTH // 2 - 60, SCREEN_HEIGHT // 2 - 250))
-        draw_message_component("Dino Runner", self.screen, font_size=50, pos_y_center=SCREEN_HEIGHT // 2 - 100)
-        
-        normal_button = draw_message_component("Normal Mode", self.screen, pos_y_center=SCREEN_HEIGHT // 2 + 50, has_background=True, return_rect=True)
-        roguelite_button = draw_message_component("Roguelite Mode", self.screen, pos_y_center=SCREEN_HEIGHT // 2 + 120, has_background=True, return_rect=True)
-
-        self.draw_options_buttons()
+        # O menu só é recomposto quando as opções ou o progresso do carregamento mudam.
+        loading_progress = None if self.assets.is_fully_loaded() else round(self.assets.get_load_progress(), 2)
+        if not self.menu_ui.draw(self.screen, (tuple(self.settings.values()), loading_progress), self.draw_menu):
+            self.frame_dirty_rects = [] # Nada mudou: não há nada a enviar para o ecrã.
 
         for event in events:
             if event.type == pygame.MOUSEBUTTONDOWN:
-                if normal_button.collidepoint(event.pos):
-                    # CORREÇÃO: Garante um estado limpo antes de iniciar.
-                    self.game_mode_instance = None
-                    self.game_mode_type = "NORMAL"
-                    self.game_state = "RUNNING"
-                elif roguelite_button.collidepoint(event.pos):
+                # Os cliques são testados contra os retângulos guardados na última composição.
+                mode_clicked = hit_test(self.menu_button_rects, event.pos)
+                if mode_clicked:
                     # CORREÇÃO: Garante um estado limpo antes de iniciar.
                     self.game_mode_instance = None
-                    self.game_mode_type = "ROGUELITE"
+                    self.game_mode_type = mode_clicked
                     self.game_state = "RUNNING"
                 
-                for option, rect in self.option_button_rects.items():
-                    if rect.collidepoint(event.pos):
-                        self.settings[option] = not self.settings[option]
-                        if option == 'music' and not self.settings['music']:
-                            self.sounds.stop_music()
+                option = hit_test(self.option_button_rects, event.pos)
+                if option:
+                    self.settings[option] = not self.settings[option]
+                    if option == 'music' and not self.settings['music']:
+                        self.sounds.stop_music()
+        self.profiler.lap("ui")
+
+    def draw_menu(self):
+        """Desenha o menu completo e guarda os retângulos dos botões."""
+        self.screen.fill((255, 255, 255))
+        self.screen.blit(self.menu_dino_image, (SCREEN_WIDTH // 2 - 60, SCREEN_HEIGHT // 2 - 250))
+        draw_message_component("Dino Runner", self.screen, font_size=50, pos_y_center=SCREEN_HEIGHT // 2 - 100)
+        
+        self.menu_button_rects["NORMAL"] = draw_message_component("Normal Mode", self.screen, pos_y_center=SCREEN_HEIGHT // 2 + 50, has_background=True, return_rect=True)
+        self.menu_button_rects["ROGUELITE"] = draw_message_component("Roguelite Mode", self.screen, pos_y_center=SCREEN_HEIGHT // 2 + 120, has_background=True, return_rect=True)
+
+        self.draw_options_buttons()
+        if not self.assets.is_fully_loaded():
+            self.draw_loading_bar()
+
+    def draw_loading_bar(self):
+        """Desenha uma barra com o progresso do pré-carregamento dos assets."""
+        bar_rect = pygame.Rect(20, SCREEN_HEIGHT - 30, 200, 10)
+        progress = self.assets.get_load_progress()
+        pygame.draw.rect(self.screen, (200, 200, 200), bar_rect)
+        pygame.draw.rect(self.screen, (83, 83, 83), (bar_rect.x, bar_rect.y, bar_rect.width * progress, bar_rect.height))
 
     def draw_options_buttons(self):
         """Desenha os botões de opções (Música, SFX, Shake)."""
@@ -144,26 +314,34 @@ class GameController:
 
     def show_game_over_screen(self, events):
         """Desenha o ecrã de Game Over para o modo Normal."""
-        if self.game_mode_instance:
-            self.game_mode_instance.draw()
-
-        score_text = f"Sua Pontuacao: {self.last_score:05d}"
-        draw_message_component("GAME OVER", self.screen, font_size=50, pos_y_center=SCREEN_HEIGHT // 2 - 100)
-        draw_message_component(score_text, self.screen, font_size=30, pos_y_center=SCREEN_HEIGHT // 2 - 50)
-        
-        retry_button_rect = draw_message_component("Jogar Novamente", self.screen, pos_y_center=SCREEN_HEIGHT // 2 + 50, has_background=True, return_rect=True)
-        menu_button_rect = draw_message_component("Menu Principal", self.screen, pos_y_center=SCREEN_HEIGHT // 2 + 120, has_background=True, return_rect=True)
+        # O ecrã é estático: só é composto uma vez por Game Over.
+        if not self.game_over_ui.draw(self.screen, self.last_score, self.draw_game_over_screen):
+            self.frame_dirty_rects = []
 
         for event in events:
             if event.type == pygame.MOUSEBUTTONDOWN:
-                if retry_button_rect.collidepoint(event.pos):
+                clicked = hit_test(self.game_over_button_rects, event.pos)
+                if clicked == "retry":
                     # A instância só é apagada AQUI, após o clique.
                     self.game_mode_instance = None
                     self.game_state = "RUNNING"
-                elif menu_button_rect.collidepoint(event.pos):
+                elif clicked == "menu":
                     # A instância só é apagada AQUI, após o clique.
                     self.game_mode_instance = None
                     self.game_state = "MENU"
+        self.profiler.lap("ui")
+
+    def draw_game_over_screen(self):
+        """Desenha o último frame da partida com a mensagem e os botões de Game Over."""
+        if self.game_mode_instance:
+            self.game_mode_instance.draw()
+
+        score_text = f"Sua Pontuacao: {self.last_score:05d}"
+        draw_message_component("GAME OVER", self.screen, font_size=50, pos_y_center=SCREEN_HEIGHT // 2 - 100)
+        draw_message_component(score_text, self.screen, font_size=30, pos_y_center=SCREEN_HEIGHT // 2 - 50)
+        
+        self.game_over_button_rects["retry"] = draw_message_component("Jogar Novamente", self.screen, pos_y_center=SCREEN_HEIGHT // 2 + 50, has_background=True, return_rect=True)
+        self.game_over_button_rects["menu"] = draw_message_component("Menu Principal", self.screen, pos_y_center=SCREEN_HEIGHT // 2 + 120, has_background=True, return_rect=True)
 
     def update_and_save_highscore(self):
         """Verifica e salva o novo recorde para o modo de jogo atual."""
@@ -9,34 +9,51 @@ from dino_runner.components.dinos.endless_runner_dino import EndlessRunnerDino
 from dino_runner.components.obstacles.cactus import Cactus
 from dino_runner.components.obstacles.bird import Bird
 from dino_runner.utils.constants import SCREEN_WIDTH
-from dino_runner.utils.text_utils import draw_message_component
+from dino_runner.utils.text_utils import FONT_COLOR, FONT_SIZE, get_font
+from dino_runner.utils.glyph_atlas import get_atlas, HudText
+from dino_runner.utils.dirty_rects import DirtyRectTracker
+from dino_runner.utils.interpolation import MotionHistory
+from dino_runner.utils.game_clock import GameClock
+from dino_runner.utils.input_source import LIVE_INPUT
+from dino_runner.utils.section_timer import SectionTimer
+from dino_runner.utils.frame_trace import TRACE
+from dino_runner.utils.wave_profiler import WAVE_PROFILER
 
 class Cloud:
     """Representa uma nuvem decorativa que se move no fundo do cenário."""
-    def __init__(self, assets):
+    def __init__(self, assets, rng=None):
         """
         Inicializa a nuvem.
         
         Args:
             assets (AssetManager): O gestor de assets para carregar a imagem da nuvem.
+            rng (random.Random): O gerador aleatório da partida (sem gerador, usa o módulo random).
         """
+        rng = rng if rng is not None else random
         self.image = assets.get_image("CLOUD")
-        self.x = SCREEN_WIDTH + random.randint(300, 1000)
-        self.y = random.randint(50, 250)
+        self.x = SCREEN_WIDTH + rng.randint(300, 1000)
+        self.y = rng.randint(50, 250)
 
     def update(self, game_speed):
         """Move a nuvem para a esquerda com base na velocidade do jogo."""
         self.x -= game_speed
     
-    def draw(self, screen):
+    def draw(self, screen, offset=[0, 0]):
         """Desenha a nuvem no ecrã."""
-        screen.blit(self.image, (self.x, self.y))
+        screen.blit(self.image, (self.x + offset[0], self.y + offset[1]))
 
 class EndlessRunner:
     """
     Gereia toda a lógica e os elementos do modo de jogo Endless Runner.
     """
-    def __init__(self, screen, high_score, assets, sounds, settings, first_run=False):
+    # Atributos que ficam fora dos snapshots dos replays: recursos partilhados, caches do
+    # desenho e cronómetros, que o modo onde o snapshot é reposto já tem.
+    SNAPSHOT_EXCLUDE = frozenset({
+        "screen", "assets", "sounds", "settings", "input_source", "bg_image",
+        "score_hud", "high_score_hud", "dirty_rects", "motion", "timer", "draw_timer",
+    })
+
+    def __init__(self, screen, high_score, assets, sounds, settings, first_run=False, clock=None, input_source=None, seed=None):
         """
         Inicializa o modo de jogo.
 
@@ -47,8 +64,16 @@ class EndlessRunner:
             sounds (SoundManager): O gestor de todos os efeitos sonoros.
             settings (dict): As configurações do jogo (som, música, etc.).
             first_run (bool): Indica se é a primeira execução para o dinossauro começar parado.
+            clock (GameClock): O relógio do modo (por omissão, um novo, a começar em zero).
+            input_source: De onde vêm as teclas (por omissão, o teclado real).
+            seed (int): Semente do gerador aleatório da partida (por omissão, uma tirada do
+                módulo random). Com a mesma semente e o mesmo input, a partida repete-se igual.
         """
         self.screen = screen
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.rng = random.Random(self.seed)
+        self.clock = clock if clock is not None else GameClock()
+        self.input_source = input_source if input_source is not None else LIVE_INPUT
         self.high_score = high_score
         self.assets = assets
         self.sounds = sounds
@@ -56,14 +81,14 @@ class EndlessRunner:
         
         # Carrega os assets necessários para este modo
         self.bg_image = self.assets.get_image("BG")
-        self.player = EndlessRunnerDino(self.assets, first_run=first_run)
+        self.player = EndlessRunnerDino(self.assets, first_run=first_run, input_source=self.input_source)
         
         # Listas para gerir os objetos no jogo
         self.obstacle_list = []
         self.clouds = []
         for i in range(3):
-            cloud = Cloud(self.assets)
-            cloud.x = random.randint(0, SCREEN_WIDTH)
+            cloud = Cloud(self.assets, self.rng)
+            cloud.x = self.rng.randint(0, SCREEN_WIDTH)
             self.clouds.append(cloud)
             
         # Variáveis de estado do jogo
@@ -72,6 +97,20 @@ class EndlessRunner:
         self.x_pos_bg = 0
         self.y_pos_bg = 380
 
+        # Pontuação e recorde compostos pelo atlas de glifos (recompostos só quando mudam).
+        score_atlas = get_atlas(get_font(FONT_SIZE), FONT_COLOR)
+        self.score_hud = HudText(score_atlas)
+        self.high_score_hud = HudText(score_atlas)
+
+        # Regiões alteradas em cada frame (usadas no modo de renderização por "dirty rects").
+        self.dirty_rects = DirtyRectTracker()
+        # Posições do passo de simulação anterior, para o desenho interpolado (ver render).
+        self.motion = MotionHistory()
+        self.previous_x_pos_bg = self.x_pos_bg
+        # Tempo por subsistema dentro do update e do desenho (desligados, exceto em simulações e perfis).
+        self.timer = SectionTimer(category="update")
+        self.draw_timer = SectionTimer(category="draw")
+
     def handle_events(self, events):
         """Processa os inputs do jogador (pulo e agachar)."""
         for event in events:
@@ -86,7 +125,10 @@ class EndlessRunner:
 
     def update(self):
         """Atualiza a lógica de todos os elementos do jogo a cada frame."""
+        timer = self.timer
+        timer.start()
         self.player.update()
+        timer.lap("player")
         if self.player.is_dead:
             return False # Sinaliza o fim do jogo
 
@@ -97,7 +139,8 @@ class EndlessRunner:
                 self.game_speed += 1
             
             self.update_background()
-            
+            timer.lap("background")
+
             # Gera novos obstáculos se a lista estiver vazia
             if len(self.obstacle_list) == 0:
                 self.spawn_obstacle()
@@ -111,8 +154,11 @@ class EndlessRunner:
                 
                 if player_hitbox.colliderect(obstacle.hitbox):
                     self.player.die()
+                    TRACE.instant("game_over", mode="endless", score=self.score, speed=self.game_speed)
+                    WAVE_PROFILER.stop("_gameover")
                     return False # Fim do jogo
-                    
+            timer.lap("obstacles")
+
         return True # O jogo continua
 
     def update_background(self):
@@ -126,23 +172,27 @@ class EndlessRunner:
             # As nuvens movem-se mais devagar para um efeito de paralaxe
             cloud.update(self.game_speed / 2)
             if cloud.x < -cloud.image.get_width():
-                cloud.x = SCREEN_WIDTH + random.randint(200, 500)
-                cloud.y = random.randint(50, 250)
+                cloud.x = SCREEN_WIDTH + self.rng.randint(200, 500)
+                cloud.y = self.rng.randint(50, 250)
 
     def draw(self):
-        """Desenha todos os elementos do jogo no ecrã."""
+        """Desenha todos os elementos do jogo no ecrã (interpolados, se motion.alpha < 1)."""
+        motion = self.motion
+        self.draw_timer.start()
         self.screen.fill((255, 255, 255))
         for cloud in self.clouds:
-            cloud.draw(self.screen)
+            cloud.draw(self.screen, motion.offset(cloud, (cloud.x, cloud.y)))
         
         # Desenha duas imagens do chão para criar um loop contínuo
         image_width = self.bg_image.get_width()
-        self.screen.blit(self.bg_image, (self.x_pos_bg, self.y_pos_bg))
-        self.screen.blit(self.bg_image, (self.x_pos_bg + image_width, self.y_pos_bg))
+        # O chão dá a volta ao chegar ao fim da imagem: o avanço é medido módulo a largura.
+        bg_x = self.x_pos_bg + (self.previous_x_pos_bg - self.x_pos_bg) % image_width * (1 - motion.alpha)
+        self.screen.blit(self.bg_image, (bg_x, self.y_pos_bg))
+        self.screen.blit(self.bg_image, (bg_x + image_width, self.y_pos_bg))
         
-        self.player.draw(self.screen)
+        self.player.draw(self.screen, motion.offset(self.player, self.player.dino_rect.topleft))
         for obstacle in self.obstacle_list:
-            obstacle.draw(self.screen)
+            obstacle.draw(self.screen, motion.offset(obstacle, obstacle.rect.topleft))
         
         # Comentado para a versão final, mas útil para depuração
         # player_hitbox_debug = self.player.dino_rect.inflate(-40, -20)
@@ -150,27 +200,104 @@ class EndlessRunner:
         # for obstacle in self.obstacle_list:
         #     pygame.draw.rect(self.screen, (0, 0, 255), obstacle.hitbox, 2)
 
+        self.draw_timer.lap("world")
+
         # Desenha a pontuação e o recorde
-        score_text = f"{self.score:05d}"
-        draw_message_component(score_text, self.screen, pos_x_center=1000, pos_y_center=50)
-        high_score_text = f"HI {self.high_score:05d}"
-        draw_message_component(high_score_text, self.screen, pos_x_center=800, pos_y_center=50)
+        score_text = self.score_hud.render("{:05d}", self.score)
+        self.screen.blit(score_text, score_text.get_rect(center=(1000, 50)))
+        high_score_text = self.high_score_hud.render("HI {:05d}", self.high_score)
+        self.screen.blit(high_score_text, high_score_text.get_rect(center=(800, 50)))
+
+        if self.settings.get("dirty_rects"):
+            self.track_dirty_rects()
+        self.draw_timer.lap("ui")
+
+    def track_dirty_rects(self):
+        """
+        Regista as regiões desenhadas neste frame: chão, nuvens, dinossauro, obstáculos e
+        pontuação. As entidades são desenhadas entre a posição do passo anterior e a atual
+        (ver render), por isso cada região cobre as duas.
+        """
+        motion = self.motion
+        self.dirty_rects.add((0, self.y_pos_bg, SCREEN_WIDTH, self.bg_image.get_height()))
+        for cloud in self.clouds:
+            rect = cloud.image.get_rect(topleft=(cloud.x, cloud.y))
+            self.dirty_rects.add(motion.swept_rect(cloud, rect.topleft, rect))
+        # A imagem desenhada (ex: a do salto) pode ser maior do que o dino_rect.
+        dino_rect = self.player.dino_rect
+        drawn = self.player.image.get_rect(topleft=dino_rect.topleft).union(dino_rect)
+        self.dirty_rects.add(motion.swept_rect(self.player, dino_rect.topleft, drawn))
+        for obstacle in self.obstacle_list:
+            self.dirty_rects.add(motion.swept_rect(obstacle, obstacle.rect.topleft, obstacle.rect))
+        self.dirty_rects.add(self.score_hud.surface.get_rect(center=(1000, 50)))
+        self.dirty_rects.add(self.high_score_hud.surface.get_rect(center=(800, 50)))
+
+    def get_dirty_rects(self):
+        """Retorna as regiões alteradas desde o último frame, ou None para atualizar o ecrã inteiro."""
+        return self.dirty_rects.collect()
+
+    def entity_counts(self):
+        """Número de entidades vivas de cada tipo (para o painel de perfil e os benchmarks)."""
+        return {"obstacles": len(self.obstacle_list), "clouds": len(self.clouds)}
+
+    def snapshot_state(self):
+        """
+        Estado completo da partida para um snapshot do replay (ver dino_runner/utils/replay.py):
+        o jogador, os obstáculos, as nuvens, a velocidade, o relógio e o gerador aleatório.
+        """
+        return {"attributes": {name: value for name, value in vars(self).items() if name not in self.SNAPSHOT_EXCLUDE}}
+
+    def restore_state(self, state):
+        """Repõe um estado de snapshot_state()."""
+        vars(self).update(state["attributes"])
+        self.dirty_rects.invalidate()
 
     def spawn_obstacle(self):
         """Escolhe e cria aleatoriamente um novo obstáculo (cacto ou pássaro)."""
-        if random.randint(0, 1) == 0:
-            self.obstacle_list.append(Cactus(self.assets))
+        if self.rng.randint(0, 1) == 0:
+            self.obstacle_list.append(Cactus(self.assets, self.rng))
         else:
-            self.obstacle_list.append(Bird(self.assets))
+            self.obstacle_list.append(Bird(self.assets, self.rng))
 
     def run(self, events):
         """
-        O método principal do modo de jogo, chamado a cada frame pelo GameController.
+        Um passo de simulação seguido do desenho do estado atual (sem interpolação).
         
         Returns:
             bool: True se o jogo deve continuar, False se for Game Over.
         """
+        is_running = self.step(events)
+        self.render(1.0)
+        return is_running
+
+    def step(self, events):
+        """
+        Avança a simulação um passo (1 / FPS segundos), sem desenhar. Chamado pelo ciclo
+        de passo fixo do GameController, uma ou mais vezes por frame desenhado.
+
+        Returns:
+            bool: True se o jogo deve continuar, False se for Game Over.
+        """
+        if WAVE_PROFILER.armed or WAVE_PROFILER.active:
+            WAVE_PROFILER.endless_step(self)
+        self.record_motion()
+        if not self.player.is_waiting:
+            self.clock.tick()
         self.handle_events(events)
-        is_running = self.update()
+        return self.update()
+
+    def render(self, alpha):
+        """Desenha o estado a uma fração 'alpha' (0 a 1) do caminho entre o passo anterior e o atual."""
+        self.motion.alpha = alpha
         self.draw()
-        return is_running
+
+    def record_motion(self):
+        """Guarda as posições atuais antes de um passo, para o desenho interpolado."""
+        motion = self.motion
+        motion.clear()
+        motion.record(self.player, self.player.dino_rect.topleft)
+        for obstacle in self.obstacle_list:
+            motion.record(obstacle, obstacle.rect.topleft)
+        for cloud in self.clouds:
+            motion.record(cloud, (cloud.x, cloud.y))
+        self.previous_x_pos_bg = self.x_pos_bg
@@ -20,42 +20,60 @@ from dino_runner.components.enemies.dino_run.bird2 import Bird2
 from dino_runner.components.weapons.bullet import Bullet
 from dino_runner.components.weapons.projectile import Projectile
 from dino_runner.components.weapons.enemy_projectile import EnemyProjectile
+from dino_runner.components.weapons.shard import Shard
+from dino_runner.components.weapons.projectile_buffer import ProjectileBuffer
 from dino_runner.components.weapons.pistol import Pistol
 from dino_runner.components.weapons.sword import Sword
-from dino_runner.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from dino_runner.components.enemies.kinematics import EnemyKinematics
+from dino_runner.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT, COLLISION_CELL_SIZE, ENEMY_KINEMATICS_STORE, OBJECT_POOL_MAX_SIZE
+from dino_runner.utils.glyph_atlas import get_atlas, HudText
+from dino_runner.utils.ui import RetainedScreen, hit_test
+from dino_runner.utils.dirty_rects import DirtyRectTracker
+from dino_runner.utils.interpolation import MotionHistory
+from dino_runner.utils.game_clock import GameClock
+from dino_runner.utils.input_source import LIVE_INPUT
+from dino_runner.utils.section_timer import SectionTimer
+from dino_runner.utils.frame_trace import TRACE
+from dino_runner.utils.wave_profiler import WAVE_PROFILER
+from dino_runner.utils.object_pool import ObjectPool, Poolable
+from dino_runner.utils.spatial_hash import SpatialHashGrid
+from dino_runner.utils.nearest_index import NearestIndex
 
 # --- Classes Auxiliares para Feedback Visual ---
 
-class DamageNumber(pygame.sprite.Sprite):
+class DamageNumber(Poolable, pygame.sprite.Sprite):
     """Representa um número de dano flutuante que aparece no ecrã."""
-    def __init__(self, x, y, damage, font):
+    COLOR = (255, 255, 0) # Amarelo para dano causado
+
+    def __init__(self, x, y, damage, font, clock):
         super().__init__()
+        self.reset(x, y, damage, font, clock)
+
+    def reset(self, x, y, damage, font, clock):
+        """(Re)inicia o número; é chamado pelo construtor e pela pool ao reutilizar o sprite."""
         display_damage = max(1, int(damage))
-        self.image = font.render(str(display_damage), True, (255, 255, 0)) # Amarelo para dano causado
+        # O número é composto pelo atlas de glifos da fonte (sem font.render por número).
+        self.image = get_atlas(font, self.COLOR).render(str(display_damage))
         self.rect = self.image.get_rect(center=(x, y))
-        self.creation_time = pygame.time.get_ticks()
+        self.clock = clock
+        self.creation_time = clock.get_ticks()
         self.duration = 500 # Meio segundo de vida
         self.y_velocity = -2 # Sobe lentamente
 
     def update(self):
         """Move o número para cima e remove-o após a sua duração."""
         self.rect.y += self.y_velocity
-        if pygame.time.get_ticks() - self.creation_time > self.duration:
+        if self.clock.get_ticks() - self.creation_time > self.duration:
             self.kill()
+            self.release()
 
 class PlayerDamageNumber(DamageNumber):
     """Um número de dano específico para quando o jogador é atingido, com cor vermelha."""
-    def __init__(self, x, y, damage, font):
-        super().__init__(x, y, damage, font)
-        display_damage = max(1, int(damage))
-        self.image = font.render(str(display_damage), True, (255, 50, 50))
+    COLOR = (255, 50, 50)
 
 class HealNumber(DamageNumber):
     """Um número flutuante para feedback de cura, com cor verde."""
-    def __init__(self, x, y, amount, font):
-        super().__init__(x, y, amount, font)
-        display_amount = max(1, int(amount))
-        self.image = font.render(str(display_amount), True, (50, 255, 50))
+    COLOR = (50, 255, 50)
 
 # --- Classe Principal do Modo de Jogo ---
 
@@ -64,9 +82,31 @@ class RogueliteMode:
     Controla todo o ciclo de jogo do modo Roguelite, incluindo a máquina de estados,
     a gestão de entidades, a interface do utilizador e a lógica de progressão.
     """
-    def __init__(self, screen, high_score, assets, sounds, settings):
+    # Atributos que ficam fora dos snapshots dos replays: recursos partilhados, fontes,
+    # caches do desenho e cronómetros, que o modo onde o snapshot é reposto já tem.
+    SNAPSHOT_EXCLUDE = frozenset({
+        "screen", "assets", "sounds", "settings", "input_source", "shake_rng",
+        "title_font", "body_font", "ui_font", "stats_font",
+        "hp_hud", "exp_hud", "skill_hud", "wave_hud", "score_hud", "highscore_hud",
+        "overlay_ui", "showing_overlay", "dirty_rects", "motion", "timer", "draw_timer",
+        "pools", "pool_marks", "pool_stats", "pool_stats_wave",
+    })
+
+    def __init__(self, screen, high_score, assets, sounds, settings, clock=None, input_source=None, seed=None):
         """Inicializa o modo de jogo, carregando assets e definindo o estado inicial."""
         self.screen = screen
+        # Gerador aleatório da partida (spawns, "Rage", Ground Slam, power-ups): com a mesma
+        # semente e o mesmo input a partida repete-se igual (ver dino_runner/utils/replay.py).
+        # Sem semente, é tirada do módulo random, que as simulações fixam com random.seed.
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.rng = random.Random(self.seed)
+        # O tremor do ecrã é sorteado em cada frame desenhado, cujo número depende da máquina:
+        # tem um gerador à parte para não desviar o da simulação.
+        self.shake_rng = random.Random()
+        # Relógio de todos os temporizadores do modo: só avança enquanto o jogo está a correr.
+        self.clock = clock if clock is not None else GameClock()
+        # Teclas e rato lidos a cada passo (o input real ou o de um bot, ver dino_runner/simulation).
+        self.input_source = input_source if input_source is not None else LIVE_INPUT
         self.initial_high_score = high_score
         self.assets = assets
         self.sounds = sounds
@@ -77,17 +117,59 @@ class RogueliteMode:
         self.body_font = self.assets.get_font("body")
         self.ui_font = self.assets.get_font("ui")
         self.stats_font = self.assets.get_font("stats")
+
+        # Textos do HUD compostos pelo atlas de glifos; só são recompostos quando o valor muda.
+        white_atlas = get_atlas(self.ui_font, (255, 255, 255))
+        self.hp_hud = HudText(white_atlas)
+        self.exp_hud = HudText(white_atlas)
+        self.skill_hud = HudText(get_atlas(self.ui_font, (0, 0, 0)))
+        self.wave_hud = HudText(white_atlas)
+        self.score_hud = HudText(white_atlas)
+        self.highscore_hud = HudText(get_atlas(self.ui_font, (255, 255, 0)))
+
+        # Ecrãs sobrepostos (cartas, pausa, game over) compostos uma vez e reutilizados.
+        self.overlay_ui = RetainedScreen()
+        self.showing_overlay = False
+        # Regiões alteradas em cada frame (usadas no modo de renderização por "dirty rects").
+        self.dirty_rects = DirtyRectTracker()
+        # Posições do passo de simulação anterior, para o desenho interpolado (ver render).
+        self.motion = MotionHistory()
+        # Grelha espacial dos inimigos, usada para as colisões com balas, espada e jogador.
+        self.enemy_grid = SpatialHashGrid(COLLISION_CELL_SIZE)
+        # Índice das posições dos inimigos para procurar o mais próximo (ricochete).
+        self.enemy_index = NearestIndex(COLLISION_CELL_SIZE)
+        # Movimento vetorizado dos inimigos (opcional, ver ENEMY_KINEMATICS_STORE).
+        self.enemy_kinematics = EnemyKinematics() if ENEMY_KINEMATICS_STORE else None
+        # Pools dos objetos de vida curta do combate: os objetos libertados são reutilizados
+        # pelo próximo acquire() em vez de serem criados de novo.
+        self.pools = [ObjectPool(cls, OBJECT_POOL_MAX_SIZE).install()
+                      for cls in (Bullet, EnemyProjectile, Shard, DamageNumber, PlayerDamageNumber, HealNumber)]
+        self.pool_marks = [0] * len(self.pools)
+        self.pool_stats, self.pool_stats_wave = [], 0 # Resumo da última wave acabada (ver update_pool_stats).
+        # Tempo por subsistema dentro do update e do desenho (desligados, exceto em simulações e perfis).
+        self.timer = SectionTimer(category="update")
+        self.draw_timer = SectionTimer(category="draw")
         
         self.reset()
 
     def reset(self):
         """Reseta todas as variáveis para iniciar uma nova partida."""
         self.running = True
-        self.player = RogueliteDino(self.assets, self.sounds)
+        # Os status das balas são da classe: sem isto, os power-ups passavam para a partida seguinte.
+        Bullet.reset_stats()
+        self.player = RogueliteDino(self.assets, self.sounds, self.clock, self.input_source)
         
         self.current_wave = 0
         self.wave_in_progress = False
-        self.enemies, self.projectiles, self.enemy_projectiles = [], [], []
+        self.enemies = []
+        if hasattr(self, 'projectiles'):
+            # Ao recomeçar, os objetos da partida anterior voltam às pools (senão ficavam "em uso" para sempre).
+            self.projectiles.clear()
+            self.enemy_projectiles.clear()
+            for number in self.damage_numbers:
+                number.release()
+            self.damage_numbers.empty()
+        self.projectiles, self.enemy_projectiles = ProjectileBuffer(), ProjectileBuffer()
         self.game_state = "CHOOSE_WEAPON"
         self.score = 0
         if not hasattr(self, 'high_score') or self.initial_high_score > self.high_score:
@@ -102,12 +184,12 @@ class RogueliteMode:
         self.game_over_buttons, self.pause_buttons = {}, {}
         self.powerup_card_rects, self.powerup_options = [], []
         self.selected_option_index = None
+        self.overlay_ui.invalidate()
         
         # Temporizadores
         self.last_boss_heal_feedback_time = 0
         self.last_player_hit_sound_time = 0
         self.player_hit_sound_cooldown = 500
-        self.pause_start_time = 0
 
         self.define_powerups()
         self.define_enemy_pools()
@@ -147,7 +229,7 @@ class RogueliteMode:
     def increase_bullet_speed(self): Bullet.BASE_SPEED *= 1.15
     def increase_bounces(self): Bullet.BASE_BOUNCES += 1
     def increase_sword_size(self):
-        if isinstance(self.player.weapon, Sword): self.player.weapon.size += 0.2
+        if isinstance(self.player.weapon, Sword): self.player.weapon.set_size(self.player.weapon.size + 0.2)
     def increase_damage(self):
         if isinstance(self.player.weapon, Pistol): Bullet.BASE_DAMAGE += 5
         elif isinstance(self.player.weapon, Sword): self.player.weapon.damage += 8
@@ -161,7 +243,6 @@ class RogueliteMode:
     def trigger_level_up(self):
         """Pausa o jogo e prepara as opções de power-up para o jogador escolher."""
         self.game_state = "LEVEL_UP"
-        self.pause_start_time = pygame.time.get_ticks()
         
         current_pool = self.powerup_pool[:]
         if isinstance(self.player.weapon, Pistol):
@@ -170,8 +251,9 @@ class RogueliteMode:
             current_pool.extend(self.warrior_powerups)
         
         num_samples = min(3, len(current_pool))
-        self.powerup_options = random.sample(current_pool, num_samples) if num_samples > 0 else []
+        self.powerup_options = self.rng.sample(current_pool, num_samples) if num_samples > 0 else []
         self.selected_option_index = None
+        TRACE.instant("level_up", level=self.player.level, wave=self.current_wave)
 
     def select_class(self, class_id):
         """Equipa a classe escolhida no jogador, definindo a sua arma e status iniciais."""
@@ -192,33 +274,53 @@ class RogueliteMode:
 
     def apply_powerup(self, index):
         """Aplica o efeito do power-up escolhido e despausa o jogo."""
-        paused_duration = pygame.time.get_ticks() - self.pause_start_time
-        self.player.last_special_ability_time += paused_duration
-        
         self.powerup_options[index]['effect']()
         self.game_state = "RUNNING"
         self.selected_option_index = None
 
     def run(self, events):
-        """O loop principal do modo de jogo, chamado a cada frame pelo GameController."""
+        """Um passo de simulação seguido do desenho do estado atual (sem interpolação)."""
+        running = self.step(events)
+        self.render(1.0)
+        return running
+
+    def step(self, events):
+        """
+        Avança a simulação um passo (1 / FPS segundos), sem desenhar. Chamado pelo ciclo
+        de passo fixo do GameController, uma ou mais vezes por frame desenhado.
+        """
+        self.record_motion()
+        if self.game_state == "RUNNING":
+            self.clock.tick()
         self.handle_events(events)
         if self.game_state == "RUNNING":
             self.update()
-        self.draw()
         return self.running
 
+    def render(self, alpha):
+        """Desenha o estado a uma fração 'alpha' (0 a 1) do caminho entre o passo anterior e o atual."""
+        self.motion.alpha = alpha
+        self.draw()
+
+    def record_motion(self):
+        """Guarda as posições atuais antes de um passo, para o desenho interpolado."""
+        # Os projéteis guardam a posição anterior no próprio ProjectileBuffer.
+        motion = self.motion
+        motion.clear()
+        motion.record(self.player, self.player.rect.topleft)
+        for enemy in self.enemies:
+            motion.record(enemy, enemy.rect.topleft)
+        for number in self.damage_numbers:
+            motion.record(number, number.rect.topleft)
+
     def handle_events(self, events):
         """Processa todos os inputs do jogador com base no estado atual do jogo."""
         for event in events:
-            if event.type == pygame.QUIT: self.running = False; pygame.quit(); exit()
-            
             if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                # Fora do estado "RUNNING" o relógio não avança: todos os temporizadores param.
                 if self.game_state == "RUNNING":
                     self.game_state = "PAUSED"
-                    self.pause_start_time = pygame.time.get_ticks()
                 elif self.game_state == "PAUSED":
-                    paused_duration = pygame.time.get_ticks() - self.pause_start_time
-                    self.player.last_special_ability_time += paused_duration
                     self.game_state = "RUNNING"
             
             if event.type == pygame.MOUSEBUTTONDOWN:
@@ -229,12 +331,15 @@ class RogueliteMode:
                 if self.game_state in ["CHOOSE_WEAPON", "LEVEL_UP"]:
                     self.handle_card_selection(pos)
                 elif self.game_state == "GAME_OVER":
-                    if 'restart' in self.game_over_buttons and self.game_over_buttons['restart'].collidepoint(pos): self.reset()
-                    if 'menu' in self.game_over_buttons and self.game_over_buttons['menu'].collidepoint(pos): self.running = "MENU"
+                    # Os retângulos vêm da última composição do ecrã (ver RetainedScreen).
+                    clicked = hit_test(self.game_over_buttons, pos)
+                    if clicked == 'restart': self.reset()
+                    elif clicked == 'menu': self.running = "MENU"
                 elif self.game_state == "PAUSED":
-                    if 'resume' in self.pause_buttons and self.pause_buttons['resume'].collidepoint(pos): self.game_state = "RUNNING"
-                    if 'restart' in self.pause_buttons and self.pause_buttons['restart'].collidepoint(pos): self.reset()
-                    if 'menu' in self.pause_buttons and self.pause_buttons['menu'].collidepoint(pos): self.running = "MENU"
+                    clicked = hit_test(self.pause_buttons, pos)
+                    if clicked == 'resume': self.game_state = "RUNNING"
+                    elif clicked == 'restart': self.reset()
+                    elif clicked == 'menu': self.running = "MENU"
                 elif self.game_state == "RUNNING" and not self.wave_in_progress and self.start_wave_button_rect:
                     if self.start_wave_button_rect.collidepoint(pos): self.start_next_wave()
 
@@ -251,111 +356,141 @@ class RogueliteMode:
 
     def update(self):
         """Atualiza a lógica de todos os elementos do jogo a cada frame."""
-        mouse_buttons = pygame.mouse.get_pressed()
+        timer = self.timer
+        timer.start()
+        mouse_buttons = self.input_source.get_mouse_buttons()
         if mouse_buttons[0] and self.game_state == "RUNNING":
             self.player.attack()
 
+        # A grelha é reconstruída a partir das posições no início do frame.
+        self.enemy_grid.rebuild(self.enemies)
+
         attack_result = self.player.update()
         if attack_result:
             if isinstance(attack_result, tuple) and attack_result[0] == "BULLET":
                 _, x, y, direction, is_frozen = attack_result
-                self.projectiles.append(Bullet(x, y, direction, self.assets, is_frozen))
-        
+                self.projectiles.append(Bullet.acquire(x, y, direction, self.assets, is_frozen))
+        timer.lap("player")
+
         if self.player.weapon and isinstance(self.player.weapon, Sword) and self.player.weapon.is_swinging:
             sword_hitbox = self.player.weapon.hitbox
             if sword_hitbox:
-                for enemy in self.enemies[:]:
-                    if enemy not in self.player.weapon.hit_enemies and sword_hitbox.colliderect(enemy.hitbox):
+                for enemy in self.enemy_grid.query_colliding(sword_hitbox):
+                    if enemy not in self.player.weapon.hit_enemies:
                         self.player.weapon.hit_enemies.add(enemy)
                         damage_dealt = self.player.weapon.damage
-                        self.damage_numbers.add(DamageNumber(enemy.rect.centerx, enemy.rect.top, damage_dealt, self.ui_font))
+                        self.damage_numbers.add(DamageNumber.acquire(enemy.rect.centerx, enemy.rect.top, damage_dealt, self.ui_font, self.clock))
                         heal_amount = damage_dealt * self.player.life_steal_percent
                         if heal_amount >= 1:
                             self.player.heal(heal_amount)
-                            self.damage_numbers.add(HealNumber(self.player.rect.centerx, self.player.rect.top, heal_amount, self.ui_font))
+                            self.damage_numbers.add(HealNumber.acquire(self.player.rect.centerx, self.player.rect.top, heal_amount, self.ui_font, self.clock))
                         if enemy.take_damage(damage_dealt):
                             self.handle_enemy_death(enemy)
+        timer.lap("sword_hits", "collision")
 
-        for enemy in self.enemies:
-            enemy.update(self.player, self.enemy_projectiles)
-            if self.player.hitbox.colliderect(enemy.hitbox):
-                damage_taken = 1
-                current_time = pygame.time.get_ticks()
-                if current_time - self.last_player_hit_sound_time > self.player_hit_sound_cooldown:
-                    self.sounds.play("player_hit")
-                    self.last_player_hit_sound_time = current_time
-                if self.player.take_damage(damage_taken):
-                    self.set_game_over(); return
-                self.damage_numbers.add(PlayerDamageNumber(self.player.rect.centerx, self.player.rect.top, damage_taken, self.ui_font))
-
-        for proj in self.projectiles[:]:
-            proj.update()
-            if not self.screen.get_rect().colliderect(proj.rect):
-                self.projectiles.remove(proj); continue
-            for enemy in self.enemies[:]:
-                if enemy.hitbox.colliderect(proj.hitbox):
-                    if proj.is_frozen:
-                        enemy.apply_slow(0.75, 2000)
-                    damage_dealt = proj.damage
-                    self.damage_numbers.add(DamageNumber(enemy.rect.centerx, enemy.rect.top, damage_dealt, self.ui_font))
-                    heal_amount = damage_dealt * self.player.life_steal_percent
-                    if heal_amount >= 1:
-                        self.player.heal(heal_amount)
-                        self.damage_numbers.add(HealNumber(self.player.rect.centerx, self.player.rect.top, heal_amount, self.ui_font))
-                    if enemy.take_damage(damage_dealt):
-                        self.handle_enemy_death(enemy)
-                    proj.pierce -= 1
-                    if proj.pierce <= 0:
-                        if proj.bounces_left > 0:
-                            proj.bounces_left -= 1
-                            proj.pierce = 1
-                            next_target = self.find_next_bounce_target(proj.rect.center, enemy)
-                            if next_target:
-                                new_dir = pygame.math.Vector2(next_target.rect.centerx - proj.rect.centerx, next_target.rect.centery - proj.rect.centery).normalize()
-                                proj.direction = new_dir
-                            else:
-                                if proj in self.projectiles: self.projectiles.remove(proj)
+        if self.enemy_kinematics:
+            self.enemy_kinematics.update(self.enemies, self.player, self.enemy_projectiles)
+            for enemy in self.enemies:
+                self.enemy_grid.update(enemy)
+        else:
+            for enemy in self.enemies:
+                enemy.update(self.player, self.enemy_projectiles)
+                self.enemy_grid.update(enemy)
+        self.enemy_index.rebuild(self.enemies)
+        timer.lap("enemies")
+
+        for enemy in self.enemy_grid.query_colliding(self.player.hitbox):
+            damage_taken = enemy.damage_scale # 1 de dano por passo em contacto, vezes a escala do inimigo
+            current_time = self.clock.get_ticks()
+            if current_time - self.last_player_hit_sound_time > self.player_hit_sound_cooldown:
+                self.sounds.play("player_hit")
+                self.last_player_hit_sound_time = current_time
+            if self.player.take_damage(damage_taken):
+                self.set_game_over(); return
+            self.damage_numbers.add(PlayerDamageNumber.acquire(self.player.rect.centerx, self.player.rect.top, damage_taken, self.ui_font, self.clock))
+        timer.lap("contact_hits", "collision")
+
+        # Todos os projéteis andam e saem do ecrã de uma vez; as colisões vêm a seguir, pela ordem de criação.
+        screen_rect = self.screen.get_rect()
+        self.projectiles.update(screen_rect)
+        timer.lap("projectiles_move")
+        for proj, hitbox in self.projectiles.iter_hitboxes():
+            for enemy in self.enemy_grid.query_colliding(hitbox):
+                if proj.is_frozen:
+                    enemy.apply_slow(0.75, 2000)
+                damage_dealt = proj.damage
+                self.damage_numbers.add(DamageNumber.acquire(enemy.rect.centerx, enemy.rect.top, damage_dealt, self.ui_font, self.clock))
+                heal_amount = damage_dealt * self.player.life_steal_percent
+                if heal_amount >= 1:
+                    self.player.heal(heal_amount)
+                    self.damage_numbers.add(HealNumber.acquire(self.player.rect.centerx, self.player.rect.top, heal_amount, self.ui_font, self.clock))
+                if enemy.take_damage(damage_dealt):
+                    self.handle_enemy_death(enemy)
+                proj.pierce -= 1
+                if proj.pierce <= 0:
+                    if proj.bounces_left > 0:
+                        proj.bounces_left -= 1
+                        proj.pierce = 1
+                        next_target = self.find_next_bounce_target(proj.rect.center, enemy)
+                        if next_target:
+                            new_dir = pygame.math.Vector2(next_target.rect.centerx - proj.rect.centerx, next_target.rect.centery - proj.rect.centery)
+                            # Com o alvo exatamente no centro da bala não há direção: mantém a atual.
+                            if new_dir.length_squared() > 0:
+                                proj.direction = new_dir.normalize()
                         else:
-                            if proj in self.projectiles: self.projectiles.remove(proj)
-                        break
-
-        for proj in self.enemy_projectiles[:]:
-            proj.update()
-            if not self.screen.get_rect().colliderect(proj.rect):
-                self.enemy_projectiles.remove(proj); continue
-            if self.player.hitbox.colliderect(proj.hitbox):
-                damage_taken = proj.damage
-                current_time = pygame.time.get_ticks()
-                if current_time - self.last_player_hit_sound_time > self.player_hit_sound_cooldown:
-                    self.sounds.play("player_hit")
-                    self.last_player_hit_sound_time = current_time
-                if self.player.take_damage(damage_taken):
-                    self.set_game_over()
-                if self.settings['shake']:
-                    self.screen_shake = self.shake_duration
-                self.damage_numbers.add(PlayerDamageNumber(self.player.rect.centerx, self.player.rect.top, damage_taken, self.ui_font))
-                self.enemy_projectiles.remove(proj)
+                            self.projectiles.kill(proj)
+                    else:
+                        self.projectiles.kill(proj)
+                    break
+        self.projectiles.compact()
+        timer.lap("projectile_hits", "collision")
+
+        self.enemy_projectiles.update(screen_rect)
+        timer.lap("enemy_projectiles_move")
+        for proj in self.enemy_projectiles.colliding(self.player.hitbox):
+            damage_taken = proj.damage
+            current_time = self.clock.get_ticks()
+            if current_time - self.last_player_hit_sound_time > self.player_hit_sound_cooldown:
+                self.sounds.play("player_hit")
+                self.last_player_hit_sound_time = current_time
+            if self.player.take_damage(damage_taken):
+                self.set_game_over()
+            if self.settings['shake']:
+                self.screen_shake = self.shake_duration
+            self.damage_numbers.add(PlayerDamageNumber.acquire(self.player.rect.centerx, self.player.rect.top, damage_taken, self.ui_font, self.clock))
+            self.enemy_projectiles.kill(proj)
+        self.enemy_projectiles.compact()
+        timer.lap("enemy_projectile_hits", "collision")
 
         self.damage_numbers.update()
         if self.screen_shake > 0:
             self.screen_shake -= 1
         
+        if WAVE_PROFILER.active:
+            WAVE_PROFILER.sample(sum(self.entity_counts().values()))
         if self.wave_in_progress and not self.enemies:
             self.wave_in_progress = False
             self.projectiles.clear()
             self.enemy_projectiles.clear()
-            
+            self.update_pool_stats()
+            WAVE_PROFILER.wave_finished()
+        timer.lap("effects")
+
+    def update_pool_stats(self):
+        """
+        Atualiza o resumo das pools mostrado no painel de perfil (F3): por classe, os objetos
+        criados desde o último resumo (a wave que acabou) e o pico de objetos em uso.
+        """
+        self.pool_stats = []
+        for i, pool in enumerate(self.pools):
+            stats = pool.stats()
+            self.pool_stats.append((pool.cls.__name__, stats["created"] - self.pool_marks[i], stats["high_water"]))
+            self.pool_marks[i] = stats["created"]
+        self.pool_stats_wave = self.current_wave
+
     def find_next_bounce_target(self, current_pos, last_hit_enemy):
         """Encontra o inimigo mais próximo para o projétil ricochetear."""
-        closest_enemy = None
-        min_dist = float('inf')
-        for enemy in self.enemies:
-            if enemy is not last_hit_enemy:
-                dist = pygame.math.Vector2(enemy.rect.center).distance_to(current_pos)
-                if dist < min_dist:
-                    min_dist = dist
-                    closest_enemy = enemy
-        return closest_enemy
+        return self.enemy_index.nearest(current_pos[0], current_pos[1], exclude=(last_hit_enemy,))
 
     def handle_enemy_death(self, enemy):
         """Gereia a lógica de quando um inimigo é derrotado (score, exp, recompensa)."""
@@ -367,45 +502,138 @@ class RogueliteMode:
             self.player.speed += 5
         if enemy in self.enemies:
             self.enemies.remove(enemy)
+        self.enemy_grid.remove(enemy)
+        self.enemy_index.remove(enemy)
             
     def set_game_over(self):
         """Ativa o estado de Game Over e atualiza o recorde."""
         self.game_state = "GAME_OVER"
         if self.score > self.high_score: self.high_score = self.score
         print(f"Game Over! Pontuação final: {self.score}")
+        TRACE.instant("game_over", mode="roguelite", wave=self.current_wave, score=self.score)
+        WAVE_PROFILER.wave_finished(game_over=True)
 
     def draw(self):
         """Desenha todos os elementos no ecrã com base no estado do jogo."""
+        # Nos ecrãs sobrepostos o jogo está parado: a composição (fundo + interface) é feita
+        # uma vez e só é refeita quando o estado ou a carta selecionada mudam.
+        self.draw_timer.start()
+        if self.game_state in ("CHOOSE_WEAPON", "LEVEL_UP", "PAUSED", "GAME_OVER"):
+            overlay_key = (self.game_state, self.selected_option_index)
+            if self.overlay_ui.draw(self.screen, overlay_key, self.draw_overlay_screen):
+                self.dirty_rects.invalidate() # Recomposto: envia o ecrã inteiro uma vez.
+            self.showing_overlay = True
+            self.draw_timer.lap("ui")
+            return
+        if self.showing_overlay:
+            # Ao sair de um ecrã sobreposto, o primeiro frame do jogo tem de cobrir tudo.
+            self.showing_overlay = False
+            self.overlay_ui.invalidate()
+            self.dirty_rects.invalidate()
+
         render_offset = [0, 0]
         if self.screen_shake > 0 and self.game_state == "RUNNING":
-            render_offset[0] = random.randint(-5, 5)
-            render_offset[1] = random.randint(-5, 5)
+            render_offset[0] = self.shake_rng.randint(-5, 5)
+            render_offset[1] = self.shake_rng.randint(-5, 5)
+            # Com o ecrã a tremer tudo se move: volta a enviar o ecrã inteiro.
+            self.dirty_rects.invalidate()
 
-        if self.game_state != "CHOOSE_WEAPON":
-            self.screen.fill((128, 128, 128))
-            self.player.draw(self.screen, render_offset)
-            for enemy in self.enemies: enemy.draw(self.screen, render_offset)
-            for proj in self.projectiles: proj.draw(self.screen, render_offset)
-            for proj in self.enemy_projectiles: proj.draw(self.screen, render_offset)
-            if self.player.weapon and isinstance(self.player.weapon, Sword):
-                self.player.weapon.draw(self.screen, render_offset)
-            for number in self.damage_numbers:
-                self.screen.blit(number.image, (number.rect.x + render_offset[0], number.rect.y + render_offset[1]))
-            self.draw_ui()
+        self.draw_world(render_offset)
 
         if self.game_state == "RUNNING" and not self.wave_in_progress:
             self.draw_start_wave_button()
-        
+            if self.settings.get("dirty_rects"):
+                self.dirty_rects.add(self.start_wave_button_rect)
+            self.draw_timer.lap("ui")
+
+    def draw_overlay_screen(self):
+        """Desenha o ecrã sobreposto do estado atual, com o jogo congelado por baixo."""
         if self.game_state == "CHOOSE_WEAPON":
             self.screen.fill((128, 128, 128))
             self.draw_class_choice_screen()
-        elif self.game_state == "LEVEL_UP":
+            return
+
+        self.draw_world([0, 0])
+        if self.game_state == "LEVEL_UP":
             self.draw_level_up_screen()
         elif self.game_state == "PAUSED":
             self.draw_pause_screen()
         elif self.game_state == "GAME_OVER":
             self.draw_game_over_screen()
 
+    def draw_world(self, render_offset):
+        """Desenha o jogador, os inimigos, os projéteis, os números de dano e o HUD."""
+        motion = self.motion
+        self.screen.fill((128, 128, 128))
+        player_offset = motion.offset(self.player, self.player.rect.topleft, render_offset)
+        self.player.draw(self.screen, player_offset)
+        for enemy in self.enemies: enemy.draw(self.screen, motion.offset(enemy, enemy.rect.topleft, render_offset))
+        self.projectiles.draw(self.screen, render_offset, motion.alpha)
+        self.enemy_projectiles.draw(self.screen, render_offset, motion.alpha)
+        if self.player.weapon and isinstance(self.player.weapon, Sword):
+            # O golpe acompanha o jogador.
+            self.player.weapon.draw(self.screen, player_offset)
+        for number in self.damage_numbers:
+            offset = motion.offset(number, number.rect.topleft, render_offset)
+            self.screen.blit(number.image, (number.rect.x + offset[0], number.rect.y + offset[1]))
+        self.draw_timer.lap("world")
+        self.draw_ui()
+        self.draw_timer.lap("ui")
+
+        if self.settings.get("dirty_rects"):
+            self.track_dirty_rects()
+
+    def track_dirty_rects(self):
+        """
+        Regista as regiões desenhadas neste frame (entidades, efeitos e HUD). As entidades
+        são desenhadas entre a posição do passo anterior e a atual (ver render), por isso
+        cada região cobre as duas.
+        """
+        motion = self.motion
+        player_position = self.player.rect.topleft
+        self.dirty_rects.add(motion.swept_rect(self.player, player_position, self.player.rect))
+        for enemy in self.enemies:
+            # Inclui a barra de vida, desenhada logo abaixo do inimigo.
+            rect = (enemy.rect.x, enemy.rect.y, enemy.rect.width, enemy.rect.height + 10)
+            self.dirty_rects.add(motion.swept_rect(enemy, enemy.rect.topleft, rect))
+        for rect in self.projectiles.swept_rects(): self.dirty_rects.add(rect)
+        for rect in self.enemy_projectiles.swept_rects(): self.dirty_rects.add(rect)
+        if isinstance(self.player.weapon, Sword) and self.player.weapon.is_swinging:
+            # O golpe é desenhado com o deslocamento do jogador.
+            self.dirty_rects.add(motion.swept_rect(self.player, player_position, self.player.weapon.slash_rect))
+        for number in self.damage_numbers:
+            self.dirty_rects.add(motion.swept_rect(number, number.rect.topleft, number.rect))
+        # Áreas fixas do HUD: barras à esquerda e textos à direita.
+        self.dirty_rects.add((10, 10, 200, 80))
+        self.dirty_rects.add((SCREEN_WIDTH - 310, 10, 300, 60))
+
+    def get_dirty_rects(self):
+        """Retorna as regiões alteradas desde o último frame, ou None para atualizar o ecrã inteiro."""
+        return self.dirty_rects.collect()
+
+    def entity_counts(self):
+        """Número de entidades vivas de cada tipo (para o painel de perfil e os benchmarks)."""
+        return {"enemies": len(self.enemies), "projectiles": len(self.projectiles),
+                "enemy_projectiles": len(self.enemy_projectiles), "damage_numbers": len(self.damage_numbers)}
+
+    def snapshot_state(self):
+        """
+        Estado completo da partida para um snapshot do replay (ver dino_runner/utils/replay.py):
+        os atributos do modo (jogador, inimigos, projéteis, relógio, gerador aleatório...) e
+        os status das balas, que são da classe Bullet.
+        """
+        attributes = {name: value for name, value in vars(self).items() if name not in self.SNAPSHOT_EXCLUDE}
+        bullet_stats = {name: getattr(Bullet, name) for name in Bullet.DEFAULT_STATS}
+        return {"attributes": attributes, "bullet_stats": bullet_stats}
+
+    def restore_state(self, state):
+        """Repõe um estado de snapshot_state(); os ecrãs compostos são refeitos no próximo desenho."""
+        vars(self).update(state["attributes"])
+        for name, value in state["bullet_stats"].items():
+            setattr(Bullet, name, value)
+        self.overlay_ui.invalidate()
+        self.dirty_rects.invalidate()
+
     def draw_start_wave_button(self):
         """Desenha o botão para iniciar a próxima onda."""
         button_text = self.title_font.render(f"Iniciar Wave ({self.current_wave + 1})", True, (255, 255, 255))
@@ -514,31 +742,34 @@ class RogueliteMode:
         health_ratio = self.player.health / self.player.max_health if self.player.max_health > 0 else 0
         hp_bar_rect_fg = pygame.Rect(10, 10, 200 * health_ratio, 25)
         pygame.draw.rect(self.screen, (180, 0, 0), hp_bar_rect_bg); pygame.draw.rect(self.screen, (0, 200, 0), hp_bar_rect_fg)
-        hp_text = self.ui_font.render(f"HP: {int(self.player.health)}/{self.player.max_health}", True, (255, 255, 255)); self.screen.blit(hp_text, hp_text.get_rect(center=hp_bar_rect_bg.center))
+        hp_text = self.hp_hud.render("HP: {}/{}", int(self.player.health), self.player.max_health); self.screen.blit(hp_text, hp_text.get_rect(center=hp_bar_rect_bg.center))
         
         exp_bar_rect_bg = pygame.Rect(10, 40, 200, 25)
         exp_ratio = self.player.exp / self.player.exp_to_next_level if self.player.exp_to_next_level > 0 else 0
         exp_bar_rect_fg = pygame.Rect(10, 40, 200 * exp_ratio, 25)
         pygame.draw.rect(self.screen, (50, 50, 50), exp_bar_rect_bg); pygame.draw.rect(self.screen, (50, 150, 255), exp_bar_rect_fg)
-        exp_text = self.ui_font.render(f"EXP: {self.player.exp}/{self.player.exp_to_next_level}", True, (255, 255, 255)); self.screen.blit(exp_text, exp_text.get_rect(center=exp_bar_rect_bg.center))
+        exp_text = self.exp_hud.render("EXP: {}/{}", self.player.exp, self.player.exp_to_next_level); self.screen.blit(exp_text, exp_text.get_rect(center=exp_bar_rect_bg.center))
         
         skill_bar_bg = pygame.Rect(10, 70, 200, 20)
-        elapsed_time = pygame.time.get_ticks() - self.player.last_special_ability_time
+        elapsed_time = self.clock.get_ticks() - self.player.last_special_ability_time
         cooldown_ratio = min(1.0, elapsed_time / self.player.special_ability_cooldown)
         skill_bar_fg = pygame.Rect(10, 70, 200 * cooldown_ratio, 20)
         pygame.draw.rect(self.screen, (80, 80, 80), skill_bar_bg); pygame.draw.rect(self.screen, (255, 215, 0), skill_bar_fg)
         if cooldown_ratio < 1.0:
             remaining_seconds = (self.player.special_ability_cooldown - elapsed_time) / 1000
-            skill_text = self.ui_font.render(f"Skill: {remaining_seconds:.1f}s", True, (0, 0, 0))
+            skill_text = self.skill_hud.render("Skill: {:.1f}s", remaining_seconds)
         else:
-            skill_text = self.ui_font.render("Skill: PRONTO!", True, (0, 0, 0))
+            skill_text = self.skill_hud.render("Skill: PRONTO!")
         self.screen.blit(skill_text, skill_text.get_rect(center=skill_bar_bg.center))
 
-        wave_text = self.ui_font.render(f"Wave: {self.current_wave}", True, (255, 255, 255)); score_text = self.ui_font.render(f"Score: {self.score}", True, (255, 255, 255)); highscore_text = self.ui_font.render(f"Recorde: {self.high_score}", True, (255, 255, 0))
+        wave_text = self.wave_hud.render("Wave: {}", self.current_wave); score_text = self.score_hud.render("Score: {}", self.score); highscore_text = self.highscore_hud.render("Recorde: {}", self.high_score)
         self.screen.blit(wave_text, wave_text.get_rect(topright=(SCREEN_WIDTH - 10, 10))); self.screen.blit(score_text, score_text.get_rect(topright=(SCREEN_WIDTH - 10, 30))); self.screen.blit(highscore_text, highscore_text.get_rect(topright=(SCREEN_WIDTH - 10, 50)))
 
     def start_next_wave(self):
-        self.current_wave += 1; self.wave_in_progress = True; self.spawn_enemies_for_wave()
+        self.current_wave += 1; self.wave_in_progress = True
+        WAVE_PROFILER.wave_started(self.current_wave, "warrior" if isinstance(self.player.weapon, Sword) else "mage")
+        self.spawn_enemies_for_wave()
+        TRACE.instant("wave_start", wave=self.current_wave, enemies=len(self.enemies))
     
     def spawn_enemies_for_wave(self):
         """Cria os inimigos para a wave atual com estrutura progressiva."""
@@ -547,7 +778,7 @@ class RogueliteMode:
         boss_class = self.sword_boss if isinstance(self.player.weapon, Sword) else self.pistol_boss
 
         if self.current_wave == 10:
-            self.enemies.append(boss_class(SCREEN_WIDTH / 2, -100, self.assets, is_boss=True)); return
+            self.enemies.append(boss_class(SCREEN_WIDTH / 2, -100, self.assets, is_boss=True, clock=self.clock, rng=self.rng)); return
 
         num_enemies = 3 + self.current_wave
         enemy_class_to_spawn = None
@@ -556,11 +787,12 @@ class RogueliteMode:
             if enemy_index < len(enemy_pool):
                 enemy_class_to_spawn = enemy_pool[enemy_index]
         
+        rng = self.rng
         for _ in range(num_enemies):
-            chosen_class = enemy_class_to_spawn or random.choice(enemy_pool)
-            edge = random.choice(['left', 'right', 'top', 'bottom'])
-            if edge == 'left': x, y = random.randint(-150, -50), random.randint(0, SCREEN_HEIGHT)
-            elif edge == 'right': x, y = random.randint(SCREEN_WIDTH + 50, SCREEN_WIDTH + 150), random.randint(0, SCREEN_HEIGHT)
-            elif edge == 'top': x, y = random.randint(0, SCREEN_WIDTH), random.randint(-150, -50)
-            else: x, y = random.randint(0, SCREEN_WIDTH), random.randint(SCREEN_HEIGHT + 50, SCREEN_HEIGHT + 150)
-            self.enemies.append(chosen_class(x, y, self.assets))
+            chosen_class = enemy_class_to_spawn or rng.choice(enemy_pool)
+            edge = rng.choice(['left', 'right', 'top', 'bottom'])
+            if edge == 'left': x, y = rng.randint(-150, -50), rng.randint(0, SCREEN_HEIGHT)
+            elif edge == 'right': x, y = rng.randint(SCREEN_WIDTH + 50, SCREEN_WIDTH + 150), rng.randint(0, SCREEN_HEIGHT)
+            elif edge == 'top': x, y = rng.randint(0, SCREEN_WIDTH), rng.randint(-150, -50)
+            else: x, y = rng.randint(0, SCREEN_WIDTH), rng.randint(SCREEN_HEIGHT + 50, SCREEN_HEIGHT + 150)
+            self.enemies.append(chosen_class(x, y, self.assets, clock=self.clock, rng=rng))
@@ -4,13 +4,14 @@ import random
 from dino_runner.components.obstacles.obstacle import Obstacle
 
 class Bird(Obstacle):
-    def __init__(self, assets):
+    def __init__(self, assets, rng=None):
+        rng = rng if rng is not None else random
         bird_images = assets.get_image("BIRD")
         # O 'type' é usado apenas para a imagem inicial
         super().__init__(assets, bird_images, 0)
         
         # CORREÇÃO: O pássaro agora pode aparecer em duas alturas diferentes.
-        self.rect.y = random.choice([250, 300])
+        self.rect.y = rng.choice([250, 300])
         
         # CORREÇÃO: Cria uma hitbox personalizada e mais justa para o pássaro.
         self.hitbox = self.rect.inflate(-20, -20)
@@ -25,7 +26,7 @@ class Bird(Obstacle):
         # Chama o update da classe pai para mover o obstáculo e a hitbox.
         super().update(game_speed, obstacle_list)
 
-    def draw(self, screen):
+    def draw(self, screen, offset=[0, 0]):
         """Desenha o frame de animação atual do pássaro."""
         # O método draw agora apenas desenha a imagem do frame correto.
-        screen.blit(self.image[int(self.image_index)], self.rect)
\ No newline at end of file
+        screen.blit(self.image[int(self.image_index)], (self.rect.x + offset[0], self.rect.y + offset[1]))
\ No newline at end of file
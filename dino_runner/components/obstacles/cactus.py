@@ -5,17 +5,18 @@ from dino_runner.components.obstacles.obstacle import Obstacle
 
 
 class Cactus(Obstacle):
-    def __init__(self, assets):
+    def __init__(self, assets, rng=None):
+        rng = rng if rng is not None else random
         large_cactus_images = assets.get_image("LARGE_CACTUS")
         small_cactus_images = assets.get_image("SMALL_CACTUS")
         
-        if random.randint(0, 1) == 0:
+        if rng.randint(0, 1) == 0:
             image_list = small_cactus_images
         else:
             image_list = large_cactus_images
         
         # A chamada super() agora passa 'assets'
-        super().__init__(assets, image_list, random.randint(0, 2))
+        super().__init__(assets, image_list, rng.randint(0, 2))
         
         if image_list == small_cactus_images:
             self.rect.y = 325
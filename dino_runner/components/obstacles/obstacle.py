@@ -20,5 +20,5 @@ class Obstacle:
         if self.rect.x < -self.rect.width:
             obstacle_list.pop()
 
-    def draw(self, screen):
-        screen.blit(self.image[self.type], self.rect)
\ No newline at end of file
+    def draw(self, screen, offset=[0, 0]):
+        screen.blit(self.image[self.type], (self.rect.x + offset[0], self.rect.y + offset[1]))
\ No newline at end of file
@@ -11,9 +11,19 @@ class Bullet(Projectile):
     BASE_PIERCE = 1
     BASE_SPEED = 15.0
     BASE_BOUNCES = 0
+    # Valores iniciais dos BASE_* (os power-ups alteram-nos), repostos no início de cada partida.
+    DEFAULT_STATS = {"BASE_DAMAGE": BASE_DAMAGE, "BASE_PIERCE": BASE_PIERCE,
+                     "BASE_SPEED": BASE_SPEED, "BASE_BOUNCES": BASE_BOUNCES}
+
+    SIZE = (30, 30)
+    FROZEN_TINT = (50, 50, 200)
 
     # CORREÇÃO: O __init__ agora aceita o parâmetro 'is_frozen'.
     def __init__(self, x, y, direction, assets, is_frozen=False):
+        self.reset(x, y, direction, assets, is_frozen)
+
+    def reset(self, x, y, direction, assets, is_frozen=False):
+        """(Re)inicia a bala com os valores base atuais; usado pelo construtor e pela pool."""
         damage = Bullet.BASE_DAMAGE
         speed = Bullet.BASE_SPEED
         pierce = Bullet.BASE_PIERCE
@@ -21,27 +31,31 @@ class Bullet(Projectile):
         self.is_frozen = is_frozen
         self.bounces_left = Bullet.BASE_BOUNCES
         
-        image = assets.get_image("BULLET")
-        super().__init__(x, y, image, damage, speed, direction, pierce)
-        
-        base_image = pygame.transform.scale(self.image, (30, 30))
-        base_image = pygame.transform.rotate(base_image, 90)
-
-        # Se o tiro for congelante, aplica um filtro azul
-        if self.is_frozen:
-            blue_tint = base_image.copy()
-            blue_tint.fill((50, 50, 200), special_flags=pygame.BLEND_RGB_ADD)
-            base_image = blue_tint
+        image = assets.get_scaled("BULLET", Bullet.SIZE)
+        super().reset(x, y, image, damage, speed, direction, pierce)
 
+        # A imagem rodada vem do cache de rotações: só é calculada uma vez por ângulo.
+        tint = Bullet.FROZEN_TINT if self.is_frozen else None
         angle = math.degrees(math.atan2(-self.direction.y, self.direction.x))
-        self.image = pygame.transform.rotate(base_image, angle)
-        self.rect = self.image.get_rect(center=(x, y))
-        self.hitbox = self.rect.inflate(-20, -20)
+        self.image = assets.rotations.get(("BULLET", Bullet.SIZE, tint), angle, Bullet.build_base_image, self.image, tint)
+        self.rect = self.centered_rect(self.rect, self.image, (x, y))
+        self.hitbox = self.centered_rect(self.hitbox, self.image, (x, y))
+        self.hitbox.inflate_ip(-20, -20)
+
+    @classmethod
+    def reset_stats(cls):
+        """Repõe o dano, a perfuração, a velocidade e os ricochetes base das balas."""
+        for name, value in cls.DEFAULT_STATS.items():
+            setattr(cls, name, value)
 
-    
-    
+    @staticmethod
+    def build_base_image(image, tint):
+        """Cria a imagem base (apontada para a direita) a partir da qual as rotações são calculadas."""
+        base_image = pygame.transform.rotate(image, 90)
 
-    def update(self):
-       super().update()
-       # Garante que a hitbox se move juntamente com a imagem
-       self.hitbox.center = self.rect.center
+        # Se o tiro for congelante, aplica um filtro azul
+        if tint:
+            blue_tint = base_image.copy()
+            blue_tint.fill(tint, special_flags=pygame.BLEND_RGB_ADD)
+            base_image = blue_tint
+        return base_image
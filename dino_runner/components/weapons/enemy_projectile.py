@@ -1,18 +1,19 @@
-import pygame
 from dino_runner.components.weapons.projectile import Projectile
 
 class EnemyProjectile(Projectile):
-    def __init__(self, x, y, direction, assets):
-        # Atributos do projétil inimigo
-        damage = 10 # Dano fixo por enquanto
+    BASE_DAMAGE = 10
+
+    def __init__(self, x, y, direction, assets, damage_scale=1):
+        self.reset(x, y, direction, assets, damage_scale)
+
+    def reset(self, x, y, direction, assets, damage_scale=1):
+        # Atributos do projétil inimigo (o dano escala com o damage_scale de quem dispara)
+        damage = round(self.BASE_DAMAGE * damage_scale)
         speed = 5   # Mais lento que o do jogador
         pierce = 1  # Não atravessa
         
-        # Pega a imagem do AssetManager
-        image = assets.get_image("ENEMY_BULLET")
-        
-        # Redimensiona para um tamanho adequado
-        scaled_image = pygame.transform.scale(image, (15, 15))
+        # Pega a imagem já redimensionada (e partilhada) do AssetManager
+        scaled_image = assets.get_scaled("ENEMY_BULLET", (15, 15))
         
-        # Chama o construtor da classe pai (Projectile)
-        super().__init__(x, y, scaled_image, damage, speed, direction, pierce)
+        # Inicia a parte comum a todos os projéteis (Projectile)
+        super().reset(x, y, scaled_image, damage, speed, direction, pierce)
@@ -16,7 +16,7 @@ class Pistol(Weapon):
 
     def attack(self):
         """Inicia a sequência de ataque em rajada."""
-        current_time = pygame.time.get_ticks()
+        current_time = self.player.clock.get_ticks()
         if current_time - self.last_attack_time >= self.attack_cooldown:
             self.last_attack_time = current_time
             self.shots_to_fire = self.player.shot_quantity
@@ -24,7 +24,7 @@ class Pistol(Weapon):
     def update(self):
         """Verifica se deve disparar um tiro da rajada e retorna o projétil."""
         if self.shots_to_fire > 0:
-            current_time = pygame.time.get_ticks()
+            current_time = self.player.clock.get_ticks()
             if current_time - self.last_burst_shot_time > self.time_between_shots:
                 self.last_burst_shot_time = current_time
                 self.shots_to_fire -= 1
@@ -33,7 +33,7 @@ class Pistol(Weapon):
 
     def fire_bullet(self):
         """Cria e retorna as informações de uma bala."""
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = self.player.input_source.get_mouse_pos()
         player_pos = self.player.rect.center
         direction = pygame.math.Vector2(mouse_pos[0] - player_pos[0], mouse_pos[1] - player_pos[1]).normalize()
         
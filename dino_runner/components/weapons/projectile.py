@@ -1,20 +1,98 @@
-class Projectile:
+import pygame
+from dino_runner.components.weapons.projectile_buffer import BufferField
+from dino_runner.utils.object_pool import Poolable
+
+class Projectile(Poolable):
+    # Dentro de um ProjectileBuffer estes atributos vivem nos arrays do buffer
+    # (o objeto passa a ser uma vista sobre a sua posição 'slot').
+    damage = BufferField("damage", int)
+    speed = BufferField("speed", float)
+    pierce = BufferField("pierce", int)
+    bounces_left = BufferField("bounces", int, default=0)
+    is_frozen = BufferField("frozen", bool, default=False)
+    buffer = None
+    slot = -1
+
     def __init__(self, x, y, image, damage, speed, direction, pierce):
+        self.reset(x, y, image, damage, speed, direction, pierce)
+
+    def reset(self, x, y, image, damage, speed, direction, pierce):
+        """(Re)inicia o projétil; é chamado pelo construtor e pela pool ao reutilizar o objeto."""
         self.image = image
-        self.rect = self.image.get_rect(center=(x, y))
+        self.rect = self.centered_rect(self.__dict__.get("_rect"), image, (x, y))
         # CORREÇÃO: Garante que TODOS os projéteis têm uma hitbox por padrão.
-        self.hitbox = self.rect.copy()
-        
+        self.hitbox = self.centered_rect(self.__dict__.get("_hitbox"), image, (x, y))
+
         self.damage = damage
         self.speed = speed
         self.direction = direction
         self.pierce = pierce
 
+    @staticmethod
+    def centered_rect(rect, image, center):
+        """Dá a 'rect' o tamanho da imagem, centrado em 'center' (cria um Rect se 'rect' for None)."""
+        if rect is None:
+            return image.get_rect(center=center)
+        rect.size = image.get_size()
+        rect.center = center
+        return rect
+
+    # Num ProjectileBuffer, rect e hitbox são retângulos novos calculados a partir dos
+    # arrays: alterá-los (ex: self.rect.x += 5) não move o projétil. Para o mover usa-se
+    # update() ou set_center(), que escrevem no buffer.
+    @property
+    def rect(self):
+        if self.buffer is None:
+            return self._rect
+        return self.buffer.rect_at(self.slot)
+
+    @rect.setter
+    def rect(self, value):
+        self._rect = value
+
+    @property
+    def hitbox(self):
+        if self.buffer is None:
+            return self._hitbox
+        return self.buffer.hitbox_at(self.slot)
+
+    @hitbox.setter
+    def hitbox(self, value):
+        self._hitbox = value
+
+    @property
+    def direction(self):
+        if self.buffer is None:
+            return self._direction
+        return pygame.math.Vector2(float(self.buffer.vx[self.slot]), float(self.buffer.vy[self.slot]))
+
+    @direction.setter
+    def direction(self, value):
+        if self.buffer is None:
+            self._direction = value
+        else:
+            self.buffer.vx[self.slot], self.buffer.vy[self.slot] = value.x, value.y
+
     def update(self):
+        """
+        Move o projétil um frame. Num ProjectileBuffer o movimento é escrito nos arrays
+        (normalmente o buffer move todos de uma vez em ProjectileBuffer.update).
+        """
+        if self.buffer is not None:
+            self.buffer.move_slot(self.slot)
+            return
         self.rect.x += self.direction.x * self.speed
         self.rect.y += self.direction.y * self.speed
         # Garante que a hitbox se move juntamente com a imagem
         self.hitbox.center = self.rect.center
 
+    def set_center(self, center):
+        """Põe o centro do projétil (imagem e hitbox) em 'center', dentro ou fora de um buffer."""
+        if self.buffer is not None:
+            self.buffer.set_center(self.slot, center)
+            return
+        self.rect.center = center
+        self.hitbox.center = self.rect.center
+
     def draw(self, screen, offset=[0, 0]):
         screen.blit(self.image, (self.rect.x + offset[0], self.rect.y + offset[1]))
\ No newline at end of file
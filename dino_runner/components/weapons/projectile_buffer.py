@@ -0,0 +1,298 @@
+# Ficheiro: dino_runner/components/weapons/projectile_buffer.py
+# Descrição: Guarda os projéteis do modo Roguelite em arrays (NumPy): posição, velocidade,
+#            dano, perfuração, ricochetes, congelamento e imagem de todos os projéteis.
+#            O movimento, o corte fora do ecrã e a compactação são feitos em bloco, uma
+#            vez por frame, em vez de um update() e de um list.remove por projétil.
+
+import numpy as np
+import pygame
+from dino_runner.utils.array_math import round_like_rect
+
+class BufferField:
+    """
+    Atributo de um projétil que, enquanto ele está num ProjectileBuffer, vive num array do buffer.
+
+    Fora de um buffer (antes de ser acrescentado ou depois de sair) o valor fica no próprio
+    objeto, por isso as subclasses podem definir estes atributos no __init__ como sempre.
+    """
+    def __init__(self, array_name, cast, default=None):
+        self.array_name = array_name
+        self.cast = cast
+        self.default = default
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        buffer = obj.buffer
+        if buffer is None:
+            return obj.__dict__.get(self.name, self.default)
+        return self.cast(getattr(buffer, self.array_name)[obj.slot])
+
+    def __set__(self, obj, value):
+        buffer = obj.buffer
+        if buffer is None:
+            obj.__dict__[self.name] = value
+        else:
+            getattr(buffer, self.array_name)[obj.slot] = value
+
+class ProjectileBuffer:
+    """
+    Uma lista de projéteis com os dados guardados em "estrutura de arrays".
+
+    Comporta-se como a lista que substitui (append, extend, clear, len, iteração pela ordem
+    de criação). Cada projétil acrescentado passa a ser uma vista sobre a sua posição
+    ('slot') nos arrays: ler ou alterar proj.damage, proj.pierce, proj.direction, etc.
+    lê ou altera o array. proj.rect e proj.hitbox devolvem retângulos novos, calculados
+    a partir dos arrays; alterá-los não move o projétil (proj.update() e proj.set_center()
+    escrevem no buffer).
+
+    Os projéteis mortos (kill) ficam marcados até à próxima compactação, que os retira de
+    uma só vez sem mudar a ordem dos restantes e devolve às suas pools os que vieram de uma.
+    """
+    def __init__(self, capacity=64):
+        self.items = []
+        self.count = 0
+        self.sprites = []     # id da imagem -> Surface
+        self.sprite_ids = {}  # Surface -> id da imagem
+        self.probe = pygame.Rect(0, 0, 0, 0) # hitbox reutilizada por iter_hitboxes
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        """Cria (ou aumenta) os arrays, mantendo os projéteis que já lá estão."""
+        n = self.count
+        def grow(name, dtype):
+            array = np.zeros(capacity, dtype=dtype)
+            if n:
+                array[:n] = getattr(self, name)[:n]
+            setattr(self, name, array)
+        # Retângulo da imagem (canto superior esquerdo e tamanho) e posição antes do último update.
+        grow("x", np.int64); grow("y", np.int64)
+        grow("prev_x", np.int64); grow("prev_y", np.int64)
+        grow("w", np.int64); grow("h", np.int64)
+        # Hitbox: distância ao canto do retângulo e tamanho.
+        grow("hit_dx", np.int64); grow("hit_dy", np.int64)
+        grow("hit_w", np.int64); grow("hit_h", np.int64)
+        # Direção (vetor unitário) e velocidade em píxeis por frame.
+        grow("vx", np.float64); grow("vy", np.float64)
+        grow("speed", np.float64)
+        grow("damage", np.int64)
+        grow("pierce", np.int64)
+        grow("bounces", np.int64)
+        grow("frozen", np.bool_)
+        grow("sprite", np.int64)
+        grow("alive", np.bool_)
+        self.capacity = capacity
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def append(self, projectile):
+        """Acrescenta um projétil ao fim do buffer e liga-o aos arrays."""
+        slot = self.count
+        if slot == self.capacity:
+            self._allocate(self.capacity * 2)
+        # Os valores são lidos antes de ligar o objeto, enquanto ainda estão no próprio projétil.
+        direction = projectile.direction
+        self.vx[slot], self.vy[slot] = direction.x, direction.y
+        self.speed[slot] = projectile.speed
+        self.damage[slot] = projectile.damage
+        self.pierce[slot] = projectile.pierce
+        self.bounces[slot] = projectile.bounces_left
+        self.frozen[slot] = projectile.is_frozen
+        self.sprite[slot] = self._sprite_id(projectile.image)
+        self.alive[slot] = True
+        self._read_geometry(slot, projectile.rect, projectile.hitbox)
+        self.prev_x[slot], self.prev_y[slot] = self.x[slot], self.y[slot]
+        projectile.buffer = self
+        projectile.slot = slot
+        self.items.append(projectile)
+        self.count += 1
+
+    def extend(self, projectiles):
+        for projectile in projectiles:
+            self.append(projectile)
+
+    def _read_geometry(self, slot, rect, hitbox):
+        self.x[slot], self.y[slot] = rect.x, rect.y
+        self.w[slot], self.h[slot] = rect.width, rect.height
+        self.hit_dx[slot], self.hit_dy[slot] = hitbox.x - rect.x, hitbox.y - rect.y
+        self.hit_w[slot], self.hit_h[slot] = hitbox.width, hitbox.height
+
+    def _sprite_id(self, image):
+        sprite_id = self.sprite_ids.get(image)
+        if sprite_id is None:
+            sprite_id = len(self.sprites)
+            self.sprites.append(image)
+            self.sprite_ids[image] = sprite_id
+        return sprite_id
+
+    def rect_at(self, slot):
+        """Retângulo da imagem do projétil nesta posição."""
+        return pygame.Rect(int(self.x[slot]), int(self.y[slot]), int(self.w[slot]), int(self.h[slot]))
+
+    def hitbox_at(self, slot):
+        """Hitbox do projétil nesta posição."""
+        return pygame.Rect(int(self.x[slot] + self.hit_dx[slot]), int(self.y[slot] + self.hit_dy[slot]),
+                           int(self.hit_w[slot]), int(self.hit_h[slot]))
+
+    def move_slot(self, slot):
+        """Move só o projétil desta posição um frame, como update() (mas sem o corte fora do ecrã)."""
+        self.prev_x[slot], self.prev_y[slot] = self.x[slot], self.y[slot]
+        rect = self.rect_at(slot)
+        rect.x += float(self.vx[slot] * self.speed[slot])
+        rect.y += float(self.vy[slot] * self.speed[slot])
+        self.x[slot], self.y[slot] = rect.x, rect.y
+
+    def set_center(self, slot, center):
+        """Centra a imagem e a hitbox do projétil desta posição em 'center'."""
+        rect, hitbox = self.rect_at(slot), self.hitbox_at(slot)
+        rect.center = center
+        hitbox.center = rect.center
+        self._read_geometry(slot, rect, hitbox)
+
+    def kill(self, projectile):
+        """Marca um projétil para sair na próxima compactação. Ignora projéteis que já saíram."""
+        if projectile.buffer is self:
+            self.alive[projectile.slot] = False
+
+    def update(self, bounds):
+        """
+        Move todos os projéteis um frame e retira os que deixaram de tocar em 'bounds' (o ecrã).
+
+        Igual a chamar proj.update() e testar bounds.colliderect(proj.rect) em cada um: a nova
+        posição é arredondada como o pygame arredonda ao atribuir um float a um Rect.
+        """
+        n = self.count
+        if not n:
+            return
+        x, y = self.x[:n], self.y[:n]
+        self.prev_x[:n], self.prev_y[:n] = x, y
+        speed = self.speed[:n]
+        x[:] = round_like_rect(x + self.vx[:n] * speed)
+        y[:] = round_like_rect(y + self.vy[:n] * speed)
+        left, top, width, height = bounds
+        self.alive[:n] &= ((x < left + width) & (x + self.w[:n] > left) &
+                           (y < top + height) & (y + self.h[:n] > top))
+        self.compact()
+
+    def colliding(self, rect):
+        """Retorna os projéteis vivos cuja hitbox colide com 'rect', pela ordem do buffer."""
+        n = self.count
+        if not n:
+            return []
+        left, top, width, height = rect
+        hit_x = self.x[:n] + self.hit_dx[:n]
+        hit_y = self.y[:n] + self.hit_dy[:n]
+        hits = (self.alive[:n] & (hit_x < left + width) & (hit_x + self.hit_w[:n] > left) &
+                (hit_y < top + height) & (hit_y + self.hit_h[:n] > top))
+        items = self.items
+        return [items[slot] for slot in np.flatnonzero(hits).tolist()]
+
+    def iter_hitboxes(self):
+        """
+        Percorre (projétil, hitbox) dos projéteis vivos, pela ordem do buffer.
+
+        A hitbox é sempre o mesmo Rect (self.probe), reescrito a cada passo: serve para
+        consultas imediatas (ex: na grelha de colisões), não para ser guardada.
+        """
+        n = self.count
+        hit_x = (self.x[:n] + self.hit_dx[:n]).tolist()
+        hit_y = (self.y[:n] + self.hit_dy[:n]).tolist()
+        hit_w = self.hit_w[:n].tolist()
+        hit_h = self.hit_h[:n].tolist()
+        alive = self.alive
+        probe = self.probe
+        for slot in range(n):
+            # Projéteis mortos durante o próprio ciclo (ex: perfuração esgotada) são saltados.
+            if alive[slot]:
+                probe.update(hit_x[slot], hit_y[slot], hit_w[slot], hit_h[slot])
+                yield self.items[slot], probe
+
+    def compact(self):
+        """Retira os projéteis mortos, mantendo a ordem dos vivos."""
+        n = self.count
+        keep = self.alive[:n]
+        if keep.all():
+            return
+        survivors = []
+        for slot, projectile in enumerate(self.items):
+            if keep[slot]:
+                projectile.slot = len(survivors)
+                survivors.append(projectile)
+            else:
+                self._detach(projectile, slot)
+        m = len(survivors)
+        for name in ("x", "y", "prev_x", "prev_y", "w", "h", "hit_dx", "hit_dy", "hit_w", "hit_h",
+                     "vx", "vy", "speed", "damage", "pierce", "bounces", "frozen", "sprite"):
+            array = getattr(self, name)
+            array[:m] = array[:n][keep]
+        self.alive[:m] = True
+        self.alive[m:n] = False
+        self.items = survivors
+        self.count = m
+
+    def clear(self):
+        """Retira todos os projéteis."""
+        for slot, projectile in enumerate(self.items):
+            self._detach(projectile, slot)
+        self.items = []
+        self.count = 0
+
+    def _detach(self, projectile, slot):
+        """
+        Desliga o projétil do buffer. Se veio de uma pool, volta para lá (o estado será
+        reposto por reset); senão, o estado dos arrays é copiado de volta para o objeto.
+        """
+        if projectile.home_pool is not None:
+            projectile.buffer = None
+            projectile.slot = -1
+            projectile.release()
+            return
+        values = {name: getattr(projectile, name) for name in ("direction", "speed", "damage", "pierce", "bounces_left", "is_frozen")}
+        rect, hitbox = self.rect_at(slot), self.hitbox_at(slot)
+        projectile.buffer = None
+        projectile.slot = -1
+        projectile.rect, projectile.hitbox = rect, hitbox
+        for name, value in values.items():
+            setattr(projectile, name, value)
+
+    def rects(self):
+        """Retângulos (x, y, largura, altura) de todos os projéteis, para os dirty rects."""
+        n = self.count
+        return list(zip(self.x[:n].tolist(), self.y[:n].tolist(), self.w[:n].tolist(), self.h[:n].tolist()))
+
+    def swept_rects(self):
+        """
+        Retângulos que contêm cada projétil na posição anterior e na atual (para os dirty
+        rects com desenho interpolado, que o desenha algures entre as duas).
+        """
+        n = self.count
+        x, y, prev_x, prev_y = self.x[:n], self.y[:n], self.prev_x[:n], self.prev_y[:n]
+        left, top = np.minimum(x, prev_x), np.minimum(y, prev_y)
+        width = self.w[:n] + np.abs(x - prev_x)
+        height = self.h[:n] + np.abs(y - prev_y)
+        return list(zip(left.tolist(), top.tolist(), width.tolist(), height.tolist()))
+
+    def draw(self, screen, offset=(0, 0), alpha=1.0):
+        """
+        Desenha todos os projéteis com uma só chamada a screen.blits. Com alpha < 1 desenha-os
+        entre a posição anterior e a atual (desenho interpolado entre passos de simulação).
+        """
+        n = self.count
+        if not n:
+            return
+        sprites = self.sprites
+        x, y = self.x[:n], self.y[:n]
+        if alpha < 1:
+            x = x + (self.prev_x[:n] - x) * (1 - alpha)
+            y = y + (self.prev_y[:n] - y) * (1 - alpha)
+        xs = (x + offset[0]).tolist()
+        ys = (y + offset[1]).tolist()
+        screen.blits([(sprites[sprite_id], (x, y)) for sprite_id, x, y in zip(self.sprite[:n].tolist(), xs, ys)],
+                     doreturn=False)
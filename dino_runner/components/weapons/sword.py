@@ -32,12 +32,17 @@ class Sword(Weapon):
         self.slash_image = self.slash_image_original
         self.slash_rect = self.slash_image.get_rect()
 
+    def set_size(self, size):
+        """Altera o tamanho do golpe e descarta as rotações calculadas para o tamanho antigo."""
+        self.size = size
+        self.player.assets.rotations.invalidate("SWORD_SLASH")
+
     def activate_special(self):
         self.shield_active = True
-        self.shield_start_time = pygame.time.get_ticks()
+        self.shield_start_time = self.player.clock.get_ticks()
 
     def attack(self):
-        current_time = pygame.time.get_ticks()
+        current_time = self.player.clock.get_ticks()
         if self.swings_to_make > 0: return
         if current_time - self.last_attack_time >= self.attack_cooldown:
             self.last_attack_time = current_time
@@ -48,11 +53,11 @@ class Sword(Weapon):
     def perform_swing(self):
         """Executa um único corte da espada."""
         self.is_swinging = True
-        self.last_burst_swing_time = pygame.time.get_ticks()
+        self.last_burst_swing_time = self.player.clock.get_ticks()
         self.hit_enemies.clear()
         
         swing_width = int(80 * self.size); swing_height = int(80 * self.size)
-        mouse_pos = pygame.mouse.get_pos(); player_pos = self.player.rect.center
+        mouse_pos = self.player.input_source.get_mouse_pos(); player_pos = self.player.rect.center
         direction = pygame.math.Vector2(mouse_pos[0] - player_pos[0], mouse_pos[1] - player_pos[1])
         if direction.length() > 0:
             direction.normalize_ip()
@@ -60,13 +65,15 @@ class Sword(Weapon):
         hitbox_center = (player_pos[0] + direction.x * 50, player_pos[1] + direction.y * 50)
         self.hitbox = pygame.Rect(0, 0, swing_width, swing_height); self.hitbox.center = hitbox_center
         
-        scaled_slash_image = pygame.transform.scale_by(self.slash_image_original, self.size)
         angle = math.degrees(math.atan2(player_pos[1] - mouse_pos[1], mouse_pos[0] - player_pos[0]))
-        self.slash_image = pygame.transform.rotate(scaled_slash_image, angle)
+        # Rotações quantizadas e partilhadas: o scale_by só corre quando o tamanho muda.
+        self.slash_image = self.player.assets.rotations.get(
+            ("SWORD_SLASH", self.size), angle, pygame.transform.scale_by, self.slash_image_original, self.size
+        )
         self.slash_rect = self.slash_image.get_rect(center=self.hitbox.center)
 
     def update(self):
-        current_time = pygame.time.get_ticks()
+        current_time = self.player.clock.get_ticks()
         if self.swings_to_make > 0:
             if current_time - self.last_burst_swing_time > self.time_between_swings:
                 self.swings_to_make -= 1
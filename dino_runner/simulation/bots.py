@@ -0,0 +1,170 @@
+# Ficheiro: dino_runner/simulation/bots.py
+# Descrição: Jogadores automáticos para as simulações sem ecrã. Antes de cada passo de
+#            simulação o bot olha para o modo de jogo, escreve as teclas e o rato no
+#            ScriptedInput e devolve os eventos desse passo.
+
+import math
+import random
+import pygame
+from dino_runner.components.obstacles.bird import Bird
+from dino_runner.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+
+# --- Políticas de escolha de power-ups ---
+# Cada política recebe as opções da carta (dicionários de define_powerups) e um Random e
+# devolve o índice escolhido. As prioridades usam o nome do método de efeito, que não
+# muda quando os textos das cartas mudam.
+
+def pick_random(options, rng):
+    return rng.randrange(len(options))
+
+def pick_first(options, rng):
+    return 0
+
+def priority_policy(*effect_names):
+    """Escolhe a primeira opção pela ordem de 'effect_names'; sem nenhuma na lista, uma ao acaso."""
+    def pick(options, rng):
+        names = [option['effect'].__name__ for option in options]
+        for name in effect_names:
+            if name in names:
+                return names.index(name)
+        return rng.randrange(len(options))
+    return pick
+
+POWERUP_POLICIES = {
+    "random": pick_random,
+    "first": pick_first,
+    "offense": priority_policy("increase_damage", "increase_quantity", "increase_fire_rate",
+                               "increase_pierce", "increase_bounces", "increase_sword_size"),
+    "defense": priority_policy("increase_max_health", "increase_life_steal", "increase_damage"),
+    "projectile": priority_policy("increase_pierce", "increase_bounces", "increase_bullet_speed",
+                                  "increase_sword_size", "increase_damage"),
+}
+
+class IdleBot:
+    """Não carrega em nada: serve de linha de base (e de guião mínimo) para qualquer modo."""
+    def act(self, mode, controls):
+        return []
+
+class RogueliteBot:
+    """
+    Joga o modo Roguelite: escolhe a classe, começa as waves, escolhe power-ups com a
+    política dada, aponta ao inimigo mais próximo com o botão esquerdo sempre premido e
+    usa a habilidade especial quando há inimigos perto.
+
+    Os ecrãs de cartas e o botão de iniciar wave são acionados pelos métodos do modo
+    (select_class, apply_powerup, start_next_wave): os retângulos dos botões só existem
+    depois de desenhados e numa simulação sem ecrã nada é desenhado.
+    """
+    KITE_DISTANCE = 250    # O Mage foge dos inimigos mais perto do que isto.
+    MELEE_RANGE = (75, 95) # O Warrior fica a esta distância do alvo (o golpe chega a ~90 px).
+    SPECIAL_DISTANCE = 200 # Distância a que a habilidade especial vale a pena.
+
+    def __init__(self, class_id="pistol", powerup_policy="random", seed=None):
+        self.class_id = class_id
+        self.pick_powerup = POWERUP_POLICIES[powerup_policy] if isinstance(powerup_policy, str) else powerup_policy
+        self.rng = random.Random(seed)
+
+    def act(self, mode, controls):
+        state = mode.game_state
+        if state == "CHOOSE_WEAPON":
+            mode.select_class(self.class_id)
+        elif state == "LEVEL_UP":
+            mode.apply_powerup(self.pick_powerup(mode.powerup_options, self.rng))
+        elif state == "PAUSED":
+            mode.game_state = "RUNNING"
+        elif state == "RUNNING":
+            if not mode.wave_in_progress:
+                mode.start_next_wave()
+            return self.fight(mode, controls)
+        return []
+
+    def fight(self, mode, controls):
+        """Move, aponta e ataca; devolve o clique direito se a habilidade especial for usada."""
+        player = mode.player
+        px, py = player.rect.center
+        target, distance = None, math.inf
+        for enemy in mode.enemies:
+            d = math.hypot(enemy.rect.centerx - px, enemy.rect.centery - py)
+            if d < distance:
+                target, distance = enemy, d
+        if target is None:
+            controls.set_keys()
+            controls.mouse_buttons = (False, False, False)
+            return []
+
+        tx, ty = target.rect.center
+        distance = max(distance, 1) # Em cima do alvo: evita dividir por zero.
+        controls.mouse_pos = (tx, ty)
+        controls.mouse_buttons = (True, False, False)
+
+        if self.class_id == "sword":
+            near, far = self.MELEE_RANGE
+            sign = 1 if distance > far else -1 if distance < near else 0
+            move_x, move_y = sign * (tx - px) / distance, sign * (ty - py) / distance
+        elif distance < self.KITE_DISTANCE:
+            # Foge do alvo, puxado para o centro para não ficar encurralado num canto.
+            move_x = (px - tx) / distance + (SCREEN_WIDTH / 2 - px) / SCREEN_WIDTH
+            move_y = (py - ty) / distance + (SCREEN_HEIGHT / 2 - py) / SCREEN_HEIGHT
+        else:
+            move_x, move_y = 0, 0
+        keys = []
+        if abs(move_x) > 0.2: keys.append(pygame.K_d if move_x > 0 else pygame.K_a)
+        if abs(move_y) > 0.2: keys.append(pygame.K_s if move_y > 0 else pygame.K_w)
+        controls.set_keys(*keys)
+
+        ready = mode.clock.get_ticks() - player.last_special_ability_time > player.special_ability_cooldown
+        if ready and distance < self.SPECIAL_DISTANCE:
+            return [pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=3, pos=(tx, ty))]
+        return []
+
+class EndlessBot:
+    """
+    Joga o modo Endless Runner: salta os cactos e os pássaros baixos quando estão a uma
+    distância proporcional à velocidade do jogo e agacha-se debaixo dos pássaros altos.
+    """
+    JUMP_STEPS = 5 # Salta quando o obstáculo está a este número de passos de distância.
+
+    def __init__(self):
+        self.ducking = False
+
+    def act(self, mode, controls):
+        player = mode.player
+        events = []
+        if player.is_waiting:
+            return [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)]
+
+        ahead = [o for o in mode.obstacle_list if o.rect.right > player.dino_rect.left]
+        obstacle = min(ahead, key=lambda o: o.rect.x) if ahead else None
+        distance = obstacle.rect.left - player.dino_rect.right if obstacle else math.inf
+        high_bird = isinstance(obstacle, Bird) and obstacle.rect.y < 300
+
+        want_duck = high_bird and distance < mode.game_speed * self.JUMP_STEPS * 2
+        if want_duck != self.ducking:
+            self.ducking = want_duck
+            events.append(pygame.event.Event(pygame.KEYDOWN if want_duck else pygame.KEYUP, key=pygame.K_DOWN))
+            controls.set_keys(*([pygame.K_DOWN] if want_duck else []))
+        if obstacle and not high_bird and 0 <= distance < mode.game_speed * self.JUMP_STEPS:
+            events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+        return events
+
+class ReplayBot:
+    """
+    Repete, passo a passo, o input gravado num replay (dino_runner/utils/replay.py).
+
+    Os botões clicáveis (cartas, iniciar wave, game over) só existem depois de desenhados.
+    Ao vivo, um clique chega no primeiro passo depois de um frame desenhado, por isso o
+    bot desenha o estado atual antes de um passo com cliques (menos no primeiro passo da
+    partida, que ao vivo corre antes de qualquer desenho).
+
+    'index' é o primeiro passo a repetir (ex: o passo de um snapshot reposto no modo).
+    """
+    def __init__(self, replay, index=0):
+        self.replay = replay
+        self.index = index
+
+    def act(self, mode, controls):
+        events = self.replay.apply(self.index, controls)
+        if self.index and any(event.type == pygame.MOUSEBUTTONDOWN for event in events):
+            mode.render(1.0)
+        self.index += 1
+        return events
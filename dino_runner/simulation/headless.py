@@ -0,0 +1,215 @@
+# Ficheiro: dino_runner/simulation/headless.py
+# Descrição: Corre os modos de jogo sem janela, sem som e sem desenhar, à velocidade
+#            máxima do processador, com o input dado por um bot. Mede os passos de
+#            simulação por segundo, o resultado da partida e o tempo por subsistema.
+
+import contextlib
+import io
+import os
+import time
+import pygame
+from dino_runner.components.modes.endless_runner import EndlessRunner
+from dino_runner.components.modes.roguelite_mode import RogueliteMode
+from dino_runner.utils.asset_manager import AssetManager
+from dino_runner.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from dino_runner.utils.game_clock import GameClock
+from dino_runner.utils.input_source import ScriptedInput
+from dino_runner.simulation.bots import ReplayBot
+from dino_runner.utils.sound_manager import SoundManager
+
+class HeadlessSession:
+    """
+    Pygame com os drivers "dummy" de vídeo e som, e os assets e sons partilhados por
+    todas as partidas simuladas no mesmo processo.
+    """
+    def __init__(self):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        pygame.init()
+        # Os modos usam o ecrã para os limites dos projéteis; convert_alpha() precisa de um modo de vídeo.
+        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.settings = {"music": False, "sfx": False, "shake": True, "dirty_rects": False}
+        self.assets = AssetManager()
+        self.sounds = SoundManager(self.settings)
+
+    def close(self):
+        pygame.quit()
+
+class RunReport:
+    """Resultado e tempos de uma partida simulada."""
+    def __init__(self, mode_name, label):
+        self.mode_name = mode_name
+        self.label = label         # ex: a classe escolhida, ou o nome do bot
+        self.steps = 0
+        self.wall_seconds = 0.0
+        self.outcome = "timeout"   # "game_over", "timeout" ou "completed" (objetivo atingido)
+        self.score = 0
+        self.wave_reached = 0
+        self.waves_cleared = 0
+        self.level = 1
+        self.waves = []            # um dicionário por wave começada (ver WaveTracker)
+        self.sections = {}         # subsistema -> segundos reais gastos
+
+    @property
+    def sim_seconds(self):
+        return self.steps / FPS
+
+    @property
+    def steps_per_second(self):
+        return self.steps / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+def _add_sections(totals, sections):
+    for name, seconds in sections.items():
+        totals[name] = totals.get(name, 0.0) + seconds
+
+def simulate(mode, bot, report, max_steps, render=False, quiet=True, on_step=None, stop_at_game_over=True):
+    """
+    Corre 'mode' passo a passo, sem esperar pelo relógio, até ao fim da partida ou até
+    'max_steps' passos. 'render' desenha cada passo no ecrã "dummy" (para medir o desenho).
+    'on_step(mode)' é chamado depois de cada passo e termina a partida se devolver True.
+    Os prints do jogo são descartados quando 'quiet' é True. Com 'stop_at_game_over' False,
+    o ecrã de Game Over do Roguelite não termina a simulação (um replay pode recomeçar).
+    """
+    controls = mode.input_source
+    timer = mode.timer
+    timer.enabled = True
+    timer.reset()
+    bot_seconds = draw_seconds = 0.0
+    perf = time.perf_counter
+    output = contextlib.redirect_stdout(io.StringIO()) if quiet else contextlib.nullcontext()
+    with output:
+        start = perf()
+        while report.steps < max_steps:
+            t0 = perf()
+            events = bot.act(mode, controls)
+            t1 = perf()
+            result = mode.step(events)
+            report.steps += 1
+            bot_seconds += t1 - t0
+            if render:
+                t2 = perf()
+                mode.render(1.0)
+                draw_seconds += perf() - t2
+            if on_step and on_step(mode):
+                break
+            if not result or result == "MENU" or (stop_at_game_over and getattr(mode, "game_state", None) == "GAME_OVER"):
+                report.outcome = "game_over"
+                break
+        report.wall_seconds = perf() - start
+    _add_sections(report.sections, timer.totals)
+    report.sections["bot"] = bot_seconds
+    if render:
+        report.sections["draw"] = draw_seconds
+    report.score = mode.score
+    return report
+
+class WaveTracker:
+    """
+    Segue as waves de uma partida de Roguelite depois de cada passo: se foi limpa, os
+    segundos de jogo até a limpar, o dano causado aos inimigos e a vida do jogador.
+
+    O dano é a soma das descidas de vida dos inimigos entre passos; um inimigo que
+    desaparece conta com a vida que ainda tinha.
+    """
+    def __init__(self, max_waves=None):
+        self.max_waves = max_waves
+        self.waves = {}         # wave -> dicionário com os resultados
+        self.enemy_health = {}  # inimigo -> vida no fim do passo anterior
+        self.cleared = 0
+
+    def __call__(self, mode):
+        wave = mode.current_wave
+        record = self.waves.get(wave)
+        if record is None:
+            if not mode.wave_in_progress:
+                return False
+            record = self.waves[wave] = {"wave": wave, "cleared": False, "clear_seconds": None,
+                                         "damage_dealt": 0.0, "player_health": 0.0, "start": mode.clock.get_ticks()}
+            self.enemy_health = {}
+
+        damage = 0.0
+        health_now = {}
+        for enemy in mode.enemies:
+            health = health_now[enemy] = enemy.health
+            previous = self.enemy_health.get(enemy)
+            if previous is not None and health < previous:
+                damage += previous - health
+        for enemy, previous in self.enemy_health.items():
+            if enemy not in health_now:
+                damage += max(previous, 0)
+        self.enemy_health = health_now
+        record["damage_dealt"] += damage
+        record["player_health"] = mode.player.health
+
+        if not mode.wave_in_progress and not record["cleared"]:
+            record["cleared"] = True
+            record["clear_seconds"] = (mode.clock.get_ticks() - record["start"]) / 1000
+            self.cleared += 1
+            return bool(self.max_waves) and self.cleared >= self.max_waves
+        return False
+
+def run_roguelite(session, bot, max_seconds=600, max_waves=None, render=False, quiet=True, setup=None):
+    """
+    Uma partida de Roguelite conduzida por 'bot' (até ao Game Over, 'max_waves' waves
+    limpas ou 'max_seconds' de jogo). 'setup(mode)' pode alterar o modo antes de começar.
+    """
+    mode = RogueliteMode(session.screen, 0, session.assets, session.sounds, session.settings,
+                         clock=GameClock(), input_source=ScriptedInput())
+    if setup:
+        setup(mode)
+    report = RunReport("roguelite", getattr(bot, "class_id", type(bot).__name__))
+    tracker = WaveTracker(max_waves)
+    simulate(mode, bot, report, int(max_seconds * FPS), render, quiet, on_step=tracker)
+    if max_waves and tracker.cleared >= max_waves:
+        report.outcome = "completed"
+    report.waves = [tracker.waves[wave] for wave in sorted(tracker.waves)]
+    report.wave_reached = mode.current_wave
+    report.waves_cleared = tracker.cleared
+    report.level = mode.player.level
+    return report
+
+def run_endless(session, bot, max_seconds=300, render=False, quiet=True):
+    """Uma partida de Endless Runner conduzida por 'bot' (até o dinossauro morrer ou 'max_seconds' de jogo)."""
+    mode = EndlessRunner(session.screen, 0, session.assets, session.sounds, session.settings,
+                         clock=GameClock(), input_source=ScriptedInput())
+    report = RunReport("endless", type(bot).__name__)
+    simulate(mode, bot, report, int(max_seconds * FPS), render, quiet)
+    return report
+
+def create_mode(session, mode_type, seed=None, first_run=False):
+    """Um modo de jogo ("NORMAL" ou "ROGUELITE") com relógio e input próprios, como o GameController o criaria."""
+    if mode_type == "ROGUELITE":
+        return RogueliteMode(session.screen, 0, session.assets, session.sounds, session.settings,
+                             clock=GameClock(), input_source=ScriptedInput(), seed=seed)
+    return EndlessRunner(session.screen, 0, session.assets, session.sounds, session.settings, first_run=first_run,
+                         clock=GameClock(), input_source=ScriptedInput(), seed=seed)
+
+def run_replay(session, replay, render=False, quiet=True):
+    """
+    Reproduz um replay (dino_runner/utils/replay.py) do princípio ao fim. Devolve o
+    RunReport e o modo no estado final, para comparar com o resumo gravado no replay.
+    """
+    mode = create_mode(session, replay.mode_type, replay.seed, replay.first_run)
+    report = RunReport(replay.mode_type.lower(), "replay")
+    simulate(mode, ReplayBot(replay), report, len(replay), render, quiet, stop_at_game_over=False)
+    if report.steps == len(replay) and report.outcome == "timeout":
+        report.outcome = "completed"
+    if replay.mode_type == "ROGUELITE":
+        report.wave_reached = mode.current_wave
+        report.level = mode.player.level
+    return report, mode
+
+def seek_replay(session, replay, index, render=False, quiet=True, use_snapshots=True):
+    """
+    O estado de um replay antes do passo 'index': repõe o último snapshot tirado até esse
+    passo e simula só os passos que faltam (sem snapshots, ou com 'use_snapshots' False,
+    simula desde o início). Devolve o RunReport dos passos simulados, o modo e o passo
+    de onde a simulação partiu.
+    """
+    index = min(index, len(replay))
+    mode = create_mode(session, replay.mode_type, replay.seed, replay.first_run)
+    snapshot = replay.snapshot_before(index) if use_snapshots else None
+    start = replay.restore(snapshot, mode) if snapshot is not None else 0
+    report = RunReport(replay.mode_type.lower(), "seek")
+    simulate(mode, ReplayBot(replay, start), report, index - start, render, quiet, stop_at_game_over=False)
+    return report, mode, start
@@ -0,0 +1,133 @@
+# Ficheiro: dino_runner/simulation/sweep.py
+# Descrição: Varrimentos de balanceamento: muitas partidas de Roguelite sem ecrã, repartidas
+#            por todos os núcleos com multiprocessing, para cada combinação de classe,
+#            política de power-ups e multiplicadores dos status dos inimigos. O resultado é
+#            um CSV com uma linha por wave de cada partida.
+
+import csv
+import itertools
+import multiprocessing
+import random
+import time
+from dino_runner.components.weapons.bullet import Bullet
+from dino_runner.simulation.bots import RogueliteBot
+from dino_runner.simulation.headless import HeadlessSession, run_roguelite
+
+CSV_FIELDS = [
+    "run", "class", "policy", "enemy_health", "enemy_damage", "enemy_speed", "seed",
+    "wave", "cleared", "clear_seconds", "damage_dealt", "player_health",
+    "outcome", "waves_cleared", "score", "level", "sim_seconds",
+]
+
+def scaled_enemy(enemy_class, health=1.0, damage=1.0, speed=1.0):
+    """Uma "classe" de inimigo que cria 'enemy_class' com a vida, o dano e a velocidade multiplicados."""
+    def spawn(x, y, assets, is_boss=False, clock=None, rng=None):
+        enemy = enemy_class(x, y, assets, is_boss=is_boss, clock=clock, rng=rng)
+        enemy.health = int(enemy.health * health)
+        enemy.max_health = int(enemy.max_health * health)
+        enemy.damage_scale = damage # o dano de contacto e dos tiros (Enemy.damage não é usado no jogo)
+        enemy.speed *= speed
+        enemy.original_speed *= speed
+        return enemy
+    return spawn
+
+def scale_enemy_pools(mode, health=1.0, damage=1.0, speed=1.0):
+    """Troca os grupos de inimigos do modo (define_enemy_pools) pelas versões com status multiplicados."""
+    if health == damage == speed == 1.0:
+        return
+    mode.pistol_enemies = [scaled_enemy(cls, health, damage, speed) for cls in mode.pistol_enemies]
+    mode.sword_enemies = [scaled_enemy(cls, health, damage, speed) for cls in mode.sword_enemies]
+    mode.pistol_boss = scaled_enemy(mode.pistol_boss, health, damage, speed)
+    mode.sword_boss = scaled_enemy(mode.sword_boss, health, damage, speed)
+
+def build_tasks(classes, policies, healths, damages, speeds, runs, seed=0, max_seconds=600, max_waves=None):
+    """
+    Uma tarefa por partida. A repetição i de todas as combinações usa a mesma semente, para
+    que as diferenças entre combinações venham dos parâmetros e não da sorte.
+    """
+    tasks = []
+    combos = itertools.product(classes, policies, healths, damages, speeds, range(runs))
+    for run, (class_id, policy, health, damage, speed, repeat) in enumerate(combos):
+        tasks.append({"run": run, "class": class_id, "policy": policy, "enemy_health": health,
+                      "enemy_damage": damage, "enemy_speed": speed, "seed": seed + repeat,
+                      "max_seconds": max_seconds, "max_waves": max_waves})
+    return tasks
+
+# Sessão sem ecrã de cada processo do pool (assets carregados uma vez por processo).
+_session = None
+
+def _init_worker():
+    global _session
+    _session = HeadlessSession()
+
+def run_task(task):
+    """Corre uma partida e devolve as suas linhas do CSV (uma por wave começada)."""
+    if _session is None:
+        _init_worker()
+    # O RogueliteMode já repõe os status das balas ao começar; fica explícito porque cada
+    # processo corre muitas partidas seguidas e os BASE_* são estado partilhado da classe.
+    Bullet.reset_stats()
+    random.seed(task["seed"])
+    bot = RogueliteBot(task["class"], task["policy"], task["seed"])
+    report = run_roguelite(
+        _session, bot, task["max_seconds"], task["max_waves"],
+        setup=lambda mode: scale_enemy_pools(mode, task["enemy_health"], task["enemy_damage"], task["enemy_speed"]),
+    )
+    summary = {"outcome": report.outcome, "waves_cleared": report.waves_cleared, "score": report.score,
+               "level": report.level, "sim_seconds": round(report.sim_seconds, 2)}
+    params = {field: task[field] for field in ("run", "class", "policy", "enemy_health", "enemy_damage", "enemy_speed", "seed")}
+    rows = []
+    for wave in report.waves or [{"wave": 0, "cleared": False, "clear_seconds": None, "damage_dealt": 0.0, "player_health": 0.0}]:
+        rows.append({**params, "wave": wave["wave"], "cleared": int(wave["cleared"]),
+                     "clear_seconds": "" if wave["clear_seconds"] is None else round(wave["clear_seconds"], 3),
+                     "damage_dealt": round(wave["damage_dealt"], 1), "player_health": round(wave["player_health"], 1),
+                     **summary})
+    return rows
+
+def run_sweep(tasks, out_path, workers=None, progress=True):
+    """
+    Corre as tarefas em 'workers' processos (por omissão, um por núcleo) e escreve as linhas
+    no CSV à medida que as partidas terminam. Devolve (linhas, segundos reais).
+    """
+    workers = workers or multiprocessing.cpu_count()
+    rows = []
+    start = time.perf_counter()
+    with open(out_path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        if workers == 1:
+            results = map(run_task, tasks)
+            pool = None
+        else:
+            pool = multiprocessing.Pool(workers, initializer=_init_worker)
+            results = pool.imap_unordered(run_task, tasks)
+        try:
+            for done, task_rows in enumerate(results, 1):
+                writer.writerows(task_rows)
+                rows.extend(task_rows)
+                if progress and (done % max(1, len(tasks) // 20) == 0 or done == len(tasks)):
+                    print(f"  {done}/{len(tasks)} partidas ({time.perf_counter() - start:.1f}s)")
+        finally:
+            if pool:
+                pool.close()
+                pool.join()
+    return rows, time.perf_counter() - start
+
+def summarize(rows):
+    """
+    Agrupa as linhas por combinação de parâmetros: número de partidas, média de waves
+    limpas e, para cada wave, a fração das partidas que a limpou (sobrevivência).
+    """
+    groups = {}
+    for row in rows:
+        key = (row["class"], row["policy"], row["enemy_health"], row["enemy_damage"], row["enemy_speed"])
+        group = groups.setdefault(key, {"runs": {}, "cleared": {}})
+        group["runs"][row["run"]] = row["waves_cleared"]
+        if row["cleared"]:
+            group["cleared"][row["wave"]] = group["cleared"].get(row["wave"], 0) + 1
+    summary = []
+    for key, group in sorted(groups.items()):
+        runs = len(group["runs"])
+        survival = {wave: count / runs for wave, count in sorted(group["cleared"].items())}
+        summary.append((key, runs, sum(group["runs"].values()) / runs, survival))
+    return summary
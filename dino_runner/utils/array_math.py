@@ -0,0 +1,10 @@
+# Ficheiro: dino_runner/utils/array_math.py
+# Descrição: Funções auxiliares para os motores em arrays (NumPy) que têm de dar
+#            exatamente as mesmas posições que o código por objeto com pygame.Rect.
+
+import numpy as np
+
+def round_like_rect(values):
+    """Arredonda como o pygame ao atribuir um float a um Rect: metades afastam-se do zero."""
+    truncated = np.trunc(values)
+    return truncated + np.where(np.abs(values - truncated) >= 0.5, np.sign(values), 0)
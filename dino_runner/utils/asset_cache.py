@@ -0,0 +1,77 @@
+# Ficheiro: dino_runner/utils/asset_cache.py
+# Descrição: Cache em disco de imagens já redimensionadas ("baked"), para que o jogo
+#            não precise de descodificar os PNG originais a cada arranque.
+
+import os
+import struct
+import hashlib
+import pygame
+
+# Cabeçalho de cada ficheiro: assinatura, largura e altura; segue-se o RGBA cru.
+BAKED_MAGIC = b"DRB1"
+BAKED_HEADER = struct.Struct("<4sII")
+
+class BakedAssetCache:
+    """
+    Guarda píxeis RGBA prontos a mostrar numa pasta de cache.
+
+    Cada ficheiro é identificado pelo caminho do PNG original, pela sua data de
+    modificação e pelo tamanho final, por isso editar um asset invalida
+    automaticamente as versões antigas.
+    """
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    def _cache_path(self, source_path, size):
+        """Calcula o ficheiro de cache para (origem, data de modificação, tamanho)."""
+        try:
+            mtime = os.stat(source_path).st_mtime_ns
+        except OSError:
+            return None # Sem ficheiro original não há nada para guardar.
+        key = f"{os.path.normcase(os.path.abspath(source_path))}|{mtime}|{size[0]}x{size[1]}"
+        return os.path.join(self.cache_dir, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".rgba")
+
+    def load(self, source_path, size):
+        """Retorna a superfície guardada para (origem, tamanho), ou None se não existir."""
+        cache_path = self._cache_path(source_path, size)
+        if cache_path is None:
+            return None
+        try:
+            with open(cache_path, "rb") as f:
+                data = f.read()
+        except OSError:
+            self.misses += 1
+            return None
+        if len(data) < BAKED_HEADER.size:
+            self.misses += 1
+            return None
+
+        magic, width, height = BAKED_HEADER.unpack_from(data)
+        pixels = memoryview(data)[BAKED_HEADER.size:]
+        if magic != BAKED_MAGIC or (width, height) != tuple(size) or len(pixels) != width * height * 4:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        # frombuffer não copia os píxeis; o convert_alpha cria a cópia final no formato do ecrã.
+        return pygame.image.frombuffer(pixels, (width, height), "RGBA").convert_alpha()
+
+    def store(self, source_path, size, surface):
+        """Escreve a superfície na cache. Erros de escrita são ignorados (a cache é opcional)."""
+        cache_path = self._cache_path(source_path, size)
+        if cache_path is None:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_path = cache_path + ".tmp"
+            with open(temp_path, "wb") as f:
+                f.write(BAKED_HEADER.pack(BAKED_MAGIC, surface.get_width(), surface.get_height()))
+                f.write(pygame.image.tobytes(surface, "RGBA"))
+            # Substitui de forma atómica para nunca deixar um ficheiro meio escrito.
+            os.replace(temp_path, cache_path)
+            self.writes += 1
+        except OSError as error:
+            print(f"AVISO: Não foi possível escrever a cache de assets em '{cache_path}': {error}")
@@ -2,19 +2,230 @@
 # Descrição: Classe centralizada para carregar e gerir todos os assets (imagens e fontes).
 import pygame
 import os
-from dino_runner.utils.constants import FONT_PATH # Importa o caminho da fonte
+import time
+import threading
+from collections import OrderedDict
+from dino_runner.utils.asset_cache import BakedAssetCache
+from dino_runner.utils.rotation_cache import RotationCache
+from dino_runner.utils.variant_cache import SurfaceVariants
+from dino_runner.utils.constants import FONT_PATH, SCALED_CACHE_MAX_BYTES, ASSET_CACHE_DIR # Importa o caminho da fonte
 
 class AssetManager:
     """Carrega todos os recursos visuais e de texto uma única vez."""
-    def __init__(self):
+
+    # Imagens que o jogo só mostra redimensionadas, com os tamanhos usados.
+    # Estas versões são guardadas na cache em disco ("baked") e carregadas com o seu grupo;
+    # o PNG original só é descodificado se alguém pedir outro tamanho.
+    BAKED_SIZES = {
+        "MIGUEL": [(85, 95)],
+        "PAM": [(70, 90)],
+        "TEKI": [(100, 110)],
+        "DANN": [(90, 90)],
+        "BERO": [(80, 100)],
+        "BULLET": [(30, 30)],
+        "ENEMY_BULLET": [(15, 15)],
+        "SHARD": [(20, 20)],
+    }
+
+    # Manifestos de assets por grupo: (tipo, nome, caminho / frames / tamanho da fonte).
+    # Entradas repetidas entre grupos só são carregadas uma vez.
+    ASSET_MANIFESTS = {
+        # --- Menu Principal ---
+        "MENU": [
+            ("image", "ICON", "DinoWallpaper.png"),
+            ("image", "DINO_START", "Dino/DinoStart.png"),
+        ],
+        # --- Modo Normal: cenário, dinossauro e obstáculos ---
+        "NORMAL": [
+            ("image", "BG", "Other/Track.png"),
+            ("image", "CLOUD", "Other/Cloud.png"),
+            ("image", "HEART", "Other/SmallHeart.png"),
+            ("image", "SHIELD_ICON", "Other/shield.png"),
+            ("image", "HAMMER_ICON", "Other/hammer.png"),
+            ("image", "DINO_JUMP", "Dino/DinoJump.png"),
+            ("image", "DINO_DEAD", "Dino/DinoDead.png"),
+            ("image", "DINO_RUN1", "Dino/DinoRun1.png"),
+            ("image", "DINO_RUN2", "Dino/DinoRun2.png"),
+            ("frames", "DINO_RUNNING", ("DINO_RUN1", "DINO_RUN2")),
+            ("image", "DINO_DUCK1", "Dino/DinoDuck1.png"),
+            ("image", "DINO_DUCK2", "Dino/DinoDuck2.png"),
+            ("frames", "DINO_DUCKING", ("DINO_DUCK1", "DINO_DUCK2")),
+            ("image", "SMALL_CACTUS_1", "Cactus/SmallCactus1.png"),
+            ("image", "SMALL_CACTUS_2", "Cactus/SmallCactus2.png"),
+            ("image", "SMALL_CACTUS_3", "Cactus/SmallCactus3.png"),
+            ("frames", "SMALL_CACTUS", ("SMALL_CACTUS_1", "SMALL_CACTUS_2", "SMALL_CACTUS_3")),
+            ("image", "LARGE_CACTUS_1", "Cactus/LargeCactus1.png"),
+            ("image", "LARGE_CACTUS_2", "Cactus/LargeCactus2.png"),
+            ("image", "LARGE_CACTUS_3", "Cactus/LargeCactus3.png"),
+            ("frames", "LARGE_CACTUS", ("LARGE_CACTUS_1", "LARGE_CACTUS_2", "LARGE_CACTUS_3")),
+            ("image", "BIRD_1", "Bird/Bird1.png"),
+            ("image", "BIRD_2", "Bird/Bird2.png"),
+            ("frames", "BIRD", ("BIRD_1", "BIRD_2")),
+        ],
+        # --- Modo Roguelite: personagens, armas e fontes da interface ---
+        "ROGUELITE": [
+            ("frames", "DINO_RUNNING", ("DINO_RUN1", "DINO_RUN2")), # Aparência da classe Mage
+            ("image", "BERO_START", "Bero/Bero.png"),
+            ("frames", "BERO_RUNNING", ("BERO_START", "BERO_START")),
+            ("image", "BULLET", "weapons/fireball.png"),
+            ("image", "ENEMY_BULLET", "weapons/enemy_bullet.png"),
+            ("image", "SHARD", "weapons/shard.png"),
+            ("image", "SWORD_SLASH", "weapons/sword_slash.png"),
+            ("font", "title", 24),
+            ("font", "body", 18),
+            ("font", "ui", 14),
+            ("font", "stats", 16),
+        ],
+        # --- Inimigos do Caminho do Dino (Pistoleiro) ---
+        "DINO_PATH": [
+            ("image", "CACTO1", "enemies/dino_path/cacto1.png"),
+            ("image", "CACTO2", "enemies/dino_path/cacto2.png"),
+            ("image", "BIRD1", "enemies/dino_path/bird1.png"),
+            ("image", "BIRD2", "enemies/dino_path/bird2.png"),
+            ("image", "CACTO3", "enemies/dino_path/cacto3.png"), # Boss
+            ("frames", "BIRD", ("BIRD_1", "BIRD_2")), # Bird1 e Bird2 usam a animação do modo Normal
+        ],
+        # --- Inimigos do Caminho do Bero (Espadachim) ---
+        "BERO_PATH": [
+            ("image", "MIGUEL", "enemies/bero_path/miguel.png"),
+            ("image", "PAM", "enemies/bero_path/pam.png"),
+            ("image", "TEKI", "enemies/bero_path/teki.png"),
+            ("image", "DANN", "enemies/bero_path/dann.png"),
+            ("image", "BERO", "enemies/bero_path/bero.png"), # Boss
+        ],
+    }
+
+    # Manifestos de que cada modo de jogo precisa antes de começar.
+    MODE_ASSET_GROUPS = {
+        "NORMAL": ("NORMAL",),
+        "ROGUELITE": ("ROGUELITE", "DINO_PATH", "BERO_PATH"),
+    }
+
+    def __init__(self, groups=None, scaled_cache_max_bytes=SCALED_CACHE_MAX_BYTES, cache_dir=ASSET_CACHE_DIR):
+        """
+        Args:
+            groups (iterable, opcional): Manifestos a carregar já no construtor. Por omissão carrega
+                todos; o GameController carrega só o "MENU" e pré-carrega o resto em fundo.
+            scaled_cache_max_bytes (int): Limite de memória do cache de imagens redimensionadas.
+            cache_dir (str): Pasta da cache em disco; None desativa-a.
+        """
         self.assets_dir = os.path.join(os.path.dirname(__file__), "..", "assets")
         self.images = {}
         self.fonts = {}
-        self._load_assets()
+        # Caminhos de todas as imagens registadas, para as descodificar só quando forem precisas.
+        self.image_paths = {}
+        self.decoded_images = 0
+        self.baked_cache = BakedAssetCache(cache_dir) if cache_dir else None
+
+        # Cache de imagens redimensionadas, partilhado por todas as entidades.
+        # A chave é (nome, (largura, altura)); a ordem do dicionário serve de LRU.
+        self.scaled_cache = OrderedDict()
+        self.scaled_cache_max_bytes = scaled_cache_max_bytes
+        self.scaled_cache_bytes = 0
+        self.scaled_cache_hits = 0
+        self.scaled_cache_misses = 0
+        # Rotações quantizadas de sprites (balas, golpes de espada), partilhadas entre partidas.
+        self.rotations = RotationCache()
+        # Versões viradas e tingidas (flash, lento, dano) das imagens desenhadas a cada frame.
+        self.variants = SurfaceVariants()
+
+        # Carregamento por manifestos: cada grupo tem um evento que fica ativo quando termina.
+        self.frame_names = {}
+        self.font_sizes = {}
+        self.group_loaded_entries = {}
+        self.group_events = {}
+        self.prefetch_thread = None
+        self._lock = threading.RLock()
+        self._register_manifests()
+
+        start_time = time.perf_counter()
+        for group in (self.ASSET_MANIFESTS if groups is None else groups):
+            self.load_group(group)
+        self.load_seconds = time.perf_counter() - start_time
+
+    def _register_manifests(self):
+        """Regista os caminhos, listas de frames e fontes de todos os manifestos, sem carregar nada."""
+        for group, entries in self.ASSET_MANIFESTS.items():
+            for kind, name, value in entries:
+                if kind == "image":
+                    self.image_paths[name] = (value, True)
+                elif kind == "frames":
+                    self.frame_names[name] = value
+                elif kind == "font":
+                    self.font_sizes[name] = value
+            self.group_loaded_entries[group] = 0
+            self.group_events[group] = threading.Event()
+
+    def load_group(self, group):
+        """Carrega de forma síncrona todos os assets de um manifesto (ex: "MENU")."""
+        if self.group_events[group].is_set():
+            return
+        for entry in self.ASSET_MANIFESTS[group]:
+            self._load_entry(entry)
+            self.group_loaded_entries[group] += 1
+        self.group_events[group].set()
+
+    def _load_entry(self, entry):
+        """Carrega uma entrada de manifesto; entradas já carregadas por outro grupo são ignoradas."""
+        kind, name, _ = entry
+        if kind == "image" and name in self.BAKED_SIZES:
+            # Só é usada redimensionada: carrega os tamanhos finais (da cache em disco, se existir).
+            for size in self.BAKED_SIZES[name]:
+                self.get_scaled(name, size)
+        elif kind == "font":
+            self.get_font(name)
+        else:
+            self.get_image(name)
+
+    def start_prefetch(self, groups=None):
+        """
+        Carrega os manifestos em falta numa thread de fundo.
+
+        O jogo pode continuar a desenhar (ex: o menu) enquanto isto acontece; quem precisar
+        de um modo completo deve chamar wait_for_mode().
+        """
+        if self.prefetch_thread is not None:
+            return
+        pending = [group for group in (groups or self.ASSET_MANIFESTS) if not self.group_events[group].is_set()]
+        self.prefetch_thread = threading.Thread(target=self._prefetch, args=(pending,), name="asset-prefetch", daemon=True)
+        self.prefetch_thread.start()
+
+    def _prefetch(self, groups):
+        """Corpo da thread de fundo: carrega os grupos pela ordem recebida."""
+        for group in groups:
+            try:
+                self.load_group(group)
+            except Exception as error:
+                # Os assets em falta continuam a ser carregados a pedido por get_image/get_font.
+                print(f"AVISO: Falha ao pré-carregar o grupo '{group}': {error}")
+                self.group_events[group].set()
+
+    def wait_for_mode(self, mode):
+        """Bloqueia até os manifestos de um modo de jogo ("NORMAL" ou "ROGUELITE") estarem carregados."""
+        for group in self.MODE_ASSET_GROUPS.get(mode, (mode,)):
+            if self.group_events[group].is_set():
+                continue
+            if self.prefetch_thread is not None and self.prefetch_thread.is_alive():
+                self.group_events[group].wait()
+            else:
+                self.load_group(group)
 
-    def _load_image(self, name, path, convert_alpha=True):
-        """Função auxiliar para carregar e otimizar uma imagem."""
+    def get_load_progress(self, groups=None):
+        """Retorna a fração (0.0 a 1.0) das entradas carregadas nos grupos dados (todos, por omissão)."""
+        groups = groups or self.ASSET_MANIFESTS
+        total = sum(len(self.ASSET_MANIFESTS[group]) for group in groups)
+        loaded = sum(self.group_loaded_entries[group] for group in groups)
+        return loaded / total if total else 1.0
+
+    def is_fully_loaded(self):
+        """Indica se todos os manifestos já foram carregados."""
+        return all(event.is_set() for event in self.group_events.values())
+
+    def _decode_image(self, name):
+        """Descodifica o PNG registado com o nome dado e guarda o resultado."""
+        path, convert_alpha = self.image_paths[name]
         full_path = os.path.join(self.assets_dir, path)
+        self.decoded_images += 1
         try:
             image = pygame.image.load(full_path)
             # Armazena a imagem carregada no dicionário
@@ -27,84 +238,107 @@ class AssetManager:
             self.images[name] = placeholder
             return placeholder
 
-    def _load_font(self, name, path, size):
-        """Função auxiliar para carregar uma fonte."""
-        self.fonts[name] = pygame.font.Font(path, size)
-
-    def _load_assets(self):
-        """Carrega todas as imagens e fontes do jogo."""
-        
-        # --- Assets Gerais e do Modo Normal ---
-        self._load_image("ICON", "DinoWallpaper.png")
-        self._load_image("BG", "Other/Track.png")
-        self._load_image("CLOUD", "Other/Cloud.png")
-        self._load_image("HEART", "Other/SmallHeart.png")
-        self._load_image("SHIELD_ICON", "Other/shield.png")
-        self._load_image("HAMMER_ICON", "Other/hammer.png")
-
-        # --- Dinossauro (Modo Normal) ---
-        self._load_image("DINO_START", "Dino/DinoStart.png")
-        self._load_image("DINO_JUMP", "Dino/DinoJump.png")
-        self._load_image("DINO_DEAD", "Dino/DinoDead.png")
-        self.images["DINO_RUNNING"] = [
-            self._load_image("DINO_RUN1", "Dino/DinoRun1.png"),
-            self._load_image("DINO_RUN2", "Dino/DinoRun2.png")
-        ]
-        self.images["DINO_DUCKING"] = [
-            self._load_image("DINO_DUCK1", "Dino/DinoDuck1.png"),
-            self._load_image("DINO_DUCK2", "Dino/DinoDuck2.png")
-        ]
-
-        # --- Obstáculos (Modo Normal) ---
-        self.images["SMALL_CACTUS"] = [
-            self._load_image("SMALL_CACTUS_1", "Cactus/SmallCactus1.png"),
-            self._load_image("SMALL_CACTUS_2", "Cactus/SmallCactus2.png"),
-            self._load_image("SMALL_CACTUS_3", "Cactus/SmallCactus3.png"),
-        ]
-        self.images["LARGE_CACTUS"] = [
-            self._load_image("LARGE_CACTUS_1", "Cactus/LargeCactus1.png"),
-            self._load_image("LARGE_CACTUS_2", "Cactus/LargeCactus2.png"),
-            self._load_image("LARGE_CACTUS_3", "Cactus/LargeCactus3.png"),
-        ]
-        self.images["BIRD"] = [
-            self._load_image("BIRD_1", "Bird/Bird1.png"),
-            self._load_image("BIRD_2", "Bird/Bird2.png")
-        ]
-        
-        # --- Personagem (Modo Roguelite) ---
-        self._load_image("BERO_START", "Bero/Bero.png")
-        self.images["BERO_RUNNING"] = [ self.images["BERO_START"], self.images["BERO_START"] ]
-        
-        # --- Inimigos e Armas (Modo Roguelite) ---
-        self._load_image("BULLET", "weapons/fireball.png")
-        self._load_image("ENEMY_BULLET", "weapons/enemy_bullet.png")
-        self._load_image("SHARD", "weapons/shard.png")
-        self._load_image("SWORD_SLASH", "weapons/sword_slash.png")
+    def get_image(self, name):
+        """Retorna uma imagem carregada pelo nome, carregando-a na hora se ainda não o foi."""
+        image = self.images.get(name)
+        if image is None and (name in self.image_paths or name in self.frame_names):
+            with self._lock:
+                # Outra thread pode ter acabado de carregar a mesma imagem.
+                image = self.images.get(name)
+                if image is None and name in self.frame_names:
+                    image = [self.get_image(frame) for frame in self.frame_names[name]]
+                    self.images[name] = image
+                elif image is None:
+                    image = self._decode_image(name)
+        return image
 
-        # --- Inimigos do Caminho do Dino (Pistoleiro) ---
-        self._load_image("CACTO1", "enemies/dino_path/cacto1.png")
-        self._load_image("CACTO2", "enemies/dino_path/cacto2.png")
-        self._load_image("BIRD1", "enemies/dino_path/bird1.png")
-        self._load_image("BIRD2", "enemies/dino_path/bird2.png")
-        self._load_image("CACTO3", "enemies/dino_path/cacto3.png") # Boss
+    def get_font(self, name):
+        """Retorna uma fonte carregada pelo nome, carregando-a na hora se ainda não o foi."""
+        font = self.fonts.get(name)
+        if font is None and name in self.font_sizes:
+            with self._lock:
+                font = self.fonts.get(name)
+                if font is None:
+                    font = self.fonts[name] = pygame.font.Font(FONT_PATH, self.font_sizes[name])
+        return font
 
-        # --- Inimigos do Caminho do Bero (Espadachim) ---
-        self._load_image("MIGUEL", "enemies/bero_path/miguel.png")
-        self._load_image("PAM", "enemies/bero_path/pam.png")
-        self._load_image("TEKI", "enemies/bero_path/teki.png")
-        self._load_image("DANN", "enemies/bero_path/dann.png")
-        self._load_image("BERO", "enemies/bero_path/bero.png") # Boss
-
-        # --- Fontes ---
-        self._load_font("title", FONT_PATH, 24)
-        self._load_font("body", FONT_PATH, 18)
-        self._load_font("ui", FONT_PATH, 14)
-        self._load_font("stats", FONT_PATH, 16)
+    def get_scaled(self, name, size):
+        """
+        Retorna a imagem 'name' redimensionada para 'size' (largura, altura).
 
-    def get_image(self, name):
-        """Retorna uma imagem carregada pelo nome."""
-        return self.images.get(name)
+        O redimensionamento só é feito na primeira vez; os pedidos seguintes
+        recebem a mesma superfície, por isso quem a usa não a deve alterar.
+        Se 'name' for uma lista de frames, devolve uma lista com cada frame redimensionado.
+        """
+        key = (name, (int(size[0]), int(size[1])))
+        # O lock protege o LRU, que também é preenchido pela thread de pré-carregamento.
+        with self._lock:
+            cached = self.scaled_cache.get(key)
+            if cached is not None:
+                self.scaled_cache.move_to_end(key)
+                self.scaled_cache_hits += 1
+                return cached
 
-    def get_font(self, name):
-        """Retorna uma fonte carregada pelo nome."""
-        return self.fonts.get(name)
+            self.scaled_cache_misses += 1
+            source_path = self._source_path(name)
+            scaled = None
+            if self.baked_cache and source_path:
+                scaled = self.baked_cache.load(source_path, key[1])
+
+            if scaled is None:
+                source = self.get_image(name)
+                if isinstance(source, list):
+                    scaled = [pygame.transform.scale(frame, key[1]) for frame in source]
+                else:
+                    scaled = pygame.transform.scale(source, key[1])
+                    if self.baked_cache and source_path:
+                        self.baked_cache.store(source_path, key[1], scaled)
+
+            self.scaled_cache[key] = scaled
+            self.scaled_cache_bytes += self._surface_bytes(scaled)
+            self._trim_scaled_cache()
+            return scaled
+
+    def get_scaled_by(self, name, factor):
+        """Retorna a imagem 'name' multiplicada por 'factor', partilhando o cache de get_scaled."""
+        source = self.get_image(name)
+        width, height = (source[0] if isinstance(source, list) else source).get_size()
+        # Usa o mesmo arredondamento que pygame.transform.scale_by.
+        return self.get_scaled(name, (int(width * factor), int(height * factor)))
+
+    def get_scaled_cache_stats(self):
+        """Retorna as estatísticas do cache de imagens redimensionadas."""
+        return {
+            "hits": self.scaled_cache_hits,
+            "misses": self.scaled_cache_misses,
+            "entries": len(self.scaled_cache),
+            "bytes": self.scaled_cache_bytes,
+        }
+
+    def get_startup_stats(self):
+        """Retorna o tempo de arranque e quantas imagens vieram do PNG ou da cache em disco."""
+        return {
+            "seconds": self.load_seconds,
+            "decoded_images": self.decoded_images,
+            "baked_hits": self.baked_cache.hits if self.baked_cache else 0,
+            "baked_writes": self.baked_cache.writes if self.baked_cache else 0,
+        }
+
+    def _source_path(self, name):
+        """Retorna o caminho completo do PNG de uma imagem registada, ou None (ex: listas)."""
+        entry = self.image_paths.get(name)
+        return os.path.join(self.assets_dir, entry[0]) if entry else None
+
+    def _trim_scaled_cache(self):
+        """Remove as entradas usadas há mais tempo até o cache caber no limite de memória."""
+        # A entrada mais recente nunca é removida, mesmo que sozinha exceda o limite.
+        while self.scaled_cache_bytes > self.scaled_cache_max_bytes and len(self.scaled_cache) > 1:
+            _, evicted = self.scaled_cache.popitem(last=False)
+            self.scaled_cache_bytes -= self._surface_bytes(evicted)
+
+    @staticmethod
+    def _surface_bytes(surface):
+        """Calcula a memória ocupada pelos píxeis de uma superfície (ou lista de superfícies)."""
+        if isinstance(surface, list):
+            return sum(AssetManager._surface_bytes(frame) for frame in surface)
+        return surface.get_pitch() * surface.get_height()
@@ -7,12 +7,36 @@ TITLE = "Dino Runner - Bero Mode"
 SCREEN_WIDTH = 1100
 SCREEN_HEIGHT = 600
 FPS = 30
+# Frames desenhados por segundo (ex: 60, 120, 144). A simulação avança sempre FPS passos
+# por segundo; entre dois passos as posições são interpoladas, por isso mudar este valor
+# não muda a velocidade do jogo.
+RENDER_FPS = 60
+# Tempo máximo (em segundos) de um frame contado para a simulação: depois de um engasgo
+# longo (ex: a carregar assets) o jogo abranda em vez de correr muitos passos de seguida.
+MAX_FRAME_TIME = 0.25
+# Se True, só as regiões alteradas de cada frame são enviadas para o ecrã (display.update(rects)).
+DIRTY_RECT_RENDERING = False
+# Lado (em píxeis) das células da grelha espacial usada nas colisões do modo Roguelite.
+COLLISION_CELL_SIZE = 128
+# Se True, os inimigos do modo Roguelite são movidos todos de uma vez pelo EnemyKinematics
+# (NumPy) em vez de um a um. Só compensa com muitos inimigos.
+ENEMY_KINEMATICS_STORE = False
+# Número máximo de objetos livres guardados em cada pool (balas, estilhaços, números de dano).
+OBJECT_POOL_MAX_SIZE = 512
+
+# --- Cache de Sprites ---
+# Limite de memória (em bytes) para as superfícies redimensionadas guardadas pelo AssetManager.
+SCALED_CACHE_MAX_BYTES = 32 * 1024 * 1024
+# Número de ângulos pré-calculados por sprite rodado (balas e golpes de espada).
+ROTATION_BUCKETS = 64
 
 # --- Caminhos (Paths) ---
 # Define o caminho base para a pasta de assets
 ASSETS_DIR = os.path.join(os.path.dirname(__file__), "..", "assets")
 # Define o caminho completo para a fonte, para ser usado pelo AssetManager
 FONT_PATH = os.path.join(ASSETS_DIR, "font", "PressStart2P-Regular.ttf")
+# Pasta onde o AssetManager guarda as imagens já redimensionadas ("baked") entre arranques
+ASSET_CACHE_DIR = os.path.join(os.path.dirname(__file__), "..", "..", ".asset_cache")
 
 # --- Tipos de Power-up (Exemplo do Modo Normal) ---
 DEFAULT_TYPE = "default"
@@ -0,0 +1,51 @@
+# Ficheiro: dino_runner/utils/dirty_rects.py
+# Descrição: Regista as regiões do ecrã alteradas em cada frame, para que o
+#            GameController só envie essas regiões para o ecrã (display.update(rects)).
+
+import pygame
+
+class DirtyRectTracker:
+    """
+    Junta as áreas desenhadas no frame atual com as do frame anterior.
+
+    Uma região tem de ser atualizada se algo foi desenhado nela agora (posição nova)
+    ou no frame anterior (posição antiga, que agora mostra o fundo).
+    """
+    def __init__(self):
+        self.previous_rects = []
+        self.current_rects = []
+        self.full_redraw = True # O primeiro frame é sempre enviado por inteiro.
+
+    def add(self, rect):
+        """Regista uma área desenhada neste frame (é guardada uma cópia do retângulo)."""
+        self.current_rects.append(pygame.Rect(rect))
+
+    def invalidate(self):
+        """Pede que o próximo frame seja enviado por inteiro (ex: tremor do ecrã, mudança de ecrã)."""
+        self.full_redraw = True
+
+    def collect(self):
+        """
+        Fecha o frame atual e retorna as regiões a atualizar.
+
+        Returns:
+            list[Rect] ou None: None significa "atualizar o ecrã inteiro".
+        """
+        if self.full_redraw:
+            dirty_rects = None
+            self.full_redraw = False
+        else:
+            dirty_rects = self.previous_rects + self.current_rects
+        self.previous_rects = self.current_rects
+        self.current_rects = []
+        return dirty_rects
+
+def count_pushed_pixels(dirty_rects, screen_rect):
+    """Conta os píxeis enviados para o ecrã por um display.update(dirty_rects) (None = ecrã inteiro)."""
+    if dirty_rects is None:
+        return screen_rect.width * screen_rect.height
+    total = 0
+    for rect in dirty_rects:
+        clipped = rect.clip(screen_rect)
+        total += clipped.width * clipped.height
+    return total
@@ -0,0 +1,142 @@
+# Ficheiro: dino_runner/utils/frame_profiler.py
+# Descrição: Perfil de cada frame do GameController (eventos, simulação, desenho, envio
+#            para o ecrã e espera do relógio), com os subsistemas do update do modo de
+#            jogo, e o painel que o mostra (tecla F3) com os percentis p50/p95 recentes.
+
+import time
+from collections import deque
+import pygame
+from dino_runner.utils.constants import SCREEN_HEIGHT
+from dino_runner.utils.section_timer import SectionTimer
+from dino_runner.utils.text_utils import get_font
+
+def percentile(sorted_values, fraction):
+    """Valor na posição 'fraction' (0 a 1) de uma lista já ordenada (vizinho mais próximo)."""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+class FrameProfiler(SectionTimer):
+    """
+    Cronómetro de frames: as voltas (lap) de um frame são guardadas num histórico dos
+    últimos 'history' frames, de onde saem os percentis.
+
+    Desligado, cada chamada é só a verificação do atributo 'enabled' (como no
+    SectionTimer), por isso o GameController chama-o sempre. Com um 'trace', cada frame
+    é também gravado como uma secção "frame" que contém as suas voltas.
+    """
+    def __init__(self, history=120):
+        super().__init__()
+        self.history = history
+        self.samples = {}                         # secção -> ms dos últimos frames
+        self.frame_ms = deque(maxlen=history)     # duração total de cada frame
+        self.frame_start = 0.0
+
+    def clear(self):
+        """Esquece o histórico (ex: ao voltar a mostrar o painel)."""
+        self.samples.clear()
+        self.frame_ms.clear()
+        self.totals.clear()
+
+    def start(self):
+        """Marca o início de um frame."""
+        if self.enabled:
+            self.frame_start = self.mark = time.perf_counter()
+
+    def end_frame(self, children=()):
+        """
+        Fecha o frame e guarda os seus tempos no histórico. 'children' são pares
+        (SectionTimer, prefixo) dos timers do modo de jogo: as suas secções entram com o
+        nome prefixado (ex: "update.player") e os timers são repostos.
+        """
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.frame_ms.append((now - self.frame_start) * 1000)
+        if self.trace is not None:
+            self.trace.span("frame", self.frame_start, now)
+        for child, prefix in children:
+            for name, seconds in child.totals.items():
+                self.totals[prefix + name] = seconds
+            child.reset()
+        for name, seconds in self.totals.items():
+            samples = self.samples.get(name)
+            if samples is None:
+                samples = self.samples[name] = deque(maxlen=self.history)
+            samples.append(seconds * 1000)
+        # Secções que não correram neste frame (ex: a simulação no menu) contam como zero.
+        for name, samples in self.samples.items():
+            if name not in self.totals:
+                samples.append(0.0)
+        self.totals.clear()
+
+    def report(self):
+        """(p50, p95) da duração dos frames e lista de (secção, p50, p95), pela ordem em que apareceram."""
+        frames = sorted(self.frame_ms)
+        rows = []
+        for name, samples in self.samples.items():
+            values = sorted(samples)
+            rows.append((name, percentile(values, 0.5), percentile(values, 0.95)))
+        return (percentile(frames, 0.5), percentile(frames, 0.95)), rows
+
+class ProfilerOverlay:
+    """
+    Painel do perfil desenhado por cima do jogo. O texto só é recomposto a cada
+    'refresh' frames, para ser legível e para o próprio painel custar pouco.
+    """
+    PADDING = 6
+    LINE_HEIGHT = 12
+
+    def __init__(self, refresh=15):
+        self.refresh = refresh
+        self.font = None
+        self.surface = None
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.frames_since_refresh = refresh
+
+    def draw(self, screen, profiler, counts, pools=(), pools_wave=0):
+        """
+        Desenha o painel no canto inferior esquerdo e devolve a região alterada (o painel
+        e, se o texto foi recomposto, também a área do painel anterior). 'pools' são
+        triplos (classe, objetos criados, pico em uso) da wave 'pools_wave'.
+        """
+        self.frames_since_refresh += 1
+        dirty = self.rect
+        if self.surface is None or self.frames_since_refresh >= self.refresh:
+            self.frames_since_refresh = 0
+            self.surface = self.compose(profiler, counts, pools, pools_wave)
+            self.rect = self.surface.get_rect(bottomleft=(10, SCREEN_HEIGHT - 10))
+            dirty = self.rect.union(dirty) if dirty.width else self.rect
+        screen.blit(self.surface, self.rect)
+        return dirty
+
+    def compose(self, profiler, counts, pools=(), pools_wave=0):
+        if self.font is None:
+            self.font = get_font(8)
+        (frame_p50, frame_p95), rows = profiler.report()
+        fps = 1000 / frame_p50 if frame_p50 > 0 else 0
+        lines = [f"PERFIL (F3)  {fps:4.0f} FPS" + ("  [TRACE]" if profiler.trace is not None and profiler.trace.recording else ""),
+                 f"frame       p50 {frame_p50:5.2f}  p95 {frame_p95:5.2f} ms"]
+        # As secções do modo ("update.x") aparecem indentadas logo a seguir à secção mãe.
+        for name, p50, p95 in rows:
+            if "." in name:
+                continue
+            lines.append(f"{name:<18.18}{p50:6.2f} {p95:6.2f}")
+            for child, child_p50, child_p95 in rows:
+                if child.startswith(name + "."):
+                    lines.append(f"  {child[len(name) + 1:]:<16.16}{child_p50:6.2f} {child_p95:6.2f}")
+        for name, count in counts.items():
+            lines.append(f"{name:<18.18}{count:>6}")
+        if pools:
+            lines.append(f"pools wave {pools_wave:<7}{'novos':>6} {'pico':>6}")
+            for name, created, high_water in pools:
+                lines.append(f"  {name:<16.16}{created:>6} {high_water:>6}")
+
+        width = max(self.font.size(line)[0] for line in lines) + 2 * self.PADDING
+        height = len(lines) * self.LINE_HEIGHT + 2 * self.PADDING
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 190))
+        for i, line in enumerate(lines):
+            text = self.font.render(line, True, (0, 255, 120))
+            surface.blit(text, (self.PADDING, self.PADDING + i * self.LINE_HEIGHT))
+        return surface
@@ -0,0 +1,138 @@
+# Ficheiro: dino_runner/utils/frame_trace.py
+# Descrição: Gravação de um "trace" dos frames no formato Chrome trace-event (trace.json),
+#            que abre em chrome://tracing ou em ui.perfetto.dev: as secções de cada frame
+#            aparecem como blocos numa linha do tempo e os momentos do jogo (início de wave,
+#            transformação do chefe, Ground Slam, level-up, Game Over) como marcas.
+
+import json
+import threading
+import time
+from array import array
+
+class FrameTrace:
+    """
+    Grava eventos num buffer circular pré-alocado; uma thread de fundo escreve-os no
+    ficheiro de tempos a tempos, por isso o frame só paga a escrita em alguns arrays.
+
+    Se o jogo gerar mais eventos do que 'capacity' entre duas escritas, os mais antigos
+    são perdidos (e contados em 'dropped'). Parado, cada chamada é só a verificação do
+    atributo 'recording', por isso os ganchos ficam sempre no código do jogo.
+    """
+    PID = 1
+    TID = 1
+
+    def __init__(self, capacity=65536, flush_interval=0.25):
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        # Buffer circular: o evento n fica na posição n % capacity.
+        self.phases = [None] * capacity
+        self.names = [None] * capacity
+        self.categories = [None] * capacity
+        self.args = [None] * capacity
+        self.starts = array("d", bytes(8 * capacity))    # segundos (perf_counter)
+        self.durations = array("d", bytes(8 * capacity))
+        self.head = 0     # eventos escritos pelo jogo
+        self.tail = 0     # eventos já enviados para o ficheiro
+        self.dropped = 0
+        self.recording = False
+        self.path = None
+        self.file = None
+        self.thread = None
+        self.stop_event = threading.Event()
+        self.lock = threading.Lock()   # Só entre a thread de fundo e o stop().
+        self.origin = 0.0
+        self.first_event = True
+
+    def start(self, path):
+        """Começa a gravar para 'path'. Se já estava a gravar, fecha primeiro o trace anterior."""
+        if self.recording:
+            self.stop()
+        self.path = path
+        self.file = open(path, "w")
+        self.file.write('{"displayTimeUnit": "ms", "traceEvents": [\n')
+        self.first_event = True
+        self.head = self.tail = self.dropped = 0
+        self.origin = time.perf_counter()
+        self.write_event({"name": "process_name", "ph": "M", "pid": self.PID, "args": {"name": "Dino Runner"}})
+        self.write_event({"name": "thread_name", "ph": "M", "pid": self.PID, "tid": self.TID, "args": {"name": "jogo"}})
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.flush_loop, name="frame-trace", daemon=True)
+        self.recording = True
+        self.thread.start()
+
+    def stop(self):
+        """Para de gravar, escreve o que falta e fecha o ficheiro. Devolve o caminho do trace."""
+        if not self.recording:
+            return None
+        self.recording = False
+        self.stop_event.set()
+        self.thread.join()
+        self.flush()
+        self.file.write("\n]}\n")
+        self.file.close()
+        self.file = None
+        self.thread = None
+        return self.path
+
+    def span(self, name, start, end, category="frame"):
+        """Regista uma secção de 'start' a 'end' (segundos de time.perf_counter)."""
+        if self.recording:
+            i = self.head % self.capacity
+            self.phases[i] = "X"
+            self.names[i] = name
+            self.categories[i] = category
+            self.args[i] = None
+            self.starts[i] = start
+            self.durations[i] = end - start
+            self.head += 1
+
+    def instant(self, name, category="game", **args):
+        """Regista um acontecimento pontual do jogo, com 'args' visíveis no visualizador."""
+        if self.recording:
+            i = self.head % self.capacity
+            self.phases[i] = "i"
+            self.names[i] = name
+            self.categories[i] = category
+            self.args[i] = args or None
+            self.starts[i] = time.perf_counter()
+            self.durations[i] = 0.0
+            self.head += 1
+
+    def flush_loop(self):
+        while not self.stop_event.wait(self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        """Escreve no ficheiro os eventos gravados desde a última escrita."""
+        with self.lock:
+            head = self.head
+            if head - self.tail > self.capacity:
+                # O jogo deu a volta ao buffer antes de a thread escrever: perdem-se os mais antigos.
+                self.dropped += head - self.tail - self.capacity
+                self.tail = head - self.capacity
+            for n in range(self.tail, head):
+                i = n % self.capacity
+                event = {"name": self.names[i], "cat": self.categories[i], "ph": self.phases[i],
+                         "ts": round((self.starts[i] - self.origin) * 1e6, 1), "pid": self.PID, "tid": self.TID}
+                if self.phases[i] == "X":
+                    event["dur"] = round(self.durations[i] * 1e6, 1)
+                else:
+                    event["s"] = "g" # Marca global: uma linha vertical em todo o trace.
+                    if self.args[i]:
+                        event["args"] = self.args[i]
+                self.write_event(event)
+            self.tail = head
+            self.file.flush()
+
+    def write_event(self, event):
+        if not self.first_event:
+            self.file.write(",\n")
+        self.first_event = False
+        self.file.write(json.dumps(event, separators=(",", ":")))
+
+def trace_filename():
+    """Nome por omissão de um trace gravado com a tecla F4 (com a data e a hora)."""
+    return time.strftime("trace_%Y%m%d_%H%M%S.json")
+
+# Trace partilhado pelo jogo inteiro (os inimigos não conhecem o modo que os criou).
+TRACE = FrameTrace()
@@ -0,0 +1,49 @@
+# Ficheiro: dino_runner/utils/game_clock.py
+# Descrição: Relógio do jogo em milissegundos, usado por todos os temporizadores e cooldowns
+#            (inimigos, armas, personagem, números de dano) em vez de pygame.time.get_ticks().
+#            Cada modo de jogo tem o seu e avança-o a cada passo de simulação.
+
+import pygame
+from dino_runner.utils.constants import FPS
+
+class GameClock:
+    """
+    Tempo de jogo que só avança quando o modo o manda avançar.
+
+    O modo chama tick() uma vez por passo de simulação enquanto o jogo está a correr, por
+    isso a pausa, o level-up e os ecrãs de cartas congelam todos os temporizadores de uma
+    vez. step(ms) avança manualmente (ex: simulações sem ecrã ou testes). time_scale diz
+    quantos segundos de jogo passam por segundo real: o GameController usa-o para decidir
+    quantos passos correr em cada frame.
+    """
+    def __init__(self, start=0, step_ms=1000 / FPS):
+        self.time = float(start)
+        self.step_ms = step_ms
+        self.time_scale = 1.0
+        self.paused = False
+
+    def get_ticks(self):
+        """Milissegundos de jogo decorridos (substitui pygame.time.get_ticks)."""
+        return int(self.time)
+
+    def tick(self):
+        """Avança um passo de simulação, a não ser que o relógio esteja em pausa."""
+        if not self.paused:
+            self.time += self.step_ms
+
+    def step(self, ms):
+        """Avança 'ms' milissegundos, mesmo em pausa."""
+        self.time += ms
+
+    def pause(self):
+        self.paused = True
+
+    def resume(self):
+        self.paused = False
+
+class WallClock:
+    """O relógio real do pygame, com a mesma leitura do GameClock, para objetos criados fora de um modo."""
+    def get_ticks(self):
+        return pygame.time.get_ticks()
+
+WALL_CLOCK = WallClock()
@@ -0,0 +1,113 @@
+# Ficheiro: dino_runner/utils/glyph_atlas.py
+# Descrição: Atlas de glifos (dígitos e rótulos pré-renderizados) para compor números
+#            do HUD e de dano sem chamar font.render a cada frame.
+
+import string
+import pygame
+
+# Caracteres pré-renderizados em todos os atlas (números, tempos, percentagens, frações).
+ATLAS_CHARACTERS = "0123456789-+./:%s "
+# Quantos textos compostos cada atlas guarda (os números de dano repetem-se muito).
+ATLAS_TEXT_CACHE_SIZE = 128
+
+class GlyphAtlas:
+    """
+    Guarda os glifos de uma fonte numa cor e compõe textos com uma única chamada a blits.
+
+    Os rótulos (ex: "HP: ") são pré-renderizados inteiros; os restantes caracteres são
+    compostos glifo a glifo. A fonte do jogo é monoespaçada, por isso o resultado
+    coincide com um font.render do texto completo.
+    """
+    def __init__(self, font, color):
+        self.font = font
+        self.color = color
+        self.glyphs = {char: font.render(char, True, color) for char in ATLAS_CHARACTERS}
+        self.labels = {}
+        self.formats = {}
+        self.texts = {}
+        self.compositions = 0
+
+    def get_label(self, label):
+        """Retorna a superfície de um rótulo fixo, renderizando-o na primeira vez."""
+        surface = self.labels.get(label)
+        if surface is None:
+            surface = self.labels[label] = self.font.render(label, True, self.color)
+        return surface
+
+    def get_glyph(self, char):
+        """Retorna a superfície de um caractere, acrescentando-o ao atlas se faltar."""
+        glyph = self.glyphs.get(char)
+        if glyph is None:
+            glyph = self.glyphs[char] = self.font.render(char, True, self.color)
+        return glyph
+
+    def render(self, text):
+        """Retorna o texto composto a partir dos glifos (com cache dos textos recentes)."""
+        surface = self.texts.get(text)
+        if surface is None:
+            surface = self.compose([self.get_glyph(char) for char in text])
+            if len(self.texts) >= ATLAS_TEXT_CACHE_SIZE:
+                self.texts.clear()
+            self.texts[text] = surface
+        return surface
+
+    def render_format(self, fmt, *values):
+        """
+        Compõe 'fmt.format(*values)': os trechos fixos do formato são rótulos pré-renderizados
+        e os valores são compostos com os glifos.
+        """
+        segments = self.formats.get(fmt)
+        if segments is None:
+            segments = self.formats[fmt] = list(string.Formatter().parse(fmt))
+
+        pieces = []
+        value_index = 0
+        for literal, field, spec, _ in segments:
+            if literal:
+                pieces.append(self.get_label(literal))
+            if field is not None:
+                for char in format(values[value_index], spec or ""):
+                    pieces.append(self.get_glyph(char))
+                value_index += 1
+        return self.compose(pieces)
+
+    def compose(self, pieces):
+        """Junta as superfícies lado a lado numa nova superfície, com um único blits."""
+        width = sum(piece.get_width() for piece in pieces)
+        height = max((piece.get_height() for piece in pieces), default=0)
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        x = 0
+        blit_sequence = []
+        for piece in pieces:
+            # Alinha pela base: glifos sem partes altas (ex: ".") vêm com menos uma linha em cima.
+            blit_sequence.append((piece, (x, height - piece.get_height())))
+            x += piece.get_width()
+        surface.blits(blit_sequence, doreturn=False)
+        self.compositions += 1
+        return surface
+
+class HudText:
+    """Um texto do HUD que só é recomposto quando o seu formato ou os seus valores mudam."""
+    def __init__(self, atlas):
+        self.atlas = atlas
+        self.key = None
+        self.surface = None
+
+    def render(self, fmt, *values):
+        """Retorna a superfície para 'fmt' com 'values', reutilizando a última se nada mudou."""
+        key = (fmt, values)
+        if key != self.key:
+            self.key = key
+            self.surface = self.atlas.render_format(fmt, *values)
+        return self.surface
+
+# Atlas partilhados por (fonte, cor).
+_atlases = {}
+
+def get_atlas(font, color):
+    """Retorna o atlas de glifos de uma fonte numa cor, criando-o na primeira vez."""
+    key = (font, tuple(color))
+    atlas = _atlases.get(key)
+    if atlas is None:
+        atlas = _atlases[key] = GlyphAtlas(font, color)
+    return atlas
@@ -0,0 +1,49 @@
+# Ficheiro: dino_runner/utils/input_source.py
+# Descrição: Origem do input contínuo (teclas premidas, posição e botões do rato) lido pelo
+#            jogador e pelas armas a cada passo. Em jogo é o teclado e o rato reais; numa
+#            simulação sem ecrã é um estado escrito por um bot ou por um script.
+
+import pygame
+
+class LiveInput:
+    """Lê o teclado e o rato reais através do pygame."""
+    def get_keys(self):
+        return pygame.key.get_pressed()
+
+    def get_mouse_pos(self):
+        return pygame.mouse.get_pos()
+
+    def get_mouse_buttons(self):
+        return pygame.mouse.get_pressed()
+
+class KeyState:
+    """Teclas premidas, indexáveis pelas constantes do pygame como o resultado de key.get_pressed()."""
+    def __init__(self, pressed=()):
+        self.pressed = set(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+class ScriptedInput:
+    """
+    Input controlado por código: quem conduz a simulação altera 'keys', 'mouse_pos' e
+    'mouse_buttons' antes de cada passo e o jogo lê-os como se fossem o teclado e o rato.
+    """
+    def __init__(self):
+        self.keys = KeyState()
+        self.mouse_pos = (0, 0)
+        self.mouse_buttons = (False, False, False)
+
+    def set_keys(self, *keys):
+        self.keys.pressed = set(keys)
+
+    def get_keys(self):
+        return self.keys
+
+    def get_mouse_pos(self):
+        return self.mouse_pos
+
+    def get_mouse_buttons(self):
+        return self.mouse_buttons
+
+LIVE_INPUT = LiveInput()
@@ -0,0 +1,51 @@
+# Ficheiro: dino_runner/utils/interpolation.py
+# Descrição: Guarda as posições das entidades no início de cada passo de simulação para
+#            que o desenho, feito a uma frequência maior do que a da simulação, possa
+#            mostrar as posições intermédias entre dois passos.
+
+import pygame
+
+class MotionHistory:
+    """
+    Posições do passo anterior, usadas para desenhar o estado "entre" dois passos.
+
+    Com alpha = 1 desenha-se o estado atual; com alpha = 0, o do passo anterior. As entidades
+    sem posição registada (acabaram de aparecer) ou que saltaram mais do que 'max_jump'
+    píxeis num passo (ex: uma nuvem que volta ao início) são desenhadas na posição atual.
+    """
+    def __init__(self, max_jump=200):
+        self.previous = {}
+        self.max_jump = max_jump
+        self.alpha = 1.0
+
+    def clear(self):
+        self.previous.clear()
+
+    def record(self, key, position):
+        """Regista a posição (x, y) de uma entidade no início do passo."""
+        self.previous[key] = (position[0], position[1])
+
+    def offset(self, key, position, base=(0, 0)):
+        """Deslocamento (somado a 'base') a aplicar à posição atual para a desenhar interpolada."""
+        previous = self.previous.get(key)
+        if previous is None or self.alpha >= 1:
+            return base
+        dx, dy = previous[0] - position[0], previous[1] - position[1]
+        if abs(dx) > self.max_jump or abs(dy) > self.max_jump:
+            return base
+        t = 1 - self.alpha
+        return (base[0] + dx * t, base[1] + dy * t)
+
+    def swept_rect(self, key, position, rect):
+        """
+        'rect' (desenhado com o deslocamento de offset(key, position)) alargado para conter
+        também a sua posição no passo anterior: o desenho interpolado fica sempre dentro
+        deste retângulo, por isso é o que entra nos dirty rects.
+        """
+        rect = pygame.Rect(rect)
+        previous = self.previous.get(key)
+        if previous is not None:
+            dx, dy = previous[0] - position[0], previous[1] - position[1]
+            if abs(dx) <= self.max_jump and abs(dy) <= self.max_jump:
+                rect.union_ip(rect.move(dx, dy))
+        return rect
@@ -0,0 +1,142 @@
+# Ficheiro: dino_runner/utils/nearest_index.py
+# Descrição: Índice de posições dos inimigos para perguntas de vizinhança (o mais próximo,
+#            os k mais próximos, os que estão dentro de um raio), usado no ricochete das
+#            balas e disponível para mira automática ou projéteis teleguiados.
+
+class NearestIndex:
+    """
+    Guarda os centros das entidades em listas planas e em baldes de uma grelha uniforme.
+
+    É reconstruído uma vez por frame (rebuild). As consultas percorrem os baldes em anéis
+    à volta do ponto pedido e param assim que nenhum anel seguinte pode ter algo mais
+    perto, por isso não testam todas as entidades nem criam vetores. Em caso de empate
+    ganha a entidade que vem primeiro na lista original, como num varrimento linear.
+
+    k_nearest e within_radius devolvem sempre uma lista nova (pode ser guardada); só a
+    memória de trabalho das consultas é reutilizada.
+    """
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.entities = []
+        self.xs = []
+        self.ys = []
+        self.alive = []
+        self.slots = {}    # entidade -> posição nas listas
+        self.buckets = {}  # (coluna, linha) -> lista de posições
+        self.bounds = (0, 0, -1, -1)
+        # Memória reutilizada pelas consultas.
+        self.candidates = []
+
+    def rebuild(self, entities):
+        """Recolhe as posições (rect.center) das entidades deste frame."""
+        size = self.cell_size
+        self.entities[:] = entities
+        self.xs[:] = [entity.rect.centerx for entity in entities]
+        self.ys[:] = [entity.rect.centery for entity in entities]
+        self.alive[:] = [True] * len(entities)
+        self.slots.clear()
+        self.buckets.clear()
+        min_x = min_y = max_x = max_y = 0
+        for slot, entity in enumerate(self.entities):
+            self.slots[entity] = slot
+            cell = (self.xs[slot] // size, self.ys[slot] // size)
+            self.buckets.setdefault(cell, []).append(slot)
+            if slot == 0:
+                min_x, min_y, max_x, max_y = cell[0], cell[1], cell[0], cell[1]
+            else:
+                min_x, min_y = min(min_x, cell[0]), min(min_y, cell[1])
+                max_x, max_y = max(max_x, cell[0]), max(max_y, cell[1])
+        self.bounds = (min_x, min_y, max_x, max_y) if self.entities else (0, 0, -1, -1)
+
+    def remove(self, entity):
+        """Deixa de considerar uma entidade até à próxima reconstrução (ex: morreu)."""
+        slot = self.slots.get(entity)
+        if slot is not None:
+            self.alive[slot] = False
+
+    def nearest(self, x, y, exclude=()):
+        """Retorna a entidade mais próxima de (x, y) que não está em 'exclude', ou None."""
+        best = self.k_nearest(x, y, 1, exclude)
+        return best[0] if best else None
+
+    def k_nearest(self, x, y, k, exclude=()):
+        """Retorna até k entidades, da mais próxima para a mais distante, ignorando 'exclude'."""
+        candidates = self.candidates # pares (distância², posição), ordenados
+        candidates.clear()
+        if k <= 0 or not self.entities:
+            return []
+
+        size = self.cell_size
+        # Células inteiras também para posições com casas decimais (ex: Vector2).
+        center_x, center_y = int(x // size), int(y // size)
+        min_x, min_y, max_x, max_y = self.bounds
+        # Anel mais distante que ainda pode conter entidades.
+        max_ring = max(abs(center_x - min_x), abs(center_x - max_x), abs(center_y - min_y), abs(center_y - max_y))
+        ring = 0
+        while ring <= max_ring:
+            self._scan_ring(center_x, center_y, ring, x, y, k, exclude)
+            # Tudo o que está para lá deste anel fica a pelo menos ring * size de distância.
+            reach = ring * size
+            if len(candidates) == k and candidates[-1][0] <= reach * reach:
+                break
+            ring += 1
+
+        entities = self.entities
+        return [entities[slot] for _, slot in candidates]
+
+    def within_radius(self, x, y, radius, exclude=()):
+        """Retorna as entidades a uma distância <= radius de (x, y), pela ordem da lista original."""
+        size = self.cell_size
+        radius_sq = radius * radius
+        xs, ys, alive, entities = self.xs, self.ys, self.alive, self.entities
+        slots = self.candidates
+        slots.clear()
+        for cell_x in range(int((x - radius) // size), int((x + radius) // size) + 1):
+            for cell_y in range(int((y - radius) // size), int((y + radius) // size) + 1):
+                for slot in self.buckets.get((cell_x, cell_y), ()):
+                    dx = xs[slot] - x
+                    dy = ys[slot] - y
+                    if alive[slot] and dx * dx + dy * dy <= radius_sq and entities[slot] not in exclude:
+                        slots.append(slot)
+        slots.sort()
+        return [entities[slot] for slot in slots]
+
+    def _scan_ring(self, center_x, center_y, ring, x, y, k, exclude):
+        """Testa os baldes no anel de raio 'ring' (em células) e atualiza os k melhores candidatos."""
+        if ring == 0:
+            self._scan_bucket((center_x, center_y), x, y, k, exclude)
+            return
+        for cell_x in range(center_x - ring, center_x + ring + 1):
+            self._scan_bucket((cell_x, center_y - ring), x, y, k, exclude)
+            self._scan_bucket((cell_x, center_y + ring), x, y, k, exclude)
+        for cell_y in range(center_y - ring + 1, center_y + ring):
+            self._scan_bucket((center_x - ring, cell_y), x, y, k, exclude)
+            self._scan_bucket((center_x + ring, cell_y), x, y, k, exclude)
+
+    def _scan_bucket(self, cell, x, y, k, exclude):
+        bucket = self.buckets.get(cell)
+        if bucket is None:
+            return
+        xs, ys, alive, entities = self.xs, self.ys, self.alive, self.entities
+        candidates = self.candidates
+        for slot in bucket:
+            if not alive[slot]:
+                continue
+            dx = xs[slot] - x
+            dy = ys[slot] - y
+            dist_sq = dx * dx + dy * dy
+            if len(candidates) == k:
+                worst = candidates[-1]
+                # Empates resolvidos pela ordem na lista original (posição menor ganha).
+                if dist_sq > worst[0] or (dist_sq == worst[0] and slot > worst[1]):
+                    continue
+            if entities[slot] in exclude:
+                continue
+            # Inserção ordenada: k é pequeno, por isso é mais barato do que um heap.
+            index = len(candidates)
+            while index > 0 and (candidates[index - 1][0] > dist_sq or
+                                 (candidates[index - 1][0] == dist_sq and candidates[index - 1][1] > slot)):
+                index -= 1
+            candidates.insert(index, (dist_sq, slot))
+            if len(candidates) > k:
+                candidates.pop()
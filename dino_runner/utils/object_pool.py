@@ -0,0 +1,80 @@
+# Ficheiro: dino_runner/utils/object_pool.py
+# Descrição: Pools de objetos reutilizáveis (balas, estilhaços, números de dano) para
+#            que o combate não crie e deite fora centenas de objetos por segundo.
+
+class ObjectPool:
+    """
+    Guarda objetos de uma classe que já não estão em uso para os reutilizar.
+
+    acquire(*args) devolve um objeto livre reiniciado com obj.reset(*args) (os mesmos
+    argumentos do construtor) ou, se não houver nenhum, cria um novo. release(obj)
+    devolve-o à pool; acima de 'max_size' objetos livres os restantes são descartados.
+    """
+    def __init__(self, cls, max_size):
+        self.cls = cls
+        self.max_size = max_size
+        self.free = []
+        self.created = 0     # objetos novos (alocações)
+        self.reused = 0      # pedidos servidos por objetos livres
+        self.discarded = 0   # objetos devolvidos com a pool já cheia
+        self.in_use = 0
+        self.high_water = 0  # maior número de objetos em uso ao mesmo tempo
+
+    def install(self):
+        """Passa a ser a pool usada por cls.acquire()."""
+        self.cls.pool = self
+        return self
+
+    def acquire(self, *args):
+        if self.free:
+            obj = self.free.pop()
+            obj.in_pool = False
+            obj.reset(*args)
+            self.reused += 1
+        else:
+            obj = self.cls(*args)
+            obj.home_pool = self
+            self.created += 1
+        self.in_use += 1
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+        return obj
+
+    def release(self, obj):
+        """Devolve um objeto à pool. Devolver duas vezes o mesmo objeto não tem efeito."""
+        if obj.in_pool:
+            return
+        self.in_use -= 1
+        if len(self.free) < self.max_size:
+            obj.in_pool = True
+            self.free.append(obj)
+        else:
+            # Descartado: deixa de pertencer à pool, por isso um novo release() já não conta.
+            obj.home_pool = None
+            self.discarded += 1
+
+    def stats(self):
+        return {"created": self.created, "reused": self.reused, "discarded": self.discarded,
+                "in_use": self.in_use, "high_water": self.high_water, "free": len(self.free)}
+
+class Poolable:
+    """
+    Base para classes que podem vir de uma ObjectPool.
+
+    Sem pool instalada, acquire() é igual a chamar o construtor e release() não faz nada.
+    Cada subclasse tem a sua própria pool (não herda a da classe mãe).
+    """
+    pool = None       # pool instalada nesta classe (ObjectPool.install)
+    home_pool = None  # pool que criou este objeto, para onde ele volta
+    in_pool = False
+
+    @classmethod
+    def acquire(cls, *args):
+        pool = cls.__dict__.get("pool")
+        if pool is None:
+            return cls(*args)
+        return pool.acquire(*args)
+
+    def release(self):
+        if self.home_pool is not None:
+            self.home_pool.release(self)
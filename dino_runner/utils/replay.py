@@ -0,0 +1,399 @@
+# Ficheiro: dino_runner/utils/replay.py
+# Descrição: Gravação e leitura de replays. Uma partida é determinada pela semente do seu
+#            gerador aleatório e pelo input de cada passo de simulação (teclas, rato e
+#            eventos), por isso o replay guarda só isso, num formato binário compacto que
+#            pode ser lido por mmap sem carregar o ficheiro inteiro. A reprodução é feita
+#            sem ecrã (ver dino_runner/simulation/headless.py e replay.py).
+#            De N em N segundos de jogo o replay guarda também um snapshot do estado
+#            completo do modo: saltar para um passo qualquer (seek) é repor o snapshot
+#            anterior mais próximo e simular só os passos que faltam.
+#
+# Formato (little-endian):
+#   cabeçalho  HEADER
+#   passos     FRAME por passo de simulação: teclas, rato, botões e os seus eventos
+#   eventos    EVENT por evento, referidos pelos passos (índice do primeiro e quantos)
+#   imagens    SURFACE por imagem usada nos snapshots (onde está e o tamanho)
+#   snapshots  SNAPSHOT por snapshot (passo, onde está, tamanho, se é completo)
+#   dados      as imagens e os snapshots comprimidos com o zlib
+
+import bisect
+import hashlib
+import io
+import mmap
+import os
+import pickle
+import struct
+import time
+import weakref
+import zlib
+import pygame
+from dino_runner.utils.constants import FPS
+from dino_runner.utils.input_source import KeyState, ScriptedInput, LIVE_INPUT
+
+MAGIC = b"DINORPLY"
+VERSION = 3
+MODES = ("NORMAL", "ROGUELITE") # Código do modo no cabeçalho -> game_mode_type do GameController.
+FLAG_FIRST_RUN = 1
+
+# Segundos de jogo entre dois snapshots (por omissão) e de quantos em quantos snapshots
+# um é completo: os outros são comprimidos contra o anterior (ver ReplayRecorder.snapshot).
+SNAPSHOT_SECONDS = 5.0
+KEYFRAME_EVERY = 8
+# Um delta é comprimido em blocos de DELTA_CHUNK bytes, cada um com a zona correspondente
+# do snapshot anterior como dicionário (a janela do zlib é de só 32 KB: um dicionário com o
+# snapshot anterior inteiro não chegava às partes iguais de um estado maior do que isso).
+DELTA_CHUNK = 8192
+DELTA_MARGIN = 12288  # o dicionário começa esta distância antes do bloco (o estado pode ter crescido)
+ZDICT_SIZE = 32768
+# tamanho comprimido de cada bloco de um delta.
+CHUNK = struct.Struct("<I")
+
+# magic, versão, modo, flags, semente, passos, eventos, início dos passos, início dos
+# eventos, pontuação final, resumo do estado final (ver state_digest), passos entre
+# snapshots, n.º de snapshots, início da tabela de snapshots, n.º de imagens, início da
+# tabela de imagens.
+HEADER = struct.Struct("<8sHBBQIIIIqQIIIII")
+# teclas (máscara de REPLAY_KEYS), rato x, rato y, botões (máscara), n.º de eventos, primeiro evento.
+# (o n.º de eventos tem 16 bits: num passo lento podem chegar mais de 255, p. ex. rodas do rato.)
+FRAME = struct.Struct("<HhhBHI")
+# tipo (EVENT_TYPES), botão do rato, x, y, tecla.
+EVENT = struct.Struct("<BBhhi")
+# início e tamanho dos dados de uma imagem.
+SURFACE = struct.Struct("<II")
+# passo antes do qual foi tirado, início e tamanho dos dados, 1 se completo (senão é um delta).
+SNAPSHOT = struct.Struct("<IIIB")
+
+# As teclas lidas com get_keys() pelo jogo. Uma tecla nova lida assim tem de ser juntada
+# aqui (no fim, para os replays antigos continuarem válidos).
+REPLAY_KEYS = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN,
+               pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_s)
+# Eventos passados aos modos que contam para a partida (o QUIT e o movimento do rato não contam).
+EVENT_TYPES = (pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+_EVENT_CODES = {event_type: code for code, event_type in enumerate(EVENT_TYPES, 1)}
+
+def replay_filename(directory, mode_type):
+    """Caminho de um replay novo em 'directory', com o modo e a data e a hora no nome."""
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, time.strftime(f"{mode_type.lower()}_%Y%m%d_%H%M%S.dreplay"))
+
+def state_digest(mode):
+    """
+    Resumo (64 bits) do estado de uma partida: pontuação, relógio, jogador e entidades.
+    Os floats entram pelo repr, por isso dois resumos iguais querem dizer uma partida
+    igual bit a bit, não só parecida.
+    """
+    player = mode.player
+    if hasattr(mode, "enemies"):
+        state = (mode.score, mode.clock.time, mode.game_state, mode.current_wave, tuple(player.rect),
+                 player.health, player.level, player.exp,
+                 tuple((type(e).__name__, tuple(e.rect), e.health) for e in mode.enemies),
+                 tuple(tuple(rect) for rect in mode.projectiles.rects()),
+                 tuple(tuple(rect) for rect in mode.enemy_projectiles.rects()))
+    else:
+        state = (mode.score, mode.clock.time, mode.game_speed, tuple(player.dino_rect), mode.x_pos_bg,
+                 tuple((type(o).__name__, tuple(o.rect)) for o in mode.obstacle_list),
+                 tuple((c.x, c.y) for c in mode.clouds))
+    return int.from_bytes(hashlib.blake2b(repr(state).encode(), digest_size=8).digest(), "little")
+
+def _resources(mode):
+    """
+    Objetos partilhados que um snapshot não copia: no snapshot ficam só com o nome e, ao
+    repor, passam a ser os do modo onde o snapshot é reposto. O próprio modo é um deles
+    (os power-ups oferecidos guardam métodos do modo), tal como as pools de objetos, a que
+    os objetos vindos delas voltam.
+    """
+    resources = {"mode": mode, "screen": mode.screen, "assets": mode.assets, "sounds": mode.sounds,
+                 "settings": mode.settings, "input": mode.input_source}
+    for pool in getattr(mode, "pools", ()):
+        resources["pool:" + pool.cls.__name__] = pool
+    return resources
+
+def _encode_surface(surface):
+    """Os píxeis (RGBA ou RGB), a colorkey e a transparência de uma imagem, para a repor igual."""
+    per_pixel_alpha = bool(surface.get_flags() & pygame.SRCALPHA)
+    pixels = pygame.image.tobytes(surface, "RGBA" if per_pixel_alpha else "RGB")
+    colorkey = surface.get_colorkey()
+    return pickle.dumps((surface.get_size(), per_pixel_alpha, colorkey and tuple(colorkey),
+                         surface.get_alpha(), pixels), pickle.HIGHEST_PROTOCOL)
+
+def _decode_surface(data):
+    size, per_pixel_alpha, colorkey, alpha, pixels = pickle.loads(data)
+    surface = pygame.image.frombytes(pixels, size, "RGBA" if per_pixel_alpha else "RGB")
+    surface = surface.convert_alpha() if per_pixel_alpha else surface.convert()
+    if colorkey is not None:
+        surface.set_colorkey(colorkey)
+    if alpha is not None and not per_pixel_alpha:
+        surface.set_alpha(alpha)
+    return surface
+
+def _delta_dictionary(previous, start):
+    begin = max(0, start - DELTA_MARGIN)
+    return previous[begin:begin + ZDICT_SIZE]
+
+def delta_compress(state, previous):
+    """Comprime 'state' contra 'previous' (ver DELTA_CHUNK): o que não mudou fica como referências ao anterior."""
+    out = bytearray()
+    for start in range(0, len(state), DELTA_CHUNK):
+        compressor = zlib.compressobj(zdict=_delta_dictionary(previous, start))
+        data = compressor.compress(state[start:start + DELTA_CHUNK]) + compressor.flush()
+        out += CHUNK.pack(len(data)) + data
+    return bytes(out)
+
+def delta_decompress(data, previous):
+    """Inverso de delta_compress, com o mesmo 'previous'."""
+    state = bytearray()
+    offset = 0
+    while offset < len(data):
+        (length,) = CHUNK.unpack_from(data, offset)
+        offset += CHUNK.size
+        decompressor = zlib.decompressobj(zdict=_delta_dictionary(previous, len(state)))
+        state += decompressor.decompress(data[offset:offset + length]) + decompressor.flush()
+        offset += length
+    return bytes(state)
+
+class SurfaceTable:
+    """
+    As imagens referidas pelos snapshots de um replay. Cada imagem diferente é gravada uma
+    só vez no ficheiro (as dos assets são as mesmas em todos os snapshots) e os snapshots
+    referem-na pelo número.
+    """
+    def __init__(self):
+        self.numbers = weakref.WeakKeyDictionary() # Surface -> número (sem a codificar de novo)
+        self.by_content = {}                       # resumo dos píxeis -> número
+        self.blobs = []                            # dados comprimidos de cada imagem
+
+    def __len__(self):
+        return len(self.blobs)
+
+    def add(self, surface):
+        number = self.numbers.get(surface)
+        if number is None:
+            data = _encode_surface(surface)
+            key = hashlib.blake2b(data, digest_size=16).digest()
+            number = self.by_content.get(key)
+            if number is None:
+                number = self.by_content[key] = len(self.blobs)
+                self.blobs.append(zlib.compress(data))
+            self.numbers[surface] = number
+        return number
+
+class _SnapshotPickler(pickle.Pickler):
+    """Grava o estado de um modo com os recursos partilhados por nome e as imagens por número."""
+    def __init__(self, file, mode, surfaces):
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self.resource_names = {id(obj): name for name, obj in _resources(mode).items()}
+        self.surfaces = surfaces
+
+    def persistent_id(self, obj):
+        name = self.resource_names.get(id(obj))
+        if name is not None:
+            return name
+        if isinstance(obj, pygame.Surface):
+            return self.surfaces.add(obj)
+        return None
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    def __init__(self, file, mode, load_surface):
+        super().__init__(file)
+        self.resources = _resources(mode)
+        self.load_surface = load_surface
+
+    def persistent_load(self, pid):
+        if isinstance(pid, str):
+            return self.resources[pid]
+        return self.load_surface(pid)
+
+class ReplayRecorder:
+    """
+    Grava o input de uma partida ao vivo. O modo lê o teclado e o rato através de
+    'self.input' (um ScriptedInput) e capture() copia para lá o input real antes de cada
+    passo: o que o jogo vê é exatamente o que fica gravado.
+
+    A cada 'snapshot_seconds' segundos de jogo (0 = nunca) capture() guarda também um
+    snapshot do modo, tirado antes do passo.
+    """
+    def __init__(self, path, mode_type, seed, first_run=False, source=LIVE_INPUT, snapshot_seconds=SNAPSHOT_SECONDS):
+        self.path = path
+        self.mode_type = mode_type
+        self.seed = seed
+        self.flags = FLAG_FIRST_RUN if first_run else 0
+        self.source = source
+        self.input = ScriptedInput()
+        self.frames = bytearray()
+        self.events = bytearray()
+        self.frame_count = 0
+        self.event_count = 0
+        self.snapshot_interval = round(snapshot_seconds * FPS)
+        self.snapshots = []      # (passo, completo, dados comprimidos)
+        self.surfaces = SurfaceTable()
+        self.previous_state = b""
+
+    def capture(self, events, mode=None):
+        """
+        Lê o input real para o passo seguinte e grava-o com os eventos desse passo. Com o
+        'mode', tira o snapshot se o passo for múltiplo do intervalo entre snapshots.
+        """
+        if (mode is not None and self.snapshot_interval and self.frame_count
+                and self.frame_count % self.snapshot_interval == 0):
+            self.snapshot(mode)
+        keys = self.source.get_keys()
+        mask = 0
+        pressed = []
+        for bit, key in enumerate(REPLAY_KEYS):
+            if keys[key]:
+                mask |= 1 << bit
+                pressed.append(key)
+        self.input.keys.pressed = set(pressed)
+        x, y = self.input.mouse_pos = tuple(self.source.get_mouse_pos())
+        buttons = self.input.mouse_buttons = tuple(bool(b) for b in self.source.get_mouse_buttons()[:3])
+        button_mask = buttons[0] | buttons[1] << 1 | buttons[2] << 2
+
+        first_event = self.event_count
+        count = 0
+        for event in events:
+            code = _EVENT_CODES.get(event.type)
+            if code is None:
+                continue
+            if code <= 2:
+                self.events += EVENT.pack(code, 0, 0, 0, event.key)
+            else:
+                self.events += EVENT.pack(code, event.button, event.pos[0], event.pos[1], 0)
+            count += 1
+        self.event_count += count
+        self.frames += FRAME.pack(mask, x, y, button_mask, count, first_event)
+        self.frame_count += 1
+
+    def snapshot(self, mode):
+        """
+        Guarda o estado do modo (mode.snapshot_state()) antes do passo seguinte. Um em cada
+        KEYFRAME_EVERY é comprimido sozinho; os outros são deltas do anterior (ver
+        delta_compress), por isso o que não mudou (classes, atributos, valores iguais)
+        quase não ocupa espaço. Repor um delta obriga a descomprimir os anteriores até ao
+        último completo.
+        """
+        buffer = io.BytesIO()
+        _SnapshotPickler(buffer, mode, self.surfaces).dump(mode.snapshot_state())
+        state = buffer.getvalue()
+        keyframe = len(self.snapshots) % KEYFRAME_EVERY == 0
+        if keyframe:
+            data = zlib.compress(state)
+        else:
+            data = delta_compress(state, self.previous_state)
+        self.snapshots.append((self.frame_count, keyframe, data))
+        self.previous_state = state
+
+    def save(self, mode):
+        """Escreve o ficheiro, com a pontuação e o resumo do estado no fim da partida."""
+        frames_offset = HEADER.size
+        events_offset = frames_offset + len(self.frames)
+        surfaces_offset = events_offset + len(self.events)
+        snapshots_offset = surfaces_offset + len(self.surfaces) * SURFACE.size
+        offset = snapshots_offset + len(self.snapshots) * SNAPSHOT.size
+        header = HEADER.pack(MAGIC, VERSION, MODES.index(self.mode_type), self.flags, self.seed,
+                             self.frame_count, self.event_count, frames_offset, events_offset,
+                             mode.score, state_digest(mode), self.snapshot_interval,
+                             len(self.snapshots), snapshots_offset, len(self.surfaces), surfaces_offset)
+        with open(self.path, "wb") as f:
+            f.write(header)
+            f.write(self.frames)
+            f.write(self.events)
+            for data in self.surfaces.blobs:
+                f.write(SURFACE.pack(offset, len(data)))
+                offset += len(data)
+            for step, keyframe, data in self.snapshots:
+                f.write(SNAPSHOT.pack(step, offset, len(data), keyframe))
+                offset += len(data)
+            for data in self.surfaces.blobs:
+                f.write(data)
+            for step, keyframe, data in self.snapshots:
+                f.write(data)
+        return self.path
+
+class Replay:
+    """
+    Um replay aberto por mmap: os passos e os snapshots são lidos do ficheiro à medida
+    que são pedidos, por isso um replay longo não é carregado para a memória de uma vez.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, "rb")
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, mode_code, self.flags, self.seed, self.frame_count, self.event_count,
+         self.frames_offset, self.events_offset, self.final_score, self.final_digest, self.snapshot_interval,
+         self.snapshot_count, self.snapshots_offset, self.surface_count, self.surfaces_offset) = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} não é um replay do Dino Runner")
+        if version != VERSION:
+            raise ValueError(f"{path}: versão {version} do formato de replay não suportada (esperada {VERSION})")
+        self.mode_type = MODES[mode_code]
+        self.first_run = bool(self.flags & FLAG_FIRST_RUN)
+        self.snapshot_steps = [SNAPSHOT.unpack_from(self.data, self.snapshots_offset + i * SNAPSHOT.size)[0]
+                               for i in range(self.snapshot_count)]
+        self.surfaces = {} # número -> Surface já lida (partilhada por todos os snapshots repostos)
+
+    def __len__(self):
+        return self.frame_count
+
+    def close(self):
+        self.data.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def apply(self, index, controls):
+        """Escreve no ScriptedInput 'controls' o input do passo 'index' e devolve os seus eventos."""
+        mask, x, y, buttons, count, first = FRAME.unpack_from(self.data, self.frames_offset + index * FRAME.size)
+        controls.keys = KeyState(key for bit, key in enumerate(REPLAY_KEYS) if mask >> bit & 1)
+        controls.mouse_pos = (x, y)
+        controls.mouse_buttons = (bool(buttons & 1), bool(buttons & 2), bool(buttons & 4))
+        events = []
+        offset = self.events_offset + first * EVENT.size
+        for _ in range(count):
+            code, button, ex, ey, key = EVENT.unpack_from(self.data, offset)
+            offset += EVENT.size
+            event_type = EVENT_TYPES[code - 1]
+            if code <= 2:
+                events.append(pygame.event.Event(event_type, key=key))
+            else:
+                events.append(pygame.event.Event(event_type, button=button, pos=(ex, ey)))
+        return events
+
+    def snapshot_before(self, index):
+        """Número do último snapshot tirado no passo 'index' ou antes (None se não há nenhum)."""
+        position = bisect.bisect_right(self.snapshot_steps, index) - 1
+        return position if position >= 0 else None
+
+    def snapshot_data(self, number):
+        """O estado (pickle) do snapshot 'number', descomprimindo os deltas desde o último completo."""
+        first = number
+        while not SNAPSHOT.unpack_from(self.data, self.snapshots_offset + first * SNAPSHOT.size)[3]:
+            first -= 1
+        state = b""
+        for i in range(first, number + 1):
+            _, offset, length, keyframe = SNAPSHOT.unpack_from(self.data, self.snapshots_offset + i * SNAPSHOT.size)
+            if keyframe:
+                state = zlib.decompress(self.data[offset:offset + length])
+            else:
+                state = delta_decompress(self.data[offset:offset + length], state)
+        return state
+
+    def load_surface(self, number):
+        surface = self.surfaces.get(number)
+        if surface is None:
+            offset, length = SURFACE.unpack_from(self.data, self.surfaces_offset + number * SURFACE.size)
+            surface = self.surfaces[number] = _decode_surface(zlib.decompress(self.data[offset:offset + length]))
+        return surface
+
+    def restore(self, number, mode):
+        """
+        Repõe o snapshot 'number' em 'mode' (um modo novo, criado com a semente do replay)
+        e devolve o passo do replay em que a reprodução deve continuar. As imagens das
+        entidades repostas são cópias, com os mesmos píxeis, das da partida gravada.
+        """
+        state = _SnapshotUnpickler(io.BytesIO(self.snapshot_data(number)), mode, self.load_surface).load()
+        mode.restore_state(state)
+        return self.snapshot_steps[number]
@@ -0,0 +1,48 @@
+# Ficheiro: dino_runner/utils/rotation_cache.py
+# Descrição: Cache de sprites rodados em ângulos quantizados, para evitar um
+#            pygame.transform.rotate por cada tiro ou golpe de espada.
+
+import pygame
+from dino_runner.utils.constants import ROTATION_BUCKETS
+
+class RotationCache:
+    """
+    Guarda, para cada sprite base, as suas rotações em N ângulos fixos ("buckets").
+
+    A chave identifica a imagem base (ex: ("BULLET", (30, 30), tinta)); quem pede
+    recebe a rotação pré-calculada mais próxima do ângulo pedido.
+    """
+    def __init__(self, buckets=ROTATION_BUCKETS):
+        self.buckets = buckets
+        self.bucket_angle = 360 / buckets
+        self.frames = {}
+        self.hits = 0
+        self.misses = 0
+        self.rotations = 0 # Total de chamadas a transform.rotate feitas pelo cache
+
+    def get(self, key, angle, build_base, *build_args):
+        """
+        Retorna a rotação de 'key' mais próxima de 'angle' (em graus).
+
+        Na primeira vez que a chave aparece, build_base(*build_args) cria a imagem base
+        e todas as rotações são pré-calculadas de uma só vez.
+        """
+        frames = self.frames.get(key)
+        if frames is None:
+            self.misses += 1
+            base_image = build_base(*build_args)
+            frames = [pygame.transform.rotate(base_image, i * self.bucket_angle) for i in range(self.buckets)]
+            self.rotations += self.buckets
+            self.frames[key] = frames
+        else:
+            self.hits += 1
+        return frames[round(angle / self.bucket_angle) % self.buckets]
+
+    def invalidate(self, name):
+        """Remove todas as entradas cuja chave começa por 'name' (ex: quando a espada muda de tamanho)."""
+        for key in [key for key in self.frames if key[0] == name]:
+            del self.frames[key]
+
+    def get_stats(self):
+        """Retorna as estatísticas do cache de rotações."""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self.frames), "rotations": self.rotations}
@@ -0,0 +1,38 @@
+# Ficheiro: dino_runner/utils/section_timer.py
+# Descrição: Cronómetro por secções usado dentro dos updates dos modos de jogo para saber
+#            quanto tempo cada subsistema (jogador, inimigos, projéteis, ...) gasta.
+
+import time
+
+class SectionTimer:
+    """
+    Soma o tempo gasto em cada secção de um ciclo, medido por voltas.
+
+    start() marca o início do ciclo e lap(nome) junta à secção 'nome' o tempo decorrido
+    desde a marca anterior. Desligado (por omissão), cada chamada é só a verificação de
+    um atributo, por isso as chamadas podem ficar no código do jogo.
+
+    Com um 'trace' (FrameTrace), cada volta é também gravada como uma secção da linha do
+    tempo, na categoria 'category' (ou na indicada na própria volta).
+    """
+    def __init__(self, enabled=False, category="frame"):
+        self.enabled = enabled
+        self.category = category
+        self.totals = {} # nome da secção -> segundos acumulados
+        self.mark = 0.0
+        self.trace = None
+
+    def start(self):
+        if self.enabled:
+            self.mark = time.perf_counter()
+
+    def lap(self, name, category=None):
+        if self.enabled:
+            now = time.perf_counter()
+            self.totals[name] = self.totals.get(name, 0.0) + now - self.mark
+            if self.trace is not None:
+                self.trace.span(name, self.mark, now, category or self.category)
+            self.mark = now
+
+    def reset(self):
+        self.totals.clear()
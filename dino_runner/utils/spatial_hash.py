@@ -0,0 +1,101 @@
+# Ficheiro: dino_runner/utils/spatial_hash.py
+# Descrição: Grelha espacial uniforme ("spatial hash") para encontrar rapidamente as
+#            entidades perto de um retângulo, em vez de testar todos os pares.
+
+class SpatialHashGrid:
+    """
+    Divide o ecrã em células quadradas e guarda em cada uma as entidades cuja hitbox a toca.
+
+    Uma consulta só olha para as células que o retângulo procurado cobre. Os resultados
+    vêm pela ordem de inserção, para que as colisões sejam resolvidas pela mesma ordem
+    de um varrimento linear da lista original.
+    """
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.cells = {}    # (coluna, linha) -> lista de entidades
+        self.entries = {}  # entidade -> (ordem de inserção, intervalo de células)
+        self.next_order = 0
+
+    def _cell_range(self, rect):
+        """Retorna (coluna mínima, linha mínima, coluna máxima, linha máxima) cobertas pelo retângulo."""
+        size = self.cell_size
+        return (rect.left // size, rect.top // size, (rect.right - 1) // size, (rect.bottom - 1) // size)
+
+    def clear(self):
+        """Remove todas as entidades da grelha."""
+        self.cells.clear()
+        self.entries.clear()
+        self.next_order = 0
+
+    def rebuild(self, entities):
+        """Reconstrói a grelha a partir de uma lista de entidades (com atributo 'hitbox')."""
+        self.clear()
+        for entity in entities:
+            self.insert(entity)
+
+    def insert(self, entity):
+        """Acrescenta uma entidade nas células que a sua hitbox toca."""
+        cell_range = self._cell_range(entity.hitbox)
+        self.entries[entity] = (self.next_order, cell_range)
+        self.next_order += 1
+        self._add_to_cells(entity, cell_range)
+
+    def remove(self, entity):
+        """Retira uma entidade da grelha (ex: quando morre). Ignora entidades que não estão lá."""
+        entry = self.entries.pop(entity, None)
+        if entry is not None:
+            self._remove_from_cells(entity, entry[1])
+
+    def update(self, entity):
+        """Atualiza as células de uma entidade que se moveu; só mexe na grelha se mudou de célula."""
+        entry = self.entries.get(entity)
+        if entry is None:
+            self.insert(entity)
+            return
+        order, old_range = entry
+        new_range = self._cell_range(entity.hitbox)
+        if new_range != old_range:
+            self._remove_from_cells(entity, old_range)
+            self._add_to_cells(entity, new_range)
+            self.entries[entity] = (order, new_range)
+
+    def query(self, rect):
+        """Retorna as entidades das células que 'rect' cobre, pela ordem de inserção (sem repetidos)."""
+        min_x, min_y, max_x, max_y = self._cell_range(rect)
+        cells = self.cells
+        if min_x == max_x and min_y == max_y:
+            # Caso mais comum (balas pequenas): uma só célula, já ordenada e sem repetidos.
+            return list(cells.get((min_x, min_y), ()))
+
+        found = {}
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                for entity in cells.get((cell_x, cell_y), ()):
+                    found[entity] = self.entries[entity][0]
+        return sorted(found, key=found.__getitem__)
+
+    def query_colliding(self, rect):
+        """Como query, mas só retorna as entidades cuja hitbox colide de facto com 'rect'."""
+        return [entity for entity in self.query(rect) if entity.hitbox.colliderect(rect)]
+
+    def _add_to_cells(self, entity, cell_range):
+        min_x, min_y, max_x, max_y = cell_range
+        order = self.entries[entity][0]
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                cell = self.cells.setdefault((cell_x, cell_y), [])
+                # Mantém cada célula ordenada; quase sempre a entidade entra no fim.
+                index = len(cell)
+                while index > 0 and self.entries[cell[index - 1]][0] > order:
+                    index -= 1
+                cell.insert(index, entity)
+
+    def _remove_from_cells(self, entity, cell_range):
+        min_x, min_y, max_x, max_y = cell_range
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                cell = self.cells.get((cell_x, cell_y))
+                if cell is not None:
+                    cell.remove(entity)
+                    if not cell:
+                        del self.cells[(cell_x, cell_y)]
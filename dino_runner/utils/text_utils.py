@@ -3,6 +3,7 @@
 
 import pygame
 import os
+from collections import OrderedDict
 from dino_runner.utils.constants import SCREEN_HEIGHT, SCREEN_WIDTH
 
 FONT_COLOR = (83, 83, 83)
@@ -11,6 +12,61 @@ FONT_SIZE = 22
 # Esta linha torna o ficheiro independente, resolvendo o erro de importação.
 FONT_PATH = os.path.join(os.path.dirname(__file__), '..', 'assets', 'font', 'PressStart2P-Regular.ttf')
 
+# Número máximo de textos renderizados guardados em memória (os menos usados saem primeiro).
+TEXT_CACHE_SIZE = 256
+
+# Fontes já abertas, por tamanho, e textos já renderizados, por (texto, tamanho, cor).
+_font_cache = {}
+_text_cache = OrderedDict()
+_cache_stats = {"font_hits": 0, "font_misses": 0, "text_hits": 0, "text_misses": 0}
+
+def get_font(font_size):
+    """Retorna a fonte do jogo no tamanho pedido, abrindo o ficheiro TTF só na primeira vez."""
+    font = _font_cache.get(font_size)
+    if font is not None:
+        _cache_stats["font_hits"] += 1
+        return font
+
+    _cache_stats["font_misses"] += 1
+    try:
+        # Usa o FONT_PATH definido neste ficheiro.
+        font = pygame.font.Font(FONT_PATH, font_size)
+    except pygame.error:
+        print(f"Aviso: Fonte em '{FONT_PATH}' não encontrada. Usando fonte padrão.")
+        # Usa uma fonte padrão do Pygame como alternativa segura.
+        font = pygame.font.Font(None, int(font_size * 1.5))
+    _font_cache[font_size] = font
+    return font
+
+def render_text(message, font_size=FONT_SIZE, font_color=FONT_COLOR):
+    """
+    Retorna a superfície do texto renderizado, reutilizando renders anteriores iguais.
+
+    A superfície devolvida é partilhada: deve ser apenas desenhada, nunca alterada.
+    """
+    key = (message, font_size, tuple(font_color))
+    text = _text_cache.get(key)
+    if text is not None:
+        _text_cache.move_to_end(key)
+        _cache_stats["text_hits"] += 1
+        return text
+
+    _cache_stats["text_misses"] += 1
+    text = get_font(font_size).render(message, True, font_color)
+    _text_cache[key] = text
+    if len(_text_cache) > TEXT_CACHE_SIZE:
+        _text_cache.popitem(last=False)
+    return text
+
+def get_text_cache_stats():
+    """Retorna os contadores dos caches de fontes e de textos, com a taxa de acerto de cada um."""
+    stats = dict(_cache_stats)
+    for name in ("font", "text"):
+        total = stats[f"{name}_hits"] + stats[f"{name}_misses"]
+        stats[f"{name}_hit_rate"] = stats[f"{name}_hits"] / total if total else 0.0
+    stats["text_entries"] = len(_text_cache)
+    return stats
+
 def draw_message_component(
     message,
     screen,
@@ -24,15 +80,8 @@ def draw_message_component(
 ):
     """Desenha uma mensagem de texto, opcionalmente com um fundo."""
 
-    try:
-        # Usa o FONT_PATH definido neste ficheiro.
-        font = pygame.font.Font(FONT_PATH, font_size)
-    except pygame.error:
-        print(f"Aviso: Fonte em '{FONT_PATH}' não encontrada. Usando fonte padrão.")
-        # Usa uma fonte padrão do Pygame como alternativa segura.
-        font = pygame.font.Font(None, int(font_size * 1.5))
-        
-    text = font.render(message, True, font_color)
+    # A fonte e o texto renderizado vêm dos caches do módulo (ver get_font e render_text).
+    text = render_text(message, font_size, font_color)
     text_rect = text.get_rect(center=(pos_x_center, pos_y_center))
 
     if has_background:
@@ -0,0 +1,53 @@
+# Ficheiro: dino_runner/utils/ui.py
+# Descrição: Camada de interface "retida": ecrãs estáticos (menu, pausa, cartas, game over)
+#            são compostos uma vez e reutilizados até o seu estado mudar.
+
+# Chave impossível de coincidir com um estado real, usada para forçar a recomposição.
+_STALE = object()
+
+class RetainedScreen:
+    """
+    Guarda a composição completa de um ecrã estático.
+
+    A função de construção desenha o ecrã normalmente (e regista os retângulos dos
+    botões); o resultado é copiado e, nos frames seguintes, basta um blit. A
+    construção só volta a correr quando a chave de estado (ex: opção selecionada,
+    definições ativas) muda ou quando o ecrã é invalidado.
+    """
+    def __init__(self):
+        self.key = _STALE
+        self.surface = None
+        self.rebuilds = 0
+
+    def draw(self, screen, key, build, *build_args):
+        """
+        Desenha o ecrã em 'screen'. Retorna True se foi recomposto neste frame.
+
+        Args:
+            screen (Surface): A superfície de destino (o ecrã do jogo).
+            key: Qualquer valor comparável que descreva o estado visível do ecrã.
+            build (callable): Desenha o ecrã completo em 'screen'; chamado com build_args.
+        """
+        if key == self.key and self.surface is not None:
+            screen.blit(self.surface, (0, 0))
+            return False
+
+        build(*build_args)
+        if self.surface is None or self.surface.get_size() != screen.get_size():
+            self.surface = screen.copy()
+        else:
+            self.surface.blit(screen, (0, 0))
+        self.key = key
+        self.rebuilds += 1
+        return True
+
+    def invalidate(self):
+        """Obriga a recompor o ecrã no próximo draw (ex: o fundo do jogo mudou)."""
+        self.key = _STALE
+
+def hit_test(button_rects, pos):
+    """Retorna o nome do primeiro botão (de um dicionário nome -> Rect) que contém 'pos', ou None."""
+    for name, rect in button_rects.items():
+        if rect and rect.collidepoint(pos):
+            return name
+    return None
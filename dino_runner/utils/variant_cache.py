@@ -0,0 +1,40 @@
+# Ficheiro: dino_runner/utils/variant_cache.py
+# Descrição: Cache de variantes de uma superfície (virada e/ou com tinta), para que os
+#            efeitos de flash, lentidão e dano não criem superfícies novas a cada frame.
+
+import weakref
+import pygame
+
+class SurfaceVariants:
+    """
+    Guarda, para cada superfície base, as versões viradas e tingidas já calculadas.
+
+    As variantes são criadas na primeira vez que são pedidas e ficam associadas à
+    superfície base por uma referência fraca: quando a base deixa de ser usada, as
+    suas variantes também são libertadas.
+    """
+    def __init__(self):
+        self.variants = weakref.WeakKeyDictionary()
+        self.builds = 0
+
+    def get(self, surface, flip_x=False, tint=None):
+        """Retorna 'surface' virada na horizontal e/ou somada (BLEND_RGB_ADD) com a cor 'tint'."""
+        if not flip_x and tint is None:
+            return surface
+
+        surface_variants = self.variants.get(surface)
+        if surface_variants is None:
+            surface_variants = self.variants[surface] = {}
+
+        variant = surface_variants.get((flip_x, tint))
+        if variant is None:
+            variant = pygame.transform.flip(surface, True, False) if flip_x else surface.copy()
+            if tint is not None:
+                variant.fill(tint, special_flags=pygame.BLEND_RGB_ADD)
+            surface_variants[(flip_x, tint)] = variant
+            self.builds += 1
+        return variant
+
+    def get_stats(self):
+        """Retorna quantas superfícies base têm variantes e quantas variantes foram criadas."""
+        return {"surfaces": len(self.variants), "builds": self.builds}
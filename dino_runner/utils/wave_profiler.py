@@ -0,0 +1,99 @@
+# Ficheiro: dino_runner/utils/wave_profiler.py
+# Descrição: Perfil com o cProfile de exatamente uma wave do Roguelite (ou de N segundos do
+#            Endless Runner), pedido com a tecla F5 ou pela linha de comandos. O resultado é
+#            gravado num ficheiro .pstats com a wave, a classe e o pico de entidades no nome,
+#            para abrir com "python -m pstats" ou o snakeviz.
+
+import cProfile
+import os
+import pstats
+
+class WaveProfiler:
+    """
+    Fica "armado" até a próxima wave começar (ou a wave 'target_wave', se indicada) e
+    perfila-a do start_next_wave até wave_in_progress voltar a False. No Endless Runner
+    perfila 'seconds' segundos de jogo a partir do passo seguinte.
+
+    Sem captura ativa, os ganchos nos modos são só a verificação de um atributo.
+    """
+    def __init__(self, out_dir="profiles", seconds=10.0):
+        self.out_dir = out_dir
+        self.seconds = seconds
+        self.armed = False
+        self.target_wave = None
+        self.active = False
+        self.profile = None
+        self.label = ""
+        self.peak = 0
+        self.end_ticks = None # Fim da captura do Endless Runner (ms do relógio do modo).
+
+    def arm(self, wave=None, seconds=None):
+        """Perfila a próxima wave (ou a wave 'wave') ou os próximos 'seconds' segundos do Endless."""
+        self.armed = True
+        self.target_wave = wave
+        if seconds is not None:
+            self.seconds = seconds
+
+    def toggle(self):
+        """Tecla F5: arma a captura; se já está armada, desarma; se já está a perfilar, termina-a já."""
+        if self.active:
+            self.stop("_parcial")
+        elif self.armed:
+            self.armed = False
+            print("Perfil da wave cancelado.")
+        else:
+            self.arm()
+            print("Perfil armado: a próxima wave (ou os próximos "
+                  f"{self.seconds:g}s do Endless Runner) será perfilada.")
+
+    def start(self, label):
+        self.armed = False
+        self.active = True
+        self.label = label
+        self.peak = 0
+        self.profile = cProfile.Profile()
+        self.profile.enable()
+
+    def sample(self, entities):
+        """Regista o número de entidades vivas neste passo (para o pico no nome do ficheiro)."""
+        if entities > self.peak:
+            self.peak = entities
+
+    def stop(self, suffix=""):
+        """Termina a captura e grava o .pstats. Devolve o caminho do ficheiro."""
+        if not self.active:
+            return None
+        self.profile.disable()
+        self.active = False
+        os.makedirs(self.out_dir, exist_ok=True)
+        path = os.path.join(self.out_dir, f"{self.label}_peak{self.peak}{suffix}.pstats")
+        self.profile.dump_stats(path)
+        stats = pstats.Stats(self.profile)
+        print(f"Perfil gravado em {path} ({stats.total_tt:.2f}s perfilados)")
+        self.profile = None
+        return path
+
+    # --- Ganchos dos modos de jogo ---
+
+    def wave_started(self, wave, class_name):
+        """Chamado no start_next_wave do Roguelite, antes de os inimigos serem criados."""
+        if self.armed and (self.target_wave is None or self.target_wave == wave):
+            self.start(f"wave{wave:02d}_{class_name}")
+
+    def wave_finished(self, game_over=False):
+        """Chamado quando wave_in_progress volta a False (ou a partida acaba a meio da wave)."""
+        if self.active:
+            self.stop("_gameover" if game_over else "")
+
+    def endless_step(self, mode):
+        """Chamado em cada passo do Endless Runner: começa, amostra e termina a captura de N segundos."""
+        if self.armed:
+            self.start(f"endless_{self.seconds:g}s_speed{mode.game_speed}")
+            self.end_ticks = mode.clock.get_ticks() + self.seconds * 1000
+        elif self.active:
+            self.sample(sum(mode.entity_counts().values()))
+            if mode.clock.get_ticks() >= self.end_ticks:
+                self.stop()
+
+# Captura partilhada pelo jogo (armada pelo GameController, usada pelos modos).
+WAVE_PROFILER = WaveProfiler()
@@ -1,11 +1,41 @@
 # Ficheiro: main.py
 # Autor: [O Seu Nome]
 # Descrição: Ponto de entrada principal do jogo. Inicializa e executa o controlador do jogo.
+#
+# Uso:
+#   python main.py
+#   python main.py --trace trace.json   # grava um trace dos frames desde o arranque (F4 para parar)
+#   python main.py --profile-wave 9     # perfila a wave 9 do Roguelite com o cProfile (F5 = a próxima wave)
+#   python main.py --profile-seconds 20 # perfila 20 segundos do Endless Runner
+#   python main.py --record replays     # grava um replay de cada partida (ver replay.py)
 
+import argparse
 from dino_runner.components.game import GameController
+from dino_runner.utils.wave_profiler import WAVE_PROFILER
+from dino_runner.utils.replay import SNAPSHOT_SECONDS
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Dino Runner")
+    parser.add_argument("--trace", metavar="FICHEIRO", help="grava um trace dos frames (Chrome trace-event) neste ficheiro")
+    parser.add_argument("--profile-wave", metavar="N", type=int, nargs="?", const=0,
+                        help="perfila com o cProfile a wave N do Roguelite (sem N, a primeira wave jogada)")
+    parser.add_argument("--profile-seconds", metavar="S", type=float,
+                        help="perfila S segundos do Endless Runner (a partir do primeiro salto)")
+    parser.add_argument("--profile-dir", default="profiles", help="pasta dos ficheiros .pstats")
+    parser.add_argument("--record", metavar="PASTA", help="grava um replay de cada partida nesta pasta")
+    parser.add_argument("--snapshot-seconds", metavar="S", type=float, default=SNAPSHOT_SECONDS,
+                        help="segundos de jogo entre os snapshots do replay, usados para saltar no replay (0 = sem snapshots)")
+    args = parser.parse_args()
+
+    WAVE_PROFILER.out_dir = args.profile_dir
+    if args.profile_wave is not None or args.profile_seconds is not None:
+        WAVE_PROFILER.arm(args.profile_wave or None, args.profile_seconds)
+
     # Cria uma instância do controlador principal do jogo.
     game = GameController()
+    game.replay_dir = args.record
+    game.snapshot_seconds = args.snapshot_seconds
+    if args.trace:
+        game.start_trace(args.trace)
     # Inicia o loop principal do jogo.
     game.execute()
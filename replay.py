@@ -0,0 +1,63 @@
+# Ficheiro: replay.py
+# Descrição: Reproduz sem ecrã, à velocidade máxima, partidas gravadas com
+#            "python main.py --record PASTA" e confirma que o estado final é igual, bit a
+#            bit, ao da partida original (o resumo do estado é guardado no replay).
+#
+# Uso:
+#   python replay.py replays/roguelite_20260101_120000.dreplay
+#   python replay.py replays/*.dreplay --render   # desenha cada passo (no ecrã "dummy")
+#   python replay.py replays/roguelite.dreplay --seek 5400           # estado antes do passo 5400
+#   python replay.py replays/roguelite.dreplay --seek 5400 --check   # e compara com a reprodução desde o início
+
+import argparse
+import sys
+from dino_runner.simulation.headless import HeadlessSession, run_replay, seek_replay
+from dino_runner.utils.replay import Replay, state_digest
+
+def seek(session, path, replay, args):
+    """Salta para o passo args.seek pelo snapshot mais próximo; com --check, confirma-o contra a reprodução inteira."""
+    report, mode, start = seek_replay(session, replay, args.seek, args.render, not args.verbose)
+    digest = state_digest(mode)
+    origin = f"snapshot do passo {start}" if start else "início (sem snapshot antes)"
+    print(f"{path}: passo {start + report.steps} a partir do {origin} + {report.steps} passos "
+          f"em {report.wall_seconds * 1000:.0f} ms ({replay.snapshot_count} snapshots), "
+          f"score {mode.score}, estado {digest:016x}")
+    if not args.check:
+        return True
+    full, full_mode, _ = seek_replay(session, replay, args.seek, args.render, not args.verbose, use_snapshots=False)
+    same = state_digest(full_mode) == digest
+    print(f"     desde o início: {full.steps} passos em {full.wall_seconds * 1000:.0f} ms, "
+          f"estado {'IGUAL' if same else 'DIFERENTE'} ({state_digest(full_mode):016x})")
+    return same
+
+def main():
+    parser = argparse.ArgumentParser(description="Reproduz replays sem ecrã e verifica se são determinísticos.")
+    parser.add_argument("replays", nargs="+", help="ficheiros .dreplay")
+    parser.add_argument("--render", action="store_true", help="desenha cada passo (no ecrã 'dummy') para o medir")
+    parser.add_argument("--verbose", action="store_true", help="mostra os prints do jogo")
+    parser.add_argument("--seek", metavar="PASSO", type=int, help="só reproduz até este passo, a partir do snapshot mais próximo")
+    parser.add_argument("--check", action="store_true", help="com --seek, compara o estado com o da reprodução desde o início")
+    args = parser.parse_args()
+
+    session = HeadlessSession()
+    mismatches = 0
+    for path in args.replays:
+        with Replay(path) as replay:
+            if args.seek is not None:
+                mismatches += not seek(session, path, replay, args)
+                continue
+            report, mode = run_replay(session, replay, args.render, not args.verbose)
+            digest = state_digest(mode)
+            same = digest == replay.final_digest and mode.score == replay.final_score
+            mismatches += not same
+            line = (f"{path}: {replay.mode_type.lower()} semente {replay.seed}, {report.steps}/{len(replay)} passos "
+                    f"({report.steps_per_second:.0f} passos/s), score {mode.score} (gravado {replay.final_score})")
+            if replay.mode_type == "ROGUELITE":
+                line += f", wave {report.wave_reached}, nível {report.level}"
+            print(line)
+            print(f"     estado final {'IGUAL' if same else 'DIFERENTE'} ({digest:016x} / gravado {replay.final_digest:016x})")
+    session.close()
+    sys.exit(1 if mismatches else 0)
+
+if __name__ == "__main__":
+    main()
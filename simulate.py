@@ -0,0 +1,79 @@
+# Ficheiro: simulate.py
+# Descrição: Corre partidas dos modos Roguelite e Endless Runner sem janela e à velocidade
+#            máxima, jogadas por um bot, e mostra os passos de simulação por segundo, o
+#            resultado de cada partida e o tempo gasto por subsistema. Serve para testes de
+#            balanceamento e de resistência sem ninguém ao teclado.
+#
+# Uso:
+#   python simulate.py roguelite --class pistol --policy random --runs 5
+#   python simulate.py roguelite --class sword --waves 10 --seed 3
+#   python simulate.py endless --runs 3 --seconds 120
+#   python simulate.py endless --bot idle --render   # mede também o desenho
+
+import argparse
+import random
+from dino_runner.simulation.bots import POWERUP_POLICIES, RogueliteBot, EndlessBot, IdleBot
+from dino_runner.simulation.headless import HeadlessSession, run_roguelite, run_endless
+
+def print_run(index, report):
+    """Uma linha por partida: resultado, pontuação e velocidade da simulação."""
+    line = (f"#{index:<3} {report.label:<10} {report.outcome:<10} score {report.score:>7}  "
+            f"jogo {report.sim_seconds:7.1f}s  real {report.wall_seconds:6.2f}s  "
+            f"{report.steps_per_second:8.0f} passos/s")
+    if report.mode_name == "roguelite":
+        line += f"  wave {report.wave_reached:>2} (limpas {report.waves_cleared}), nível {report.level}"
+    print(line)
+    cleared = [wave for wave in report.waves if wave["cleared"]]
+    if cleared:
+        times = ", ".join(f"{wave['wave']}: {wave['clear_seconds']:.1f}s" for wave in cleared)
+        print(f"     tempo para limpar cada wave -> {times}")
+
+def print_sections(reports):
+    """Tempo médio por passo de cada subsistema, somado sobre todas as partidas."""
+    steps = sum(r.steps for r in reports)
+    wall = sum(r.wall_seconds for r in reports)
+    totals = {}
+    for report in reports:
+        for name, seconds in report.sections.items():
+            totals[name] = totals.get(name, 0.0) + seconds
+    if not steps or not wall:
+        return
+    print(f"\nTempo por subsistema ({steps} passos, {steps / wall:.0f} passos/s no total):")
+    for name, seconds in sorted(totals.items(), key=lambda item: -item[1]):
+        print(f"  {name:<18} {seconds * 1e6 / steps:9.1f} us/passo  {seconds / wall * 100:5.1f}%")
+    other = wall - sum(totals.values())
+    print(f"  {'(resto do passo)':<18} {other * 1e6 / steps:9.1f} us/passo  {other / wall * 100:5.1f}%")
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulação sem ecrã dos modos de jogo, jogados por um bot.")
+    parser.add_argument("mode", choices=["roguelite", "endless"])
+    parser.add_argument("--runs", type=int, default=1, help="número de partidas")
+    parser.add_argument("--seconds", type=float, default=600, help="limite de tempo de jogo por partida")
+    parser.add_argument("--seed", type=int, default=0, help="semente do 'random' (partida i usa seed + i)")
+    parser.add_argument("--bot", choices=["auto", "idle"], default="auto", help="'idle' não carrega em nada")
+    parser.add_argument("--class", dest="class_id", choices=["pistol", "sword"], default="pistol",
+                        help="classe do Roguelite (pistol = Mage, sword = Warrior)")
+    parser.add_argument("--policy", choices=sorted(POWERUP_POLICIES), default="random", help="escolha de power-ups")
+    parser.add_argument("--waves", type=int, default=None, help="termina depois de limpar este número de waves")
+    parser.add_argument("--render", action="store_true", help="desenha cada passo (no ecrã 'dummy') para o medir")
+    parser.add_argument("--verbose", action="store_true", help="mostra os prints do jogo")
+    args = parser.parse_args()
+
+    session = HeadlessSession()
+    reports = []
+    for i in range(args.runs):
+        seed = args.seed + i
+        random.seed(seed)
+        if args.mode == "roguelite":
+            bot = IdleBot() if args.bot == "idle" else RogueliteBot(args.class_id, args.policy, seed)
+            report = run_roguelite(session, bot, args.seconds, args.waves, args.render, not args.verbose)
+        else:
+            bot = IdleBot() if args.bot == "idle" else EndlessBot()
+            report = run_endless(session, bot, args.seconds, args.render, not args.verbose)
+        reports.append(report)
+        print_run(i, report)
+    print_sections(reports)
+    session.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+# Ficheiro: sweep.py
+# Descrição: Varrimento de balanceamento do modo Roguelite: corre muitas partidas sem ecrã,
+#            em paralelo em todos os núcleos, para cada combinação de classe, política de
+#            power-ups e multiplicadores dos status dos inimigos, e grava um CSV com uma
+#            linha por wave (sobrevivência, dano causado e tempo para limpar).
+#
+# Uso:
+#   python sweep.py --runs 50                                   # Mage e Warrior, política "random"
+#   python sweep.py --classes sword --policies offense defense --enemy-health 0.8 1.0 1.2
+#   python sweep.py --runs 200 --waves 10 --workers 8 --out balance.csv
+
+import argparse
+from dino_runner.simulation.bots import POWERUP_POLICIES
+from dino_runner.simulation.sweep import build_tasks, run_sweep, summarize
+
+def main():
+    parser = argparse.ArgumentParser(description="Varrimento de balanceamento do Roguelite em vários processos.")
+    parser.add_argument("--classes", nargs="+", choices=["pistol", "sword"], default=["pistol", "sword"],
+                        help="pistol = Mage, sword = Warrior")
+    parser.add_argument("--policies", nargs="+", choices=sorted(POWERUP_POLICIES), default=["random"])
+    parser.add_argument("--enemy-health", nargs="+", type=float, default=[1.0], help="multiplicadores da vida dos inimigos")
+    parser.add_argument("--enemy-damage", nargs="+", type=float, default=[1.0], help="multiplicadores do dano dos inimigos")
+    parser.add_argument("--enemy-speed", nargs="+", type=float, default=[1.0], help="multiplicadores da velocidade dos inimigos")
+    parser.add_argument("--runs", type=int, default=10, help="partidas por combinação")
+    parser.add_argument("--seconds", type=float, default=600, help="limite de tempo de jogo por partida")
+    parser.add_argument("--waves", type=int, default=None, help="termina cada partida depois de limpar este número de waves")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="processos (por omissão, um por núcleo)")
+    parser.add_argument("--out", default="sweep.csv")
+    args = parser.parse_args()
+
+    tasks = build_tasks(args.classes, args.policies, args.enemy_health, args.enemy_damage, args.enemy_speed,
+                        args.runs, args.seed, args.seconds, args.waves)
+    print(f"{len(tasks)} partidas -> {args.out}")
+    rows, seconds = run_sweep(tasks, args.out, args.workers)
+    sim_seconds = sum(row["sim_seconds"] for row in {row["run"]: row for row in rows}.values())
+    print(f"{len(tasks) / seconds:.1f} partidas/s, {sim_seconds / seconds:.0f}x tempo real")
+
+    print(f"\n{'classe':<8}{'política':<12}{'vida':>6}{'dano':>6}{'vel.':>6}{'partidas':>10}{'waves':>7}  sobrevivência por wave")
+    for (class_id, policy, health, damage, speed), runs, mean_waves, survival in summarize(rows):
+        waves = " ".join(f"{wave}:{fraction:.0%}" for wave, fraction in survival.items())
+        print(f"{class_id:<8}{policy:<12}{health:>6.2f}{damage:>6.2f}{speed:>6.2f}{runs:>10}{mean_waves:>7.1f}  {waves}")
+
+if __name__ == "__main__":
+    main()